@@ -8,7 +8,7 @@ class GraphDataHandler:
     ):
         self._dependency_container = dependency_container
 
-    def _get_node_name(self, dependency_id: str):
+    def _get_node_name(self, dependency_id: tuple[int, ...]):
         tokens = self._dependency_container._token_store.get_tokens(dependency_id)
 
         token_names: list[str] = []
@@ -20,12 +20,12 @@ class GraphDataHandler:
 
         return ":".join(token_names)
 
-    def _get_node_type(self, dependency_id: str):
+    def _get_node_type(self, dependency_id: tuple[int, ...]):
         dependency_registry = self._dependency_container._dependency_store._dependencies.get(dependency_id)
 
         return str(dependency_registry.lifecycle.value).upper()
 
-    def _get_node(self, dependency_id: str):
+    def _get_node(self, dependency_id: tuple[int, ...]):
         return {
             "node": self._get_node_name(dependency_id),
             "type": self._get_node_type(dependency_id),
@@ -42,6 +42,10 @@ class GraphDataHandler:
                 "color": "#FF5733",
             },
             {"type": "CONTEXT", "color": "#007FE9"},
+            {"type": "LAZY_SINGLETON", "color": "#9ADB00"},
+            {"type": "POOLED", "color": "#8E44AD"},
+            {"type": "THREAD", "color": "#F1C40F"},
+            {"type": "CACHED", "color": "#16A085"},
         ]
 
     def _get_dependency_graph_data(self):
@@ -50,9 +54,12 @@ class GraphDataHandler:
         graph_and_degrees = self._dependency_container._dependency_store._initialize_graph_and_degrees()
 
         nodes: list[dict[str, str]] = []
+        node_names: dict[tuple[int, ...], str] = {}
 
         for dependency_id in dependency_ids:
-            nodes.append(self._get_node(dependency_id))
+            node = self._get_node(dependency_id)
+            node_names[dependency_id] = node["node"]
+            nodes.append(node)
 
         links: list[dict[str, str]] = []
 
@@ -60,8 +67,8 @@ class GraphDataHandler:
             for target in targets:
                 links.append(
                     {
-                        "source": self._get_node_name(source),
-                        "target": self._get_node_name(target),
+                        "source": node_names[source],
+                        "target": node_names[target],
                     }
                 )
 
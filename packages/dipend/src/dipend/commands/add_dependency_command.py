@@ -2,10 +2,15 @@ from typing import Any, Callable, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AddDependencyCommand:
     tokens: list[Any]
     lifecycle: str
     class_constructor: Optional[Callable] = None
     builder: Optional[Callable] = None
     instance: Optional[Callable] = None
+    is_async_builder: bool = False
+    builder_timeout: Optional[float] = None
+    pool_max_size: Optional[int] = None
+    pool_timeout: Optional[float] = None
+    cache_ttl: Optional[float] = None
@@ -4,6 +4,7 @@ from ..__seedwork.handler_interface import HandlerInterface
 from ..token.token_store import TokenStore
 from ..dependency.dependency_store import DependencyStore
 from ..dependency.implementation_details import ImplementationDetails
+from ..dependency.object_pool import ObjectPool
 from ..dependency.dependency_registry import DependencyRegistry
 from ..dependency.dependency_resolver import DependencyResolver
 from ..helpers.inspect_class_helper import InspectClassHelper
@@ -26,7 +27,7 @@ class AddDependencyCommandHandler(HandlerInterface[AddDependencyCommand, None]):
         self._dependency_store = dependency_store
         self._dependency_resolver = dependency_resolver
 
-    def _get_class_constructor_dependencies_ids(self, dependency_id: str, class_constructor: Callable):
+    def _get_class_constructor_dependencies_ids(self, dependency_id: tuple[int, ...], class_constructor: Callable):
         class_constructor_dependencies_tokens: list[Any] = []
         mapped_dependencies: dict[int, list[Any]] = {}
 
@@ -35,7 +36,7 @@ class AddDependencyCommandHandler(HandlerInterface[AddDependencyCommand, None]):
 
         class_constructor_dependencies_tokens = InspectClassHelper.get_constructor_dependencies(class_constructor)
 
-        class_constructor_dependencies_ids: list[str] = []
+        class_constructor_dependencies_ids: list[tuple[int, ...]] = []
 
         for index, class_constructor_dependency_token in enumerate(class_constructor_dependencies_tokens):
             if class_constructor_dependency_token == _empty:
@@ -57,7 +58,7 @@ class AddDependencyCommandHandler(HandlerInterface[AddDependencyCommand, None]):
     ) -> Any:
         dependency_id = self._token_store.retrieve_or_create_dependency_id_by_tokens(input_data.tokens)
 
-        class_constructor_dependencies_ids: list[str] = []
+        class_constructor_dependencies_ids: list[tuple[int, ...]] = []
 
         if input_data.class_constructor is not None:
             class_constructor_dependencies_ids = self._get_class_constructor_dependencies_ids(dependency_id, input_data.class_constructor)
@@ -67,8 +68,14 @@ class AddDependencyCommandHandler(HandlerInterface[AddDependencyCommand, None]):
             class_constructor_dependencies_ids,
             input_data.builder,
             input_data.instance,
+            input_data.is_async_builder,
+            input_data.builder_timeout,
+            cache_ttl=input_data.cache_ttl,
         )
 
+        if input_data.pool_max_size is not None:
+            implementation_details.pool = ObjectPool(input_data.pool_max_size, input_data.pool_timeout)
+
         registry = DependencyRegistry(
             dependency_id,
             input_data.lifecycle,
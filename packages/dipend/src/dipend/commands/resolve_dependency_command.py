@@ -2,7 +2,7 @@ from typing import Any, Optional
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolveDependencyCommand:
     tokens: list[Any]
     required: Optional[bool] = field(default=False)
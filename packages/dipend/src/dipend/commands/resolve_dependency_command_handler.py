@@ -25,3 +25,11 @@ class ResolveDependencyCommandHandler(HandlerInterface[ResolveDependencyCommand,
         dependency_instance = self._dependency_resolver.resolve(dependency_id)
 
         return dependency_instance
+
+    async def handle_async(
+        self,
+        input_data: ResolveDependencyCommand,
+    ) -> Any:
+        dependency_id = self._token_store.retrieve_or_create_dependency_id_by_tokens(input_data.tokens)
+
+        return await self._dependency_resolver.resolve_async(dependency_id)
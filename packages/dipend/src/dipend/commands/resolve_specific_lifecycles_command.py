@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from typing import Optional
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolveSpecificLifecyclesCommand:
     lifecycles: list[str]
+    max_workers: Optional[int] = field(default=None)
+    use_process_pool: Optional[bool] = field(default=False)
@@ -1,7 +1,29 @@
+import asyncio
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from ..__seedwork.handler_interface import HandlerInterface
 from .resolve_specific_lifecycles_command import ResolveSpecificLifecyclesCommand
 from ..dependency.dependency_store import DependencyStore
 from ..dependency.dependency_resolver import DependencyResolver
+from ..dependency.dependency_registry import DependencyRegistry
+from ..exceptions.can_not_construct_dependency_exception import (
+    CanNotConstructDependencyException,
+)
+from ..exceptions.async_builder_not_awaited_exception import (
+    AsyncBuilderNotAwaitedException,
+)
+
+
+def _construct_dependency(class_constructor: Optional[Callable], builder: Optional[Callable], class_constructor_dependencies: list[Any]) -> tuple[Any, int]:
+    start = perf_counter_ns()
+
+    if builder is not None:
+        instance = builder()
+    else:
+        instance = class_constructor(*class_constructor_dependencies)
+
+    return instance, perf_counter_ns() - start
 
 
 class ResolveSpecificLifecyclesCommandHandler(HandlerInterface[ResolveSpecificLifecyclesCommand, None]):
@@ -13,11 +35,120 @@ class ResolveSpecificLifecyclesCommandHandler(HandlerInterface[ResolveSpecificLi
         self._dependency_store = dependency_store
         self._dependency_resolver = dependency_resolver
 
-    def handle(self, input_data: ResolveSpecificLifecyclesCommand):
+    def _resolve_sequentially(self, lifecycles: list[str]):
         sorted_dependencies = self._dependency_store.get_sorted_dependencies_ids()
 
         for dependency_id in sorted_dependencies:
             dependency_registry = self._dependency_store.get_dependency(dependency_id)
 
-            if dependency_registry.lifecycle in input_data.lifecycles:
+            if dependency_registry.lifecycle in lifecycles:
                 self._dependency_resolver.resolve(dependency_id)
+
+    def _submit_resolve(self, executor: Executor, dependency_registry: DependencyRegistry) -> Future:
+        return executor.submit(self._dependency_resolver.resolve, dependency_registry.dependency_id)
+
+    def _submit_construct(self, executor: Executor, dependency_registry: DependencyRegistry) -> Optional[Future]:
+        implementation_details = dependency_registry.implementation_details
+
+        if implementation_details.instance is not None:
+            return None
+
+        if implementation_details.is_async_builder is True:
+            raise AsyncBuilderNotAwaitedException([dependency_registry.dependency_id])
+
+        if implementation_details.class_constructor is None and implementation_details.builder is None:
+            raise CanNotConstructDependencyException([dependency_registry.dependency_id])
+
+        class_constructor_dependencies = self._dependency_resolver.resolve_class_constructor_dependencies(dependency_registry)
+
+        return executor.submit(
+            _construct_dependency,
+            implementation_details.class_constructor,
+            implementation_details.builder,
+            class_constructor_dependencies,
+        )
+
+    def _resolve_by_level(self, input_data: ResolveSpecificLifecyclesCommand):
+        if input_data.use_process_pool:
+            executor = ProcessPoolExecutor(max_workers=input_data.max_workers)
+            submit = self._submit_construct
+        else:
+            executor = ThreadPoolExecutor(max_workers=input_data.max_workers)
+            submit = self._submit_resolve
+
+        with executor:
+            for level in self._dependency_store.get_dependencies_ids_by_level():
+                futures: list[tuple[DependencyRegistry, Future]] = []
+
+                for dependency_id in level:
+                    dependency_registry = self._dependency_store.get_dependency(dependency_id)
+
+                    if dependency_registry.lifecycle not in input_data.lifecycles:
+                        continue
+
+                    future = submit(executor, dependency_registry)
+
+                    if future is not None:
+                        futures.append((dependency_registry, future))
+
+                for dependency_registry, future in futures:
+                    result = future.result()
+
+                    # Instances built in another process only exist here once published through their lifecycle strategy.
+                    if input_data.use_process_pool:
+                        instance, construct_elapsed_ns = result
+                        self._dependency_resolver.resolve_built(dependency_registry, instance, construct_elapsed_ns)
+
+    def handle(self, input_data: ResolveSpecificLifecyclesCommand):
+        if input_data.max_workers is None and not input_data.use_process_pool:
+            self._resolve_sequentially(input_data.lifecycles)
+            return
+
+        self._resolve_by_level(input_data)
+
+    def _is_async_subgraph(self, dependency_registry: DependencyRegistry, lifecycles: list[str], async_subgraphs_ids: set[tuple[int, ...]]) -> bool:
+        implementation_details = dependency_registry.implementation_details
+
+        # Async builders of the built lifecycles are constructed before their dependents' level.
+        if implementation_details.is_async_builder is True:
+            return implementation_details.instance is None and dependency_registry.lifecycle not in lifecycles
+
+        return any(dependency_id in async_subgraphs_ids for dependency_id in implementation_details.class_constructor_dependencies_ids)
+
+    async def handle_async(self, input_data: ResolveSpecificLifecyclesCommand):
+        # Dependencies with an async builder that is not built here anywhere in their subgraph, such
+        # as an async transient, are resolved asynchronously.
+        async_subgraphs_ids: set[tuple[int, ...]] = set()
+
+        for level in self._dependency_store.get_dependencies_ids_by_level():
+            dependencies_registries = [self._dependency_store.get_dependency(dependency_id) for dependency_id in level]
+            async_builders_registries: list[DependencyRegistry] = []
+
+            for dependency_registry in dependencies_registries:
+                if self._is_async_subgraph(dependency_registry, input_data.lifecycles, async_subgraphs_ids) is True:
+                    async_subgraphs_ids.add(dependency_registry.dependency_id)
+
+                if dependency_registry.lifecycle not in input_data.lifecycles:
+                    continue
+
+                implementation_details = dependency_registry.implementation_details
+
+                if implementation_details.is_async_builder is True and implementation_details.instance is None:
+                    async_builders_registries.append(dependency_registry)
+
+            built_instances = await asyncio.gather(
+                *[self._dependency_resolver.build_async_builder(dependency_registry) for dependency_registry in async_builders_registries]
+            )
+
+            # Built instances are handed to the strategies from here, so context lifecycles land in the caller's context.
+            for dependency_registry, built_instance in zip(async_builders_registries, built_instances):
+                self._dependency_resolver.resolve_built(dependency_registry, built_instance)
+
+            for dependency_registry in dependencies_registries:
+                if dependency_registry.lifecycle not in input_data.lifecycles or dependency_registry.implementation_details.is_async_builder is True:
+                    continue
+
+                if dependency_registry.dependency_id in async_subgraphs_ids:
+                    await self._dependency_resolver.resolve_async(dependency_registry.dependency_id)
+                else:
+                    self._dependency_resolver.resolve(dependency_registry.dependency_id)
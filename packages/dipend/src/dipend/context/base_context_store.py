@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from contextvars import Token
+
+
+class BaseContextStore(ABC):
+    @abstractmethod
+    def set(self, var_name: Any, value: Any):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, var_name: Any):
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_scope_open(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_scope_values(self) -> dict[Any, Any]:
+        """
+        Returns the values set in the current context since the innermost scope was opened.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_scope_state(self) -> Optional[dict[Any, Any]]:
+        """
+        Returns a dict kept for the innermost scope open in the current context, or None outside any
+        scope. Unlike values, it is shared by the tasks started within the scope and never inherited
+        by nested scopes, so it can track what the scope itself owns.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_scope(self) -> Token:
+        raise NotImplementedError
+
+    @abstractmethod
+    def close_scope(self, scope_token: Token):
+        raise NotImplementedError
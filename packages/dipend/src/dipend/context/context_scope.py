@@ -0,0 +1,45 @@
+from typing import Any, Optional, TYPE_CHECKING
+from contextvars import Token
+from .base_context_store import BaseContextStore
+
+if TYPE_CHECKING:
+    from ..dependency.dependency_disposer import DependencyDisposer
+
+
+class ContextScope:
+    def __init__(self, context_store: BaseContextStore, value: Any = None, dependency_disposer: Optional["DependencyDisposer"] = None):
+        self._context_store = context_store
+        self._value = value
+        self._dependency_disposer = dependency_disposer
+        self._scope_token: Optional[Token] = None
+
+    def __enter__(self):
+        if self._scope_token is not None:
+            raise RuntimeError("Context scope already entered.")
+
+        self._scope_token = self._context_store.open_scope()
+
+        return self._value
+
+    def _close(self):
+        scope_token = self._scope_token
+        self._scope_token = None
+
+        self._context_store.close_scope(scope_token)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._dependency_disposer is not None:
+                self._dependency_disposer.dispose_context()
+        finally:
+            self._close()
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._dependency_disposer is not None:
+                await self._dependency_disposer.adispose_context()
+        finally:
+            self._close()
@@ -1,23 +1,52 @@
-from typing import Any
+import asyncio
+import threading
+from typing import Any, Optional
 from contextvars import ContextVar, Token
 from ..__seedwork.dictionary import Dictionary
+from .base_context_store import BaseContextStore
 
 
-class ContextStore:
+class _Scope:
+    __slots__ = ("context_tokens", "state")
+
+    def __init__(self):
+        # The first token of every var in every thread or task setting it within the scope.
+        self.context_tokens: dict[tuple[Any, int, Optional[asyncio.Task]], Token] = {}
+        self.state: dict[Any, Any] = {}
+
+
+class ContextStore(BaseContextStore):
     def __init__(self):
-        self._context_vars = Dictionary[str, ContextVar]()
+        self._context_vars = Dictionary[Any, ContextVar]()
+        self._scope = ContextVar[Optional[_Scope]]("dipend_context_scope", default=None)
+
+    @staticmethod
+    def _get_context_tokens_key(var_name: Any) -> tuple[Any, int, Optional[asyncio.Task]]:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        return var_name, threading.get_ident(), task
 
-    def set(self, var_name: str, value: Any):
+    def set(self, var_name: Any, value: Any):
         context_var = self._context_vars.get(var_name)
 
         if context_var is None:
-            self._context_vars.set(var_name, ContextVar(var_name, default=None))
+            self._context_vars.set(var_name, ContextVar(str(var_name), default=None))
 
             context_var = self._context_vars.get(var_name)
 
-        return context_var.set(value)
+        context_token = context_var.set(value)
 
-    def reset(self, var_name: str, context_token: Token):
+        scope = self._scope.get()
+
+        if scope is not None:
+            scope.context_tokens.setdefault(self._get_context_tokens_key(var_name), context_token)
+
+        return context_token
+
+    def reset(self, var_name: Any, context_token: Token):
         context_var = self._context_vars.get(var_name)
 
         if context_var is None:
@@ -25,10 +54,56 @@ class ContextStore:
 
         context_var.reset(context_token)
 
-    def get(self, var_name: str):
+    def get(self, var_name: Any):
         context_var = self._context_vars.get(var_name)
 
         if context_var is None:
             return None
 
         return context_var.get()
+
+    def is_scope_open(self) -> bool:
+        return self._scope.get() is not None
+
+    def get_scope_values(self) -> dict[Any, Any]:
+        scope = self._scope.get()
+        scope_values: dict[Any, Any] = {}
+
+        if scope is None:
+            return scope_values
+
+        for (var_name, _, _), context_token in scope.context_tokens.items():
+            if var_name in scope_values:
+                continue
+
+            value = self.get(var_name)
+
+            # Values only set from a task running in a copied context are not visible here.
+            if value is not None and value is not context_token.old_value:
+                scope_values[var_name] = value
+
+        return scope_values
+
+    def get_scope_state(self) -> Optional[dict[Any, Any]]:
+        scope = self._scope.get()
+
+        if scope is None:
+            return None
+
+        return scope.state
+
+    def open_scope(self) -> Token:
+        return self._scope.set(_Scope())
+
+    def close_scope(self, scope_token: Token):
+        scope = self._scope.get()
+        context_tokens = {} if scope is None else scope.context_tokens
+
+        for (var_name, _, _), context_token in reversed(context_tokens.items()):
+            try:
+                self.reset(var_name, context_token)
+            except ValueError:
+                # Set from a task running in a copied context, the value already went away with it.
+                continue
+
+        self._scope.reset(scope_token)
@@ -0,0 +1,89 @@
+from typing import Any, Optional
+from contextvars import ContextVar, Token
+from ..__seedwork.dictionary import Dictionary
+from .base_context_store import BaseContextStore
+
+
+class _Scope:
+    __slots__ = ("values", "parent", "state")
+
+    def __init__(self, values: dict[Any, Any], parent: Optional["_Scope"]):
+        self.values = values
+        self.parent = parent
+        self.state: dict[Any, Any] = {}
+
+
+class ScopedContextStore(BaseContextStore):
+    """
+    Keeps every per-context value of a scope in one dict behind a single `ContextVar`, so opening
+    and closing a scope is one set and one reset however many values it holds.
+
+    Values set inside an open scope are shared by the tasks started within it. Outside any scope,
+    every value has its own `ContextVar`, so copied contexts never see each other's values and a
+    write does not copy the others.
+    """
+
+    def __init__(self):
+        self._scope = ContextVar[Optional[_Scope]]("dipend_context_scope", default=None)
+        self._context_vars = Dictionary[Any, ContextVar]()
+
+    def _set_outside_scope(self, var_name: Any, value: Any) -> Token:
+        context_var = self._context_vars.get(var_name)
+
+        if context_var is None:
+            context_var = ContextVar(str(var_name), default=None)
+            self._context_vars.set(var_name, context_var)
+
+        return context_var.set(value)
+
+    def set(self, var_name: Any, value: Any):
+        scope = self._scope.get()
+
+        if scope is None:
+            return self._set_outside_scope(var_name, value)
+
+        scope.values[var_name] = value
+        return None
+
+    def get(self, var_name: Any):
+        scope = self._scope.get()
+
+        while scope is not None:
+            value = scope.values.get(var_name)
+
+            if value is not None:
+                return value
+
+            scope = scope.parent
+
+        context_var = self._context_vars.get(var_name)
+
+        if context_var is None:
+            return None
+
+        return context_var.get()
+
+    def is_scope_open(self) -> bool:
+        return self._scope.get() is not None
+
+    def get_scope_values(self) -> dict[Any, Any]:
+        scope = self._scope.get()
+
+        if scope is None:
+            return {}
+
+        return dict(scope.values)
+
+    def get_scope_state(self) -> Optional[dict[Any, Any]]:
+        scope = self._scope.get()
+
+        if scope is None:
+            return None
+
+        return scope.state
+
+    def open_scope(self) -> Token:
+        return self._scope.set(_Scope({}, self._scope.get()))
+
+    def close_scope(self, scope_token: Token):
+        self._scope.reset(scope_token)
@@ -0,0 +1,176 @@
+import asyncio
+from typing import Any, Optional
+from .dependency_store import DependencyStore
+from .lazy_proxy import LazyProxy
+from .strategies.resolve_pooled_lifecycle_strategy import ResolvePooledLifecycleStrategy
+from ..context.base_context_store import BaseContextStore
+from ..enums.lifecycle_enum import LifecycleEnum
+from ..helpers.dispose_helper import DisposeHelper
+
+
+SINGLETON_LIFECYCLES = [LifecycleEnum.SINGLETON, LifecycleEnum.LAZY_SINGLETON]
+
+
+class DependencyDisposer:
+    """
+    Tears down the instances the container constructed, dependents before their dependencies.
+
+    An instance is disposed through its `dispose`/`adispose` or `close`/`aclose` methods, or by
+    exiting it as a context manager. Instances given to the container are owned by the caller
+    and never disposed. Pooled instances go back to their pool when their scope ends, and idle
+    ones are disposed along with the singletons.
+    """
+
+    def __init__(self, dependency_store: DependencyStore, context_store: BaseContextStore):
+        self._dependency_store = dependency_store
+        self._context_store = context_store
+
+    def _get_disposable_instance(self, instance: Any) -> Optional[Any]:
+        # type() skips the proxy's __class__ property, so a lazy singleton that was never used is not built here.
+        if type(instance) is LazyProxy:
+            if instance.is_lazy_target_built() is False:
+                return None
+
+            return instance._get_lazy_target()
+
+        return instance
+
+    def _collect_singletons(self) -> dict[tuple[int, ...], list[Any]]:
+        singletons: dict[tuple[int, ...], list[Any]] = {}
+
+        for dependency_id in self._dependency_store.get_sorted_dependencies_ids():
+            dependency_registry = self._dependency_store.get_dependency(dependency_id)
+            implementation_details = dependency_registry.implementation_details
+
+            if dependency_registry.lifecycle == LifecycleEnum.POOLED and implementation_details.pool is not None:
+                singletons[dependency_id] = implementation_details.pool.drain()
+                continue
+
+            if dependency_registry.lifecycle not in SINGLETON_LIFECYCLES or implementation_details.instance is None:
+                continue
+
+            if implementation_details.class_constructor is None and implementation_details.builder is None:
+                continue
+
+            singletons[dependency_id] = [implementation_details.instance]
+            implementation_details.instance = None
+
+        return singletons
+
+    def _collect_scope_instances(self, lifecycle: LifecycleEnum) -> dict[tuple[int, ...], list[Any]]:
+        scope_values = self._context_store.get_scope_values()
+        scope_instances: dict[tuple[int, ...], list[Any]] = {}
+
+        for dependency_id, instance in scope_values.items():
+            dependency_registry = self._dependency_store.find_dependency(dependency_id)
+
+            if dependency_registry is not None and dependency_registry.lifecycle == lifecycle:
+                scope_instances[dependency_id] = [instance]
+
+        return scope_instances
+
+    def _release_pooled_instances(self):
+        scope_state = self._context_store.get_scope_state()
+
+        if scope_state is None:
+            return
+
+        checkouts = ResolvePooledLifecycleStrategy.get_checkouts(scope_state)
+
+        for (dependency_id, *_), instance in checkouts.items():
+            dependency_registry = self._dependency_store.find_dependency(dependency_id)
+
+            if dependency_registry is not None and dependency_registry.implementation_details.pool is not None:
+                dependency_registry.implementation_details.pool.release(instance)
+
+        checkouts.clear()
+
+    def _get_disposable_instances(self, instances: dict[tuple[int, ...], list[Any]], dependency_id: tuple[int, ...], disposed_instances_ids: set[int]) -> list[Any]:
+        disposable_instances: list[Any] = []
+
+        for instance in instances.get(dependency_id, []):
+            instance = self._get_disposable_instance(instance)
+
+            if instance is not None and id(instance) not in disposed_instances_ids:
+                disposed_instances_ids.add(id(instance))
+                disposable_instances.append(instance)
+
+        return disposable_instances
+
+    def _dispose_instances(self, instances: dict[tuple[int, ...], list[Any]]):
+        # Scopes exit on every request, so only the dependencies with instances are ordered.
+        if len(instances) == 0:
+            return
+
+        errors: list[Exception] = []
+        disposed_instances_ids: set[int] = set()
+
+        for dependency_id in reversed(self._dependency_store.sort_dependencies_ids(instances.keys())):
+            for instance in self._get_disposable_instances(instances, dependency_id, disposed_instances_ids):
+                disposer = DisposeHelper.get_sync_disposer(instance)
+
+                if disposer is None:
+                    continue
+
+                try:
+                    disposer()
+                except Exception as err:
+                    errors.append(err)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    async def _adispose_instance(self, instance: Any):
+        async_disposer = DisposeHelper.get_async_disposer(instance)
+
+        if async_disposer is not None:
+            await async_disposer()
+            return
+
+        disposer = DisposeHelper.get_sync_disposer(instance)
+
+        if disposer is not None:
+            disposer()
+
+    async def _adispose_instances(self, instances: dict[tuple[int, ...], list[Any]]):
+        if len(instances) == 0:
+            return
+
+        errors: list[BaseException] = []
+        disposed_instances_ids: set[int] = set()
+        dependencies_levels = self._dependency_store.get_dependencies_levels()
+        levels: dict[int, list[tuple[int, ...]]] = {}
+
+        for dependency_id in instances.keys():
+            levels.setdefault(dependencies_levels.get(dependency_id, 0), []).append(dependency_id)
+
+        for _, level in sorted(levels.items(), reverse=True):
+            level_instances: list[Any] = []
+
+            for dependency_id in level:
+                level_instances.extend(self._get_disposable_instances(instances, dependency_id, disposed_instances_ids))
+
+            results = await asyncio.gather(*[self._adispose_instance(instance) for instance in level_instances], return_exceptions=True)
+
+            errors.extend(result for result in results if isinstance(result, BaseException))
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    def dispose_singletons(self):
+        self._dispose_instances(self._collect_singletons())
+
+    async def adispose_singletons(self):
+        await self._adispose_instances(self._collect_singletons())
+
+    def dispose_context(self):
+        try:
+            self._dispose_instances(self._collect_scope_instances(LifecycleEnum.CONTEXT))
+        finally:
+            self._release_pooled_instances()
+
+    async def adispose_context(self):
+        try:
+            await self._adispose_instances(self._collect_scope_instances(LifecycleEnum.CONTEXT))
+        finally:
+            self._release_pooled_instances()
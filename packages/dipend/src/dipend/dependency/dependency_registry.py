@@ -2,8 +2,8 @@ from dataclasses import dataclass
 from .implementation_details import ImplementationDetails
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DependencyRegistry:
-    dependency_id: str
+    dependency_id: tuple[int, ...]
     lifecycle: str
     implementation_details: ImplementationDetails
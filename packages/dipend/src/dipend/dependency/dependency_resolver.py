@@ -1,7 +1,12 @@
-from typing import Any
+import asyncio
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from functools import partial
 from ..__seedwork.dictionary import Dictionary
 from ..enums.lifecycle_enum import LifecycleEnum
+from ..exceptions.async_builder_timeout_exception import AsyncBuilderTimeoutException
+from ..exceptions.cyclic_dependencies_exception import CyclicDependenciesException
 from ..exceptions.invalid_lifecycle_exception import InvalidLifecycleException
+from ..exceptions.missing_dependency_exception import MissingDependencyException
 from .strategies.resolve_lifecycle_strategy_input import (
     ResolveLifecycleStrategyInput,
 )
@@ -17,32 +22,74 @@ from .strategies.resolve_transient_lifecycle_strategy import (
 from .strategies.resolve_context_lifecycle_strategy import (
     ResolveContextLifecycleStrategy,
 )
+from .strategies.resolve_lazy_singleton_lifecycle_strategy import (
+    ResolveLazySingletonLifecycleStrategy,
+)
+from .strategies.resolve_pooled_lifecycle_strategy import (
+    ResolvePooledLifecycleStrategy,
+)
+from .strategies.resolve_thread_lifecycle_strategy import (
+    ResolveThreadLifecycleStrategy,
+)
+from .strategies.resolve_cached_lifecycle_strategy import (
+    ResolveCachedLifecycleStrategy,
+)
+from ..context.base_context_store import BaseContextStore
 from ..dependency.dependency_store import DependencyRegistry
 from ..dependency.dependency_store import DependencyStore
 
+if TYPE_CHECKING:
+    from ..observers.observer_dispatcher import ObserverDispatcher
+
 
 class DependencyResolver:
-    def __init__(self, dependency_store: DependencyStore):
+    # Compiled factories call their constructor dependencies' factories directly, so past this
+    # depth plans fall back to the iterative resolve to stay clear of the recursion limit.
+    MAX_COMPILED_DEPTH = 128
+
+    def __init__(self, dependency_store: DependencyStore, context_store: Optional[BaseContextStore] = None):
         self._strategies = Dictionary[str, BaseResolveLifecycleStrategy]()
         self._dependency_store = dependency_store
+        self._context_store = context_store
+        self._observer_dispatcher: Optional["ObserverDispatcher"] = None
+        # Async builds in flight of dependencies sharing one instance, by dependency id and event loop.
+        self._async_builds: dict[tuple[tuple[int, ...], asyncio.AbstractEventLoop], asyncio.Task] = {}
 
     def set_default_resolve_lifecycle_strategies(self):
         self._strategies.set(LifecycleEnum.SINGLETON, ResolveSingletonLifecycleStrategy())
         self._strategies.set(LifecycleEnum.TRANSIENT, ResolveTransientLifecycleStrategy())
-        self._strategies.set(LifecycleEnum.CONTEXT, ResolveContextLifecycleStrategy())
+        self._strategies.set(LifecycleEnum.CONTEXT, ResolveContextLifecycleStrategy(self._context_store))
+        self._strategies.set(LifecycleEnum.LAZY_SINGLETON, ResolveLazySingletonLifecycleStrategy(self))
+        self._strategies.set(LifecycleEnum.POOLED, ResolvePooledLifecycleStrategy(self._context_store))
+        self._strategies.set(LifecycleEnum.THREAD, ResolveThreadLifecycleStrategy())
+        self._strategies.set(LifecycleEnum.CACHED, ResolveCachedLifecycleStrategy())
+
+        if self._observer_dispatcher is not None:
+            self.set_observer_dispatcher(self._observer_dispatcher)
 
     def add_resolve_lifecycle_strategy(
         self,
         lifecycle: str,
         strategy: BaseResolveLifecycleStrategy,
     ):
+        if self._observer_dispatcher is not None:
+            strategy.set_observer_dispatcher(self._observer_dispatcher)
+
         self._strategies.set(lifecycle, strategy)
 
-    def _use_lifecycle_strategy(
-        self,
-        dependency_registry: DependencyRegistry,
-        resolved_class_constructor_dependencies: list[Any],
-    ):
+    def set_observer_dispatcher(self, observer_dispatcher: Optional["ObserverDispatcher"]):
+        self._observer_dispatcher = observer_dispatcher
+
+        for strategy in self._strategies.values():
+            strategy.set_observer_dispatcher(observer_dispatcher)
+
+    def invalidate_cached(self, dependency_id: Optional[tuple[int, ...]] = None):
+        strategy = self._strategies.get(LifecycleEnum.CACHED)
+
+        if isinstance(strategy, ResolveCachedLifecycleStrategy):
+            strategy.invalidate(dependency_id)
+
+    def _get_lifecycle_strategy(self, dependency_registry: DependencyRegistry) -> BaseResolveLifecycleStrategy:
         strategy = self._strategies.get(dependency_registry.lifecycle)
 
         if strategy is None:
@@ -51,28 +98,368 @@ class DependencyResolver:
                 getattr(dependency_registry.lifecycle, "value", None) or dependency_registry.lifecycle,
             )
 
-        strategy_input = ResolveLifecycleStrategyInput(dependency_registry, resolved_class_constructor_dependencies)
+        return strategy
+
+    def _use_lifecycle_strategy(
+        self,
+        dependency_registry: DependencyRegistry,
+        resolved_class_constructor_dependencies: list[Any],
+        built_instance: Optional[Any] = None,
+    ):
+        strategy = self._get_lifecycle_strategy(dependency_registry)
+        strategy_input = ResolveLifecycleStrategyInput(dependency_registry, resolved_class_constructor_dependencies, built_instance)
 
         return strategy.execute(strategy_input)
 
+    async def _use_lifecycle_strategy_async(
+        self,
+        dependency_registry: DependencyRegistry,
+        resolved_class_constructor_dependencies: list[Any],
+        built_instance: Optional[Any] = None,
+    ):
+        strategy = self._get_lifecycle_strategy(dependency_registry)
+        strategy_input = ResolveLifecycleStrategyInput(dependency_registry, resolved_class_constructor_dependencies, built_instance)
+
+        return await strategy.execute_async(strategy_input)
+
+    def _get_resolving_class_constructor_dependencies_ids(self, dependency_registry: DependencyRegistry) -> list[tuple[int, ...]]:
+        strategy = self._strategies.get(dependency_registry.lifecycle)
+
+        if strategy is not None and strategy.resolves_class_constructor_dependencies is False:
+            return []
+
+        return dependency_registry.implementation_details.class_constructor_dependencies_ids
+
     def _resolved_instance(self, dependency_registry: DependencyRegistry):
         return dependency_registry.implementation_details.instance
 
-    def resolve(self, dependency_id: str):
+    def resolve(self, dependency_id: tuple[int, ...]):
+        if self._observer_dispatcher is None:
+            return self._resolve(dependency_id)
+
+        # Only the requested dependency is reported, its constructor dependencies resolve within the same walk.
+        dependency_registry = self._dependency_store.get_dependency(dependency_id)
+
+        return self._observer_dispatcher.observe_resolve(dependency_registry, lambda: self._resolve(dependency_id))
+
+    def _resolve(self, dependency_id: tuple[int, ...]):
         dependency_registry = self._dependency_store.get_dependency(dependency_id)
         resolved_instance = self._resolved_instance(dependency_registry)
+        strategy = self._strategies.get(dependency_registry.lifecycle)
+
+        # The requested dependency ends the walk like its constructor dependencies when a strategy keeps it.
+        if resolved_instance is None and strategy is not None and strategy.keeps_resolved_instances is True:
+            resolved_instance = strategy.find_resolved_instance(dependency_registry)
+
+        if resolved_instance is not None:
+            return resolved_instance
+
+        # Post-order walk over an explicit stack, so deep graphs never reach the recursion limit.
+        # Argument buffers are kept per depth and reused by the next frame at the same depth,
+        # strategies consume them while executing and must not keep a reference.
+        get_dependency = self._dependency_store.get_dependency
+        get_strategy = self._strategies.get
+        use_lifecycle_strategy = self._use_lifecycle_strategy
+        registries = [dependency_registry]
+        children = [iter(self._get_resolving_class_constructor_dependencies_ids(dependency_registry))]
+        buffers: list[list[Any]] = [[]]
+        resolving_ids = {dependency_id}
+        depth = 0
+
+        while True:
+            buffer = buffers[depth]
+
+            for constructor_dependency_id in children[depth]:
+                constructor_dependency_registry = get_dependency(constructor_dependency_id)
+                resolved_instance = constructor_dependency_registry.implementation_details.instance
+                strategy = get_strategy(constructor_dependency_registry.lifecycle)
+
+                # Instances kept by a strategy, such as per context ones, end the walk so shared subgraphs are visited once.
+                # Only those strategies are asked, the others never hold more than the registry instance.
+                if resolved_instance is None and strategy is not None and strategy.keeps_resolved_instances is True:
+                    resolved_instance = strategy.find_resolved_instance(constructor_dependency_registry)
+
+                if resolved_instance is not None:
+                    buffer.append(resolved_instance)
+                    continue
+
+                if strategy is not None and strategy.resolves_class_constructor_dependencies is False:
+                    class_constructor_dependencies_ids = []
+                else:
+                    class_constructor_dependencies_ids = constructor_dependency_registry.implementation_details.class_constructor_dependencies_ids
+
+                if len(class_constructor_dependencies_ids) == 0:
+                    buffer.append(use_lifecycle_strategy(constructor_dependency_registry, []))
+                    continue
+
+                if constructor_dependency_id in resolving_ids:
+                    raise CyclicDependenciesException(
+                        [registry.dependency_id for registry in registries[self._find_registry_depth(registries, constructor_dependency_id) :]]
+                    )
+
+                registries.append(constructor_dependency_registry)
+                children.append(iter(class_constructor_dependencies_ids))
+                resolving_ids.add(constructor_dependency_id)
+                depth += 1
+
+                if len(buffers) > depth:
+                    buffers[depth].clear()
+                else:
+                    buffers.append([])
+
+                break
+            else:
+                registry = registries.pop()
+                children.pop()
+                resolving_ids.discard(registry.dependency_id)
+
+                resolved_instance = use_lifecycle_strategy(registry, buffer)
+
+                if depth == 0:
+                    return resolved_instance
+
+                depth -= 1
+                buffers[depth].append(resolved_instance)
+
+    def resolve_class_constructor_dependencies(self, dependency_registry: DependencyRegistry) -> list[Any]:
+        return [self.resolve(constructor_dependency_id) for constructor_dependency_id in dependency_registry.implementation_details.class_constructor_dependencies_ids]
+
+    async def construct_async_builder(self, dependency_registry: DependencyRegistry) -> Any:
+        if self._observer_dispatcher is None:
+            return await self._construct_async_builder(dependency_registry)
+
+        return await self._observer_dispatcher.observe_construct_async(dependency_registry, lambda: self._construct_async_builder(dependency_registry))
+
+    async def _construct_async_builder(self, dependency_registry: DependencyRegistry) -> Any:
+        implementation_details = dependency_registry.implementation_details
+
+        try:
+            return await asyncio.wait_for(implementation_details.builder(), implementation_details.builder_timeout)
+        except TimeoutError:
+            raise AsyncBuilderTimeoutException([dependency_registry.dependency_id])
+
+    def resolve_built(self, dependency_registry: DependencyRegistry, built_instance: Any, construct_elapsed_ns: Optional[int] = None):
+        """
+        Publishes an instance built outside the resolver through its lifecycle strategy. The construction
+        time of an instance built where observers can not see it, such as in another process, is reported.
+        """
+        if self._observer_dispatcher is None:
+            return self._use_lifecycle_strategy(dependency_registry, [], built_instance)
+
+        observer_dispatcher = self._observer_dispatcher
+
+        def publish_built():
+            if construct_elapsed_ns is not None:
+                observer_dispatcher.report_construct(dependency_registry, construct_elapsed_ns)
+
+            return self._use_lifecycle_strategy(dependency_registry, [], built_instance)
+
+        return observer_dispatcher.observe_resolve(dependency_registry, publish_built)
+
+    def _find_resolved_instance(self, dependency_registry: DependencyRegistry) -> Optional[Any]:
+        strategy = self._strategies.get(dependency_registry.lifecycle)
+
+        if strategy is None:
+            return dependency_registry.implementation_details.instance
+
+        return strategy.find_resolved_instance(dependency_registry)
+
+    async def _build_shared_async_builder(self, dependency_registry: DependencyRegistry) -> Any:
+        built_instance = await self.construct_async_builder(dependency_registry)
+
+        # Published from the build itself, so the instance is kept even when every caller gave up on it.
+        return await self._use_lifecycle_strategy_async(dependency_registry, [], built_instance)
+
+    def _start_async_builder(self, dependency_registry: DependencyRegistry) -> asyncio.Future:
+        strategy = self._strategies.get(dependency_registry.lifecycle)
+
+        if strategy is None or strategy.shares_async_builds is False:
+            return asyncio.ensure_future(self.construct_async_builder(dependency_registry))
+
+        async_build_key = (dependency_registry.dependency_id, asyncio.get_running_loop())
+        async_build = self._async_builds.get(async_build_key)
+
+        if async_build is None:
+            async_build = asyncio.ensure_future(self._build_shared_async_builder(dependency_registry))
+            self._async_builds[async_build_key] = async_build
+            async_build.add_done_callback(lambda _: self._async_builds.pop(async_build_key, None))
+
+        # Callers cancelling their wait leave the build running for the others.
+        return asyncio.shield(async_build)
+
+    async def build_async_builder(self, dependency_registry: DependencyRegistry) -> Any:
+        """
+        Awaits the async builder of a dependency. Concurrent calls for a dependency sharing one
+        instance, such as a singleton, await the same build.
+        """
+        return await self._start_async_builder(dependency_registry)
+
+    def _start_async_builders(self, dependency_registry: DependencyRegistry) -> dict[tuple[int, ...], asyncio.Future]:
+        started_builders: dict[tuple[int, ...], asyncio.Future] = {}
+        visited_ids = {dependency_registry.dependency_id}
+        registries = [dependency_registry]
+
+        while len(registries) > 0:
+            registry = registries.pop()
+
+            if self._find_resolved_instance(registry) is not None:
+                continue
+
+            if registry.implementation_details.is_async_builder is True:
+                started_builders[registry.dependency_id] = self._start_async_builder(registry)
+                continue
+
+            for constructor_dependency_id in self._get_resolving_class_constructor_dependencies_ids(registry):
+                if constructor_dependency_id not in visited_ids:
+                    visited_ids.add(constructor_dependency_id)
+                    registries.append(self._dependency_store.get_dependency(constructor_dependency_id))
+
+        return started_builders
+
+    async def _resolve_async_builder(self, dependency_registry: DependencyRegistry, started_builders: dict[tuple[int, ...], asyncio.Future]):
+        started_builder = started_builders.pop(dependency_registry.dependency_id, None)
+
+        if started_builder is None:
+            started_builder = self._start_async_builder(dependency_registry)
+
+        return await self._use_lifecycle_strategy_async(dependency_registry, [], await started_builder)
+
+    async def _resolve_with_started_builders(self, dependency_registry: DependencyRegistry, started_builders: dict[tuple[int, ...], asyncio.Future]):
+        if dependency_registry.implementation_details.is_async_builder is True:
+            return await self._resolve_async_builder(dependency_registry, started_builders)
+
+        registries = [dependency_registry]
+        children = [iter(self._get_resolving_class_constructor_dependencies_ids(dependency_registry))]
+        buffers: list[list[Any]] = [[]]
+        resolving_ids = {dependency_registry.dependency_id}
+
+        while True:
+            depth = len(registries) - 1
+
+            for constructor_dependency_id in children[depth]:
+                constructor_dependency_registry = self._dependency_store.get_dependency(constructor_dependency_id)
+                resolved_instance = self._find_resolved_instance(constructor_dependency_registry)
+
+                if resolved_instance is not None:
+                    buffers[depth].append(resolved_instance)
+                    continue
+
+                if constructor_dependency_registry.implementation_details.is_async_builder is True:
+                    buffers[depth].append(await self._resolve_async_builder(constructor_dependency_registry, started_builders))
+                    continue
+
+                if constructor_dependency_id in resolving_ids:
+                    raise CyclicDependenciesException(
+                        [registry.dependency_id for registry in registries[self._find_registry_depth(registries, constructor_dependency_id) :]]
+                    )
+
+                registries.append(constructor_dependency_registry)
+                children.append(iter(self._get_resolving_class_constructor_dependencies_ids(constructor_dependency_registry)))
+                buffers.append([])
+                resolving_ids.add(constructor_dependency_id)
+                break
+            else:
+                registry = registries.pop()
+                children.pop()
+                resolving_ids.discard(registry.dependency_id)
+
+                resolved_instance = await self._use_lifecycle_strategy_async(registry, buffers.pop())
+
+                if depth == 0:
+                    return resolved_instance
+
+                buffers[depth - 1].append(resolved_instance)
+
+    async def resolve_async(self, dependency_id: tuple[int, ...]):
+        if self._observer_dispatcher is None:
+            return await self._resolve_async(dependency_id)
+
+        dependency_registry = self._dependency_store.get_dependency(dependency_id)
+
+        return await self._observer_dispatcher.observe_resolve_async(dependency_registry, lambda: self._resolve_async(dependency_id))
+
+    async def _resolve_async(self, dependency_id: tuple[int, ...]):
+        dependency_registry = self._dependency_store.get_dependency(dependency_id)
+        resolved_instance = self._find_resolved_instance(dependency_registry)
 
         if resolved_instance is not None:
             return resolved_instance
 
-        class_constructor_dependencies_ids = dependency_registry.implementation_details.class_constructor_dependencies_ids
+        # Every async builder of the subgraph starts at once, while the graph itself is walked
+        # from the calling task, so per context instances are stored in the caller's context.
+        started_builders = self._start_async_builders(dependency_registry)
+
+        try:
+            return await self._resolve_with_started_builders(dependency_registry, started_builders)
+        finally:
+            for started_builder in started_builders.values():
+                started_builder.cancel()
+
+    def _find_registry_depth(self, registries: list[DependencyRegistry], dependency_id: tuple[int, ...]) -> int:
+        for depth, registry in enumerate(registries):
+            if registry.dependency_id == dependency_id:
+                return depth
+
+        return 0
+
+    def _compile_missing_dependency(self, dependency_id: tuple[int, ...]) -> Callable[[], Any]:
+        def raise_missing_dependency():
+            raise MissingDependencyException([dependency_id])
+
+        return raise_missing_dependency
+
+    def _compile_invalid_lifecycle(self, dependency_registry: DependencyRegistry) -> Callable[[], Any]:
+        def raise_invalid_lifecycle():
+            raise InvalidLifecycleException(
+                [dependency_registry.dependency_id],
+                getattr(dependency_registry.lifecycle, "value", None) or dependency_registry.lifecycle,
+            )
+
+        return raise_invalid_lifecycle
+
+    def compile(self) -> dict[tuple[int, ...], Callable[[], Any]]:
+        compiled_factories: dict[tuple[int, ...], Callable[[], Any]] = {}
+        compiled_depths: dict[tuple[int, ...], int] = {}
+
+        for dependency_id in self._dependency_store.get_sorted_dependencies_ids():
+            dependency_registry = self._dependency_store.find_dependency(dependency_id)
+
+            if dependency_registry is None:
+                compiled_factories[dependency_id] = self._compile_missing_dependency(dependency_id)
+                continue
+
+            strategy = self._strategies.get(dependency_registry.lifecycle)
+
+            if strategy is None:
+                compiled_factories[dependency_id] = self._compile_invalid_lifecycle(dependency_registry)
+                continue
+
+            class_constructor_dependencies_ids = dependency_registry.implementation_details.class_constructor_dependencies_ids
+
+            depth = 1 + max((compiled_depths.get(constructor_dependency_id, 0) for constructor_dependency_id in class_constructor_dependencies_ids), default=0)
+            compiled_depths[dependency_id] = depth
+
+            if depth > self.MAX_COMPILED_DEPTH:
+                compiled_factories[dependency_id] = partial(self.resolve, dependency_id)
+                continue
+
+            class_constructor_dependencies_factories = [compiled_factories[constructor_dependency_id] for constructor_dependency_id in class_constructor_dependencies_ids]
+
+            compiled_factories[dependency_id] = strategy.compile(dependency_registry, class_constructor_dependencies_factories)
+
+        if self._observer_dispatcher is None:
+            return compiled_factories
+
+        # Only retrievals are reported as resolutions, constructor dependencies keep calling the plain factories.
+        observed_factories: dict[tuple[int, ...], Callable[[], Any]] = {}
+
+        for dependency_id, compiled_factory in compiled_factories.items():
+            dependency_registry = self._dependency_store.find_dependency(dependency_id)
 
-        resolved_class_constructor_dependencies = []
+            if dependency_registry is None:
+                observed_factories[dependency_id] = compiled_factory
+                continue
 
-        for constructor_dependency_id in class_constructor_dependencies_ids:
-            resolved_class_constructor_dependencies.append(self.resolve(constructor_dependency_id))
+            observed_factories[dependency_id] = self._observer_dispatcher.wrap_resolve(dependency_registry, compiled_factory)
 
-        return self._use_lifecycle_strategy(
-            dependency_registry,
-            resolved_class_constructor_dependencies,
-        )
+        return observed_factories
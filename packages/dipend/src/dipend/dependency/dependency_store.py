@@ -1,27 +1,58 @@
+from typing import Iterable, Optional
+from collections import deque
 from dataclasses import dataclass
 from ..__seedwork.dictionary import Dictionary
 from .dependency_registry import DependencyRegistry
+from .dynamic_topological_order import DynamicTopologicalOrder
 from ..exceptions.cyclic_dependencies_exception import CyclicDependenciesException
 from ..exceptions.missing_dependency_exception import MissingDependencyException
 
 
 @dataclass
 class _GraphAndDegrees:
-    graph: dict[str, list[str]]
-    input_degree: dict[str, int]
+    graph: dict[tuple[int, ...], list[tuple[int, ...]]]
+    input_degree: dict[tuple[int, ...], int]
 
 
 class DependencyStore:
     def __init__(self):
-        self._dependencies = Dictionary[str, DependencyRegistry]()
+        self._dependencies = Dictionary[tuple[int, ...], DependencyRegistry]()
+        self._topological_order = DynamicTopologicalOrder()
         self._sorted_dependencies_ids_cache_invalidated = False
-        self._sorted_dependencies_ids = []
+        self._dependencies_levels: Optional[dict[tuple[int, ...], int]] = None
+
+    def _add_to_topological_order(self, registry: DependencyRegistry):
+        self._topological_order.add_node(registry.dependency_id)
+
+        for class_constructor_dependency_id in registry.implementation_details.class_constructor_dependencies_ids:
+            if not self._topological_order.add_edge(class_constructor_dependency_id, registry.dependency_id):
+                self._sorted_dependencies_ids_cache_invalidated = True
+                return
+
+    def _remove_from_topological_order(self, registry: DependencyRegistry):
+        dependency_id = registry.dependency_id
+
+        for class_constructor_dependency_id in registry.implementation_details.class_constructor_dependencies_ids:
+            self._topological_order.remove_edge(class_constructor_dependency_id, dependency_id)
+
+            if self._dependencies.get(class_constructor_dependency_id) is None and not self._topological_order.has_successors(class_constructor_dependency_id):
+                self._topological_order.remove_node(class_constructor_dependency_id)
 
     def add_dependency(self, registry: DependencyRegistry):
-        self._sorted_dependencies_ids_cache_invalidated = True
+        previous_registry = self._dependencies.get(registry.dependency_id)
+
         self._dependencies.set(registry.dependency_id, registry)
+        self._dependencies_levels = None
+
+        if self._sorted_dependencies_ids_cache_invalidated:
+            return
 
-    def get_dependency(self, dependency_id: str) -> DependencyRegistry:
+        if previous_registry is not None:
+            self._remove_from_topological_order(previous_registry)
+
+        self._add_to_topological_order(registry)
+
+    def get_dependency(self, dependency_id: tuple[int, ...]) -> DependencyRegistry:
         registry = self._dependencies.get(dependency_id)
 
         if registry is None:
@@ -29,50 +60,76 @@ class DependencyStore:
 
         return registry
 
-    def delete_dependency(self, dependency_id: str):
+    def find_dependency(self, dependency_id: tuple[int, ...]) -> Optional[DependencyRegistry]:
+        return self._dependencies.get(dependency_id)
+
+    def delete_dependency(self, dependency_id: tuple[int, ...]):
+        registry = self._dependencies.get(dependency_id)
+
+        if registry is None:
+            return
+
         self._dependencies.delete(dependency_id)
+        self._dependencies_levels = None
+
+        if self._sorted_dependencies_ids_cache_invalidated:
+            return
+
+        self._remove_from_topological_order(registry)
+
+        if not self._topological_order.has_successors(dependency_id):
+            self._topological_order.remove_node(dependency_id)
+
+    def invalidate_sorted_dependencies_ids(self):
+        """
+        Stops maintaining the dependency order on every change, so it is rebuilt in linear time on the next read.
+        """
+        self._sorted_dependencies_ids_cache_invalidated = True
+        self._dependencies_levels = None
 
     def reset(self):
         self._dependencies.clear()
+        self._topological_order.clear()
+        self._sorted_dependencies_ids_cache_invalidated = False
+        self._dependencies_levels = None
 
     def _initialize_graph_and_degrees(self) -> _GraphAndDegrees:
-        graph: dict[str, list[str]] = {}
-        input_degree: dict[str, int] = {}
+        graph: dict[tuple[int, ...], list[tuple[int, ...]]] = {}
+        input_degree: dict[tuple[int, ...], int] = {}
 
         for dependency_id, dependency_registry in self._dependencies.items():
             input_degree[dependency_id] = input_degree.get(dependency_id, 0)
 
-            for class_constructor_dependency_id in dependency_registry.implementation_details.class_constructor_dependencies_ids:
-                input_degree[class_constructor_dependency_id] = input_degree.get(class_constructor_dependency_id, 0) + 1
+            class_constructor_dependencies_ids = dependency_registry.implementation_details.class_constructor_dependencies_ids
+
+            if len(class_constructor_dependencies_ids) == 0:
+                continue
 
-                if dependency_id not in graph.values():
-                    graph[dependency_id] = []
+            graph[dependency_id] = list(class_constructor_dependencies_ids)
 
-                graph[dependency_id].append(class_constructor_dependency_id)
+            for class_constructor_dependency_id in class_constructor_dependencies_ids:
+                input_degree[class_constructor_dependency_id] = input_degree.get(class_constructor_dependency_id, 0) + 1
 
         return _GraphAndDegrees(graph, input_degree)
 
     def _perform_topological_sort(
         self,
-        graph: dict[str, list[str]],
-        input_degree: dict[str, int],
-    ) -> list[str]:
-        queue: list[str] = []
+        graph: dict[tuple[int, ...], list[tuple[int, ...]]],
+        input_degree: dict[tuple[int, ...], int],
+    ) -> list[tuple[int, ...]]:
+        queue: deque[tuple[int, ...]] = deque()
 
         for dependency_id, degree in input_degree.items():
             if degree == 0:
                 queue.append(dependency_id)
 
-        sorted_list: list[str] = []
+        sorted_list: list[tuple[int, ...]] = []
 
         while len(queue) > 0:
-            current_item = queue.pop(0)
+            current_item = queue.popleft()
             sorted_list.append(current_item)
 
-            if graph.get(current_item, None) is None:
-                continue
-
-            for dependent in graph[current_item]:
+            for dependent in graph.get(current_item, ()):
                 input_degree[dependent] = input_degree[dependent] - 1
 
                 if input_degree[dependent] == 0:
@@ -80,30 +137,151 @@ class DependencyStore:
 
         return sorted_list
 
+    def _find_strongly_connected_components(
+        self,
+        graph: dict[tuple[int, ...], list[tuple[int, ...]]],
+        dependencies_ids: list[tuple[int, ...]],
+    ) -> list[list[tuple[int, ...]]]:
+        index: dict[tuple[int, ...], int] = {}
+        low_link: dict[tuple[int, ...], int] = {}
+        stack: list[tuple[int, ...]] = []
+        on_stack: set[tuple[int, ...]] = set()
+        components: list[list[tuple[int, ...]]] = []
+
+        for root_id in dependencies_ids:
+            if root_id in index:
+                continue
+
+            index[root_id] = low_link[root_id] = len(index)
+            stack.append(root_id)
+            on_stack.add(root_id)
+            work_stack = [(root_id, iter(graph.get(root_id, ())))]
+
+            while len(work_stack) > 0:
+                dependency_id, children = work_stack[-1]
+                child_pushed = False
+
+                for child_id in children:
+                    if child_id not in index:
+                        index[child_id] = low_link[child_id] = len(index)
+                        stack.append(child_id)
+                        on_stack.add(child_id)
+                        work_stack.append((child_id, iter(graph.get(child_id, ()))))
+                        child_pushed = True
+                        break
+
+                    if child_id in on_stack:
+                        low_link[dependency_id] = min(low_link[dependency_id], index[child_id])
+
+                if child_pushed:
+                    continue
+
+                work_stack.pop()
+
+                if len(work_stack) > 0:
+                    parent_id = work_stack[-1][0]
+                    low_link[parent_id] = min(low_link[parent_id], low_link[dependency_id])
+
+                if low_link[dependency_id] != index[dependency_id]:
+                    continue
+
+                component: list[tuple[int, ...]] = []
+
+                while True:
+                    member_id = stack.pop()
+                    on_stack.discard(member_id)
+                    component.append(member_id)
+
+                    if member_id == dependency_id:
+                        break
+
+                components.append(component)
+
+        return components
+
     def _detect_and_raise_cyclic_dependencies(
         self,
-        graph: dict[str, list[str]],
-        input_degree: dict[str, int],
+        graph: dict[tuple[int, ...], list[tuple[int, ...]]],
+        input_degree: dict[tuple[int, ...], int],
     ):
-        unresolved = filter(
-            lambda dependency_id: input_degree[dependency_id] > 0 and graph.get(dependency_id, None) is not None,
-            list(input_degree.keys()),
+        unresolved = [dependency_id for dependency_id, degree in input_degree.items() if degree > 0]
+
+        cyclic_dependencies_ids: list[tuple[int, ...]] = []
+
+        for component in self._find_strongly_connected_components(graph, unresolved):
+            if len(component) > 1 or component[0] in graph.get(component[0], ()):
+                cyclic_dependencies_ids.extend(reversed(component))
+
+        if len(cyclic_dependencies_ids) > 0:
+            raise CyclicDependenciesException(cyclic_dependencies_ids)
+
+    def _rebuild_topological_order(self, sorted_dependencies_ids: list[tuple[int, ...]]):
+        edges = (
+            (class_constructor_dependency_id, registry.dependency_id)
+            for registry in self._dependencies.values()
+            for class_constructor_dependency_id in registry.implementation_details.class_constructor_dependencies_ids
         )
 
-        if len(list(unresolved)) > 0:
-            raise CyclicDependenciesException(unresolved)
+        self._topological_order.load(sorted_dependencies_ids, edges)
 
-    def get_sorted_dependencies_ids(self) -> list[str]:
+    def get_sorted_dependencies_ids(self) -> list[tuple[int, ...]]:
         if self._sorted_dependencies_ids_cache_invalidated:
             graph_and_degrees = self._initialize_graph_and_degrees()
+            nodes_count = len(graph_and_degrees.input_degree)
             sorted_list = self._perform_topological_sort(graph_and_degrees.graph, graph_and_degrees.input_degree)
 
-            if len(sorted_list) != self._dependencies.len():
+            if len(sorted_list) != nodes_count:
                 self._detect_and_raise_cyclic_dependencies(graph_and_degrees.graph, graph_and_degrees.input_degree)
 
-            self._sorted_dependencies_ids = list(reversed(sorted_list))
+            sorted_list.reverse()
+
+            self._rebuild_topological_order(sorted_list)
             self._sorted_dependencies_ids_cache_invalidated = False
 
-            return self._sorted_dependencies_ids
+        return self._topological_order.get_sorted_nodes()
+
+    def sort_dependencies_ids(self, dependencies_ids: Iterable[tuple[int, ...]]) -> list[tuple[int, ...]]:
+        """
+        Sorts some dependency ids in dependency order, in time that depends on their count only.
+        """
+        if self._sorted_dependencies_ids_cache_invalidated:
+            self.get_sorted_dependencies_ids()
+
+        return self._topological_order.sort_nodes(dependencies_ids)
+
+    def get_dependencies_levels(self) -> dict[tuple[int, ...], int]:
+        """
+        Returns the level of every dependency, in dependency order: 0 without constructor dependencies,
+        otherwise one more than its highest constructor dependency. Kept until the graph changes.
+        """
+        sorted_dependencies_ids = self.get_sorted_dependencies_ids()
+
+        if self._dependencies_levels is not None:
+            return self._dependencies_levels
+
+        dependencies_levels: dict[tuple[int, ...], int] = {}
+
+        for dependency_id in sorted_dependencies_ids:
+            registry = self._dependencies.get(dependency_id)
+            level = 0
+
+            if registry is not None:
+                for class_constructor_dependency_id in registry.implementation_details.class_constructor_dependencies_ids:
+                    level = max(level, dependencies_levels[class_constructor_dependency_id] + 1)
+
+            dependencies_levels[dependency_id] = level
+
+        self._dependencies_levels = dependencies_levels
+
+        return dependencies_levels
+
+    def get_dependencies_ids_by_level(self) -> list[list[tuple[int, ...]]]:
+        levels: list[list[tuple[int, ...]]] = []
+
+        for dependency_id, level in self.get_dependencies_levels().items():
+            if level == len(levels):
+                levels.append([])
+
+            levels[level].append(dependency_id)
 
-        return self._sorted_dependencies_ids
+        return levels
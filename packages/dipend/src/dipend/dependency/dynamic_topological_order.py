@@ -0,0 +1,194 @@
+from typing import Any, Iterable, Optional
+
+
+class DynamicTopologicalOrder:
+    """
+    Keeps a topological order of a directed acyclic graph up to date while nodes and edges change.
+
+    Edge insertions follow the Pearce-Kelly algorithm: only the nodes whose positions lie between
+    the two endpoints of a violating edge are visited and reordered. Removals never break the order,
+    so they only leave a hole that is compacted once holes outnumber the nodes.
+    """
+
+    def __init__(self):
+        self._positions: list[Optional[Any]] = []
+        self._order: dict[Any, int] = {}
+        self._successors: dict[Any, dict[Any, int]] = {}
+        self._predecessors: dict[Any, dict[Any, int]] = {}
+        self._sorted_nodes: Optional[list[Any]] = None
+
+    def has_node(self, node: Any) -> bool:
+        return node in self._order
+
+    def has_predecessors(self, node: Any) -> bool:
+        return len(self._predecessors.get(node, ())) > 0
+
+    def has_successors(self, node: Any) -> bool:
+        return len(self._successors.get(node, ())) > 0
+
+    def add_node(self, node: Any):
+        if node in self._order:
+            return
+
+        self._order[node] = len(self._positions)
+        self._positions.append(node)
+        self._successors[node] = {}
+        self._predecessors[node] = {}
+        self._sorted_nodes = None
+
+    def remove_node(self, node: Any):
+        position = self._order.pop(node, None)
+
+        if position is None:
+            return
+
+        for successor in self._successors.pop(node):
+            self._predecessors[successor].pop(node, None)
+
+        for predecessor in self._predecessors.pop(node):
+            self._successors[predecessor].pop(node, None)
+
+        self._positions[position] = None
+        self._sorted_nodes = None
+
+        if len(self._positions) > 2 * len(self._order) + 16:
+            self._compact()
+
+    def _compact(self):
+        self._positions = [node for node in self._positions if node is not None]
+        self._order = {node: position for position, node in enumerate(self._positions)}
+
+    def _collect_forward(self, start: Any, upper_bound: int) -> Optional[list[Any]]:
+        visited = {start}
+        stack = [start]
+
+        while len(stack) > 0:
+            node = stack.pop()
+
+            for successor in self._successors[node]:
+                successor_position = self._order[successor]
+
+                if successor_position == upper_bound:
+                    return None
+
+                if successor_position < upper_bound and successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+
+        return list(visited)
+
+    def _collect_backward(self, start: Any, lower_bound: int) -> list[Any]:
+        visited = {start}
+        stack = [start]
+
+        while len(stack) > 0:
+            node = stack.pop()
+
+            for predecessor in self._predecessors[node]:
+                if self._order[predecessor] > lower_bound and predecessor not in visited:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+
+        return list(visited)
+
+    def _reorder(self, backward_nodes: list[Any], forward_nodes: list[Any]):
+        backward_nodes.sort(key=self._order.__getitem__)
+        forward_nodes.sort(key=self._order.__getitem__)
+
+        nodes = backward_nodes + forward_nodes
+        positions = sorted(self._order[node] for node in nodes)
+
+        for node, position in zip(nodes, positions):
+            self._order[node] = position
+            self._positions[position] = node
+
+    def add_edge(self, before: Any, after: Any) -> bool:
+        """
+        Adds an edge requiring `before` to be ordered before `after`, adding missing nodes.
+
+        Returns:
+            bool: False, leaving the graph untouched, if the edge would close a cycle.
+        """
+        if before == after:
+            return False
+
+        self.add_node(before)
+        self.add_node(after)
+
+        successors = self._successors[before]
+
+        if after in successors:
+            successors[after] += 1
+            self._predecessors[after][before] += 1
+            return True
+
+        lower_bound = self._order[after]
+        upper_bound = self._order[before]
+
+        if lower_bound < upper_bound:
+            forward_nodes = self._collect_forward(after, upper_bound)
+
+            if forward_nodes is None:
+                return False
+
+            backward_nodes = self._collect_backward(before, lower_bound)
+
+            self._reorder(backward_nodes, forward_nodes)
+            self._sorted_nodes = None
+
+        successors[after] = 1
+        self._predecessors[after][before] = 1
+
+        return True
+
+    def remove_edge(self, before: Any, after: Any):
+        successors = self._successors.get(before)
+
+        if successors is None or after not in successors:
+            return
+
+        successors[after] -= 1
+        self._predecessors[after][before] -= 1
+
+        if successors[after] == 0:
+            del successors[after]
+            del self._predecessors[after][before]
+
+    def load(self, sorted_nodes: list[Any], edges: Iterable[tuple[Any, Any]]):
+        """
+        Replaces the graph with nodes already in topological order and their edges, in linear time.
+        The edges are trusted to agree with the order, so they are not checked for cycles.
+        """
+        self._positions = list(sorted_nodes)
+        self._order = {node: position for position, node in enumerate(self._positions)}
+        self._successors = {node: {} for node in self._positions}
+        self._predecessors = {node: {} for node in self._positions}
+        self._sorted_nodes = None
+
+        for before, after in edges:
+            successors = self._successors[before]
+            successors[after] = successors.get(after, 0) + 1
+
+            predecessors = self._predecessors[after]
+            predecessors[before] = predecessors.get(before, 0) + 1
+
+    def get_sorted_nodes(self) -> list[Any]:
+        if self._sorted_nodes is None:
+            self._sorted_nodes = [node for node in self._positions if node is not None]
+
+        return self._sorted_nodes
+
+    def sort_nodes(self, nodes: Iterable[Any]) -> list[Any]:
+        """
+        Sorts some of the nodes by their position, without walking the rest of the graph.
+        """
+        order = self._order
+
+        return sorted(nodes, key=lambda node: order.get(node, -1))
+
+    def clear(self):
+        self._positions = []
+        self._order = {}
+        self._successors = {}
+        self._predecessors = {}
+        self._sorted_nodes = None
@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Any, Optional
+from .object_pool import ObjectPool
 
 
-@dataclass
+@dataclass(slots=True)
 class ImplementationDetails:
     class_constructor: Optional[Callable]
-    class_constructor_dependencies_ids: list[str]
+    class_constructor_dependencies_ids: list[tuple[int, ...]]
     builder: Optional[Callable]
     instance: Optional[Any]
+    is_async_builder: bool = field(default=False)
+    builder_timeout: Optional[float] = field(default=None)
+    pool: Optional[ObjectPool] = field(default=None)
+    cache_ttl: Optional[float] = field(default=None)
@@ -0,0 +1,107 @@
+from typing import Any, Callable, Optional
+from threading import Lock
+
+
+class LazyProxy:
+    """
+    Stands in for a dependency, building it on first use and forwarding every access to it.
+    """
+
+    __slots__ = ("_lazy_factory", "_lazy_class", "_lazy_lock", "_lazy_target")
+
+    def __init__(self, factory: Callable[[], Any], target_class: Optional[type] = None):
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_class", target_class)
+        object.__setattr__(self, "_lazy_lock", Lock())
+        object.__setattr__(self, "_lazy_target", None)
+
+    def _get_lazy_target(self) -> Any:
+        target = object.__getattribute__(self, "_lazy_target")
+
+        if target is not None:
+            return target
+
+        with object.__getattribute__(self, "_lazy_lock"):
+            target = object.__getattribute__(self, "_lazy_target")
+
+            if target is None:
+                target = object.__getattribute__(self, "_lazy_factory")()
+                object.__setattr__(self, "_lazy_target", target)
+                object.__setattr__(self, "_lazy_factory", None)
+
+        return target
+
+    def is_lazy_target_built(self) -> bool:
+        return object.__getattribute__(self, "_lazy_target") is not None
+
+    @property
+    def __class__(self):
+        target_class = object.__getattribute__(self, "_lazy_class")
+
+        if target_class is not None and not self.is_lazy_target_built():
+            return target_class
+
+        return type(self._get_lazy_target())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_lazy_target(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._get_lazy_target(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._get_lazy_target(), name)
+
+    def __dir__(self):
+        return dir(self._get_lazy_target())
+
+    def __repr__(self) -> str:
+        return repr(self._get_lazy_target())
+
+    def __str__(self) -> str:
+        return str(self._get_lazy_target())
+
+    def __bool__(self) -> bool:
+        return bool(self._get_lazy_target())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._get_lazy_target() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return self._get_lazy_target() != other
+
+    def __hash__(self) -> int:
+        return hash(self._get_lazy_target())
+
+    def __call__(self, *args, **kwargs):
+        return self._get_lazy_target()(*args, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._get_lazy_target())
+
+    def __iter__(self):
+        return iter(self._get_lazy_target())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._get_lazy_target()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._get_lazy_target()[key]
+
+    def __setitem__(self, key: Any, value: Any):
+        self._get_lazy_target()[key] = value
+
+    def __delitem__(self, key: Any):
+        del self._get_lazy_target()[key]
+
+    def __enter__(self):
+        return self._get_lazy_target().__enter__()
+
+    def __exit__(self, *args):
+        return self._get_lazy_target().__exit__(*args)
+
+    async def __aenter__(self):
+        return await self._get_lazy_target().__aenter__()
+
+    async def __aexit__(self, *args):
+        return await self._get_lazy_target().__aexit__(*args)
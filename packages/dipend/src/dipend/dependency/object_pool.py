@@ -0,0 +1,177 @@
+import asyncio
+from collections import deque
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Optional
+
+
+class ObjectPool:
+    """
+    A bounded pool of reusable instances. At most `max_size` instances exist at once, either idle
+    in the pool or checked out, and checking out waits for a release once every one is in use.
+
+    Async checkouts wait on a future of their own event loop, and releases hand instances to them
+    first. A waiter cancelled after it was handed an instance, or the room for one, hands it back.
+    """
+
+    def __init__(self, max_size: int, timeout: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError("Pool max size must be at least 1.")
+
+        self._max_size = max_size
+        self._timeout = timeout
+        self._idle_instances: deque[Any] = deque()
+        self._size = 0
+        self._condition = Condition()
+        self._async_waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _try_take(self) -> tuple[bool, Optional[Any]]:
+        if len(self._idle_instances) > 0:
+            return True, self._idle_instances.pop()
+
+        if self._size < self._max_size:
+            self._size += 1
+            return True, None
+
+        return False, None
+
+    def _take(self, block: bool) -> tuple[bool, Optional[Any]]:
+        """
+        Takes an idle instance, or reserves room for a new one when it returns None.
+        """
+        with self._condition:
+            is_taken, instance = self._try_take()
+
+            if is_taken is True or block is False:
+                return is_taken, instance
+
+            deadline = None if self._timeout is None else monotonic() + self._timeout
+
+            while True:
+                remaining = None if deadline is None else deadline - monotonic()
+
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Pool checkout timed out.")
+
+                self._condition.wait(remaining)
+
+                is_taken, instance = self._try_take()
+
+                if is_taken is True:
+                    return is_taken, instance
+
+    def _offer(self, instance: Optional[Any]):
+        """
+        Hands an idle instance, or the room for a new one when None, to the next waiter. Must be
+        called holding the condition.
+        """
+        while len(self._async_waiters) > 0:
+            loop, waiter = self._async_waiters.popleft()
+
+            if waiter.done():
+                continue
+
+            try:
+                loop.call_soon_threadsafe(self._deliver, waiter, instance)
+            except RuntimeError:
+                # The waiter's event loop is closed.
+                continue
+
+            return
+
+        if instance is None:
+            self._size -= 1
+        else:
+            self._idle_instances.append(instance)
+
+        self._condition.notify()
+
+    def _deliver(self, waiter: asyncio.Future, instance: Optional[Any]):
+        # Runs on the waiter's event loop, the waiter may have been cancelled since it was picked.
+        if waiter.done():
+            with self._condition:
+                self._offer(instance)
+
+            return
+
+        waiter.set_result(instance)
+
+    def _abandon(self, loop: asyncio.AbstractEventLoop, waiter: asyncio.Future):
+        with self._condition:
+            try:
+                self._async_waiters.remove((loop, waiter))
+            except ValueError:
+                pass
+
+            # Handed over, but the checkout was cancelled before it could use it.
+            if waiter.done() and not waiter.cancelled():
+                self._offer(waiter.result())
+
+    def _create(self, factory: Callable[[], Any]) -> Any:
+        try:
+            return factory()
+        except BaseException:
+            with self._condition:
+                self._offer(None)
+
+            raise
+
+    def acquire(self, factory: Callable[[], Any]) -> Any:
+        _, instance = self._take(True)
+
+        if instance is None:
+            return self._create(factory)
+
+        return instance
+
+    async def acquire_async(self, factory: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+
+        with self._condition:
+            is_taken, instance = self._try_take()
+
+            if is_taken is False:
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+
+        if is_taken is False:
+            try:
+                async with asyncio.timeout(self._timeout):
+                    instance = await waiter
+            except BaseException:
+                self._abandon(loop, waiter)
+                raise
+
+        if instance is None:
+            return self._create(factory)
+
+        return instance
+
+    def release(self, instance: Any):
+        with self._condition:
+            self._offer(instance)
+
+    def drain(self) -> list[Any]:
+        """
+        Removes and returns the idle instances, so they can be disposed.
+        """
+        with self._condition:
+            idle_instances = list(self._idle_instances)
+
+            self._idle_instances.clear()
+
+            # The room of every drained instance goes to a waiter, if any.
+            for _ in idle_instances:
+                self._offer(None)
+
+            self._condition.notify_all()
+
+        return idle_instances
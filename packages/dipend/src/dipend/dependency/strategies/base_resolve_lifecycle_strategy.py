@@ -1,20 +1,61 @@
-from typing import Any
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from dipend.__seedwork.strategy_interface import StrategyInterface
+from dipend.dependency.dependency_registry import DependencyRegistry
 from dipend.exceptions.can_not_construct_dependency_exception import (
     CanNotConstructDependencyException,
 )
+from dipend.exceptions.async_builder_not_awaited_exception import (
+    AsyncBuilderNotAwaitedException,
+)
 from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
 
+if TYPE_CHECKING:
+    from dipend.observers.observer_dispatcher import ObserverDispatcher
+
 
 class BaseResolveLifecycleStrategy(
     StrategyInterface[ResolveLifecycleStrategyInput, Any]
 ):
+    # Strategies that build their dependency later resolve its constructor dependencies themselves.
+    resolves_class_constructor_dependencies = True
+
+    # Strategies keeping instances outside the registry, such as per scope ones, are asked for them while resolving.
+    keeps_resolved_instances = False
+
+    # Strategies keeping one instance for every caller share an async build in flight, so it runs once.
+    shares_async_builds = False
+
+    _observer_dispatcher: Optional["ObserverDispatcher"] = None
+
+    def set_observer_dispatcher(self, observer_dispatcher: Optional["ObserverDispatcher"]):
+        self._observer_dispatcher = observer_dispatcher
+
+    def find_resolved_instance(self, dependency_registry: DependencyRegistry) -> Optional[Any]:
+        return dependency_registry.implementation_details.instance
+
     def _construct(self, input_data: ResolveLifecycleStrategyInput) -> Any:
         implementation_details = input_data.dependency_registry.implementation_details
 
         if implementation_details.instance is not None:
             return implementation_details.instance
 
+        return self._create_instance(input_data)
+
+    def _create_instance(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        if input_data.built_instance is not None:
+            return input_data.built_instance
+
+        if self._observer_dispatcher is None:
+            return self._build_instance(input_data)
+
+        return self._observer_dispatcher.observe_construct(input_data.dependency_registry, lambda: self._build_instance(input_data))
+
+    def _build_instance(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        implementation_details = input_data.dependency_registry.implementation_details
+
+        if implementation_details.is_async_builder is True:
+            raise AsyncBuilderNotAwaitedException([input_data.dependency_registry.dependency_id])
+
         if implementation_details.builder is not None:
             return implementation_details.builder()
 
@@ -26,3 +67,88 @@ class BaseResolveLifecycleStrategy(
         return implementation_details.class_constructor(
             *input_data.resolved_class_constructor_dependencies
         )
+
+    def _compile_construct(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        instance = dependency_registry.implementation_details.instance
+
+        if instance is not None:
+            return lambda: instance
+
+        # Observation is only compiled into plans built while an observer is registered.
+        if self._observer_dispatcher is None:
+            return self._compile_build(dependency_registry, class_constructor_dependencies_factories)
+
+        observer_dispatcher = self._observer_dispatcher
+        build = self._compile_build(dependency_registry, [])
+
+        # Constructor dependencies are resolved first, so the timing only covers this construction.
+        def observed_construct():
+            class_constructor_dependencies = [class_constructor_dependency_factory() for class_constructor_dependency_factory in class_constructor_dependencies_factories]
+
+            return observer_dispatcher.observe_construct(dependency_registry, lambda: build(*class_constructor_dependencies))
+
+        return observed_construct
+
+    def _compile_build(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        implementation_details = dependency_registry.implementation_details
+
+        dependency_id = dependency_registry.dependency_id
+
+        if implementation_details.is_async_builder is True:
+
+            def raise_async_builder_not_awaited():
+                raise AsyncBuilderNotAwaitedException([dependency_id])
+
+            return raise_async_builder_not_awaited
+
+        if implementation_details.builder is not None:
+            return implementation_details.builder
+
+        class_constructor = implementation_details.class_constructor
+
+        if class_constructor is None:
+
+            def raise_can_not_construct():
+                raise CanNotConstructDependencyException([dependency_id])
+
+            return raise_can_not_construct
+
+        if len(class_constructor_dependencies_factories) == 0:
+            return class_constructor
+
+        return lambda: class_constructor(
+            *[class_constructor_dependency_factory() for class_constructor_dependency_factory in class_constructor_dependencies_factories]
+        )
+
+    async def execute_async(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        return self.execute(input_data)
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        implementation_details = dependency_registry.implementation_details
+
+        def factory():
+            instance = implementation_details.instance
+
+            if instance is not None:
+                return instance
+
+            return self.execute(
+                ResolveLifecycleStrategyInput(
+                    dependency_registry,
+                    [class_constructor_dependency_factory() for class_constructor_dependency_factory in class_constructor_dependencies_factories],
+                )
+            )
+
+        return factory
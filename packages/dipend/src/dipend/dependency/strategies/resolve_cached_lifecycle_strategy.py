@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Optional
+from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
+from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...dependency.dependency_registry import DependencyRegistry
+
+
+class ResolveCachedLifecycleStrategy(BaseResolveLifecycleStrategy):
+    """
+    Reuses a built instance until its time to live expires or it is invalidated. Once more than
+    `max_entries` dependencies are cached, the least recently used one is evicted.
+    """
+
+    keeps_resolved_instances = True
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = max_entries
+        self._entries = OrderedDict[tuple[int, ...], tuple[Any, Optional[float]]]()
+        self._lock = Lock()
+
+    def _get_cached_instance(self, dependency_id: tuple[int, ...]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(dependency_id)
+
+            if entry is None:
+                return None
+
+            instance, expires_at = entry
+
+            if expires_at is not None and monotonic() >= expires_at:
+                del self._entries[dependency_id]
+                return None
+
+            self._entries.move_to_end(dependency_id)
+
+            return instance
+
+    def _cache_instance(self, dependency_registry: DependencyRegistry, instance: Any):
+        cache_ttl = dependency_registry.implementation_details.cache_ttl
+        expires_at = None if cache_ttl is None else monotonic() + cache_ttl
+
+        with self._lock:
+            self._entries[dependency_registry.dependency_id] = (instance, expires_at)
+            self._entries.move_to_end(dependency_registry.dependency_id)
+
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, dependency_id: Optional[tuple[int, ...]] = None):
+        with self._lock:
+            if dependency_id is None:
+                self._entries.clear()
+                return
+
+            self._entries.pop(dependency_id, None)
+
+    def find_resolved_instance(self, dependency_registry: DependencyRegistry) -> Optional[Any]:
+        instance = dependency_registry.implementation_details.instance
+
+        if instance is not None:
+            return instance
+
+        return self._get_cached_instance(dependency_registry.dependency_id)
+
+    def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        dependency_registry = input_data.dependency_registry
+        instance = self._get_cached_instance(dependency_registry.dependency_id)
+
+        if instance is None:
+            instance = self._construct(input_data)
+
+            self._cache_instance(dependency_registry, instance)
+
+        return instance
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        dependency_id = dependency_registry.dependency_id
+        construct = self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
+
+        def factory():
+            instance = self._get_cached_instance(dependency_id)
+
+            if instance is None:
+                instance = construct()
+
+                self._cache_instance(dependency_registry, instance)
+
+            return instance
+
+        return factory
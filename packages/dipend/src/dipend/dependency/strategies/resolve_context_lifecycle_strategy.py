@@ -1,12 +1,24 @@
-from typing import Any
+from typing import Any, Callable, Optional
 from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
 from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...context.base_context_store import BaseContextStore
 from ...context.context_store import ContextStore
+from ...dependency.dependency_registry import DependencyRegistry
 
 
 class ResolveContextLifecycleStrategy(BaseResolveLifecycleStrategy):
-    def __init__(self):
-        self._context_wrapper = ContextStore()
+    keeps_resolved_instances = True
+
+    def __init__(self, context_store: Optional[BaseContextStore] = None):
+        self._context_wrapper = context_store or ContextStore()
+
+    def find_resolved_instance(self, dependency_registry: DependencyRegistry) -> Optional[Any]:
+        instance = dependency_registry.implementation_details.instance
+
+        if instance is not None:
+            return instance
+
+        return self._context_wrapper.get(dependency_registry.dependency_id)
 
     def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
         instance = self._context_wrapper.get(
@@ -21,3 +33,24 @@ class ResolveContextLifecycleStrategy(BaseResolveLifecycleStrategy):
             )
 
         return instance
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        dependency_id = dependency_registry.dependency_id
+        context_wrapper = self._context_wrapper
+        construct = self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
+
+        def factory():
+            instance = context_wrapper.get(dependency_id)
+
+            if instance is None:
+                instance = construct()
+
+                context_wrapper.set(dependency_id, instance)
+
+            return instance
+
+        return factory
@@ -0,0 +1,66 @@
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from threading import Lock
+from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
+from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...dependency.dependency_registry import DependencyRegistry
+from ...dependency.lazy_proxy import LazyProxy
+
+if TYPE_CHECKING:
+    from ...dependency.dependency_resolver import DependencyResolver
+
+
+class ResolveLazySingletonLifecycleStrategy(BaseResolveLifecycleStrategy):
+    resolves_class_constructor_dependencies = False
+
+    def __init__(self, dependency_resolver: "DependencyResolver"):
+        self._dependency_resolver = dependency_resolver
+        self._lock = Lock()
+
+    def _get_target_class(self, dependency_registry: DependencyRegistry) -> Optional[type]:
+        class_constructor = dependency_registry.implementation_details.class_constructor
+
+        if isinstance(class_constructor, type):
+            return class_constructor
+
+        return None
+
+    def _create_target(self, dependency_registry: DependencyRegistry) -> Any:
+        resolved_class_constructor_dependencies = self._dependency_resolver.resolve_class_constructor_dependencies(dependency_registry)
+
+        return self._create_instance(ResolveLifecycleStrategyInput(dependency_registry, resolved_class_constructor_dependencies))
+
+    def _publish_proxy(self, dependency_registry: DependencyRegistry, factory: Callable[[], Any]) -> Any:
+        implementation_details = dependency_registry.implementation_details
+
+        with self._lock:
+            if implementation_details.instance is None:
+                implementation_details.instance = LazyProxy(factory, self._get_target_class(dependency_registry))
+
+            return implementation_details.instance
+
+    def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        dependency_registry = input_data.dependency_registry
+        instance = dependency_registry.implementation_details.instance
+
+        if instance is not None:
+            return instance
+
+        return self._publish_proxy(dependency_registry, lambda: self._create_target(dependency_registry))
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        implementation_details = dependency_registry.implementation_details
+        construct = self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
+
+        def factory():
+            instance = implementation_details.instance
+
+            if instance is not None:
+                return instance
+
+            return self._publish_proxy(dependency_registry, construct)
+
+        return factory
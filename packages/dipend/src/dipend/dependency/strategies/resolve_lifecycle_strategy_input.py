@@ -1,9 +1,10 @@
-from typing import Any
-from dataclasses import dataclass
+from typing import Any, Optional
+from dataclasses import dataclass, field
 from ...dependency.dependency_registry import DependencyRegistry
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolveLifecycleStrategyInput:
     dependency_registry: DependencyRegistry
     resolved_class_constructor_dependencies: list[Any]
+    built_instance: Optional[Any] = field(default=None)
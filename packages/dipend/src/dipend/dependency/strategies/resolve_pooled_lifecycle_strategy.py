@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from typing import Any, Callable, Optional
+from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
+from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...context.base_context_store import BaseContextStore
+from ...context.context_store import ContextStore
+from ...dependency.dependency_registry import DependencyRegistry
+from ...dependency.object_pool import ObjectPool
+from ...enums.lifecycle_enum import LifecycleEnum
+from ...exceptions.can_not_construct_dependency_exception import (
+    CanNotConstructDependencyException,
+)
+from ...exceptions.missing_context_scope_exception import (
+    MissingContextScopeException,
+)
+from ...exceptions.pool_timeout_exception import PoolTimeoutException
+
+
+class ResolvePooledLifecycleStrategy(BaseResolveLifecycleStrategy):
+    """
+    Checks an instance out of the dependency's pool once per context scope and user of the scope,
+    the thread or task that resolved it. Nested scopes and tasks started within a scope check out
+    their own instance, so an instance is never used by two of them at once. Checkouts are kept in
+    the scope state of the scope that took them, and go back to the pool when it exits.
+    """
+
+    keeps_resolved_instances = True
+
+    def __init__(self, context_store: Optional[BaseContextStore] = None):
+        self._context_wrapper = context_store or ContextStore()
+
+    @staticmethod
+    def get_checkouts(scope_state: dict[Any, Any]) -> dict[tuple[Any, ...], Any]:
+        """
+        Returns the instances checked out within a scope, by dependency id and user.
+        """
+        return scope_state.setdefault(LifecycleEnum.POOLED, {})
+
+    def _get_checkout_key(self, dependency_id: tuple[int, ...]) -> tuple[Any, ...]:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        return dependency_id, threading.get_ident(), task
+
+    def _find_checkout(self, dependency_id: tuple[int, ...]) -> Optional[Any]:
+        scope_state = self._context_wrapper.get_scope_state()
+
+        if scope_state is None:
+            return None
+
+        return self.get_checkouts(scope_state).get(self._get_checkout_key(dependency_id))
+
+    def _set_checkout(self, dependency_id: tuple[int, ...], instance: Any):
+        self.get_checkouts(self._context_wrapper.get_scope_state())[self._get_checkout_key(dependency_id)] = instance
+
+    def find_resolved_instance(self, dependency_registry: DependencyRegistry) -> Optional[Any]:
+        return self._find_checkout(dependency_registry.dependency_id)
+
+    def _get_pool(self, dependency_registry: DependencyRegistry) -> ObjectPool:
+        dependency_id = dependency_registry.dependency_id
+
+        if self._context_wrapper.is_scope_open() is False:
+            raise MissingContextScopeException([dependency_id])
+
+        pool = dependency_registry.implementation_details.pool
+
+        if pool is None:
+            raise CanNotConstructDependencyException([dependency_id])
+
+        return pool
+
+    def _check_out(self, dependency_registry: DependencyRegistry, create: Callable[[], Any]) -> Any:
+        pool = self._get_pool(dependency_registry)
+
+        try:
+            instance = pool.acquire(create)
+        except TimeoutError:
+            raise PoolTimeoutException([dependency_registry.dependency_id])
+
+        self._set_checkout(dependency_registry.dependency_id, instance)
+
+        return instance
+
+    def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        dependency_registry = input_data.dependency_registry
+        instance = self._find_checkout(dependency_registry.dependency_id)
+
+        if instance is not None:
+            return instance
+
+        return self._check_out(dependency_registry, lambda: self._create_instance(input_data))
+
+    async def execute_async(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        dependency_registry = input_data.dependency_registry
+        instance = self._find_checkout(dependency_registry.dependency_id)
+
+        if instance is not None:
+            return instance
+
+        pool = self._get_pool(dependency_registry)
+
+        try:
+            instance = await pool.acquire_async(lambda: self._create_instance(input_data))
+        except TimeoutError:
+            raise PoolTimeoutException([dependency_registry.dependency_id])
+
+        self._set_checkout(dependency_registry.dependency_id, instance)
+
+        return instance
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        dependency_id = dependency_registry.dependency_id
+        construct = self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
+
+        def factory():
+            instance = self._find_checkout(dependency_id)
+
+            if instance is None:
+                instance = self._check_out(dependency_registry, construct)
+
+            return instance
+
+        return factory
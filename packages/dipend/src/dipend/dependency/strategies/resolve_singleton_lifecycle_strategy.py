@@ -1,12 +1,56 @@
-from typing import Any
+from typing import Any, Callable
+from threading import RLock
 from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
 from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...dependency.dependency_registry import DependencyRegistry
 
 
 class ResolveSingletonLifecycleStrategy(BaseResolveLifecycleStrategy):
+    shares_async_builds = True
+
+    def __init__(self):
+        self._locks: dict[tuple[int, ...], RLock] = {}
+
+    def _get_lock(self, dependency_id: tuple[int, ...]) -> RLock:
+        lock = self._locks.get(dependency_id)
+
+        if lock is None:
+            lock = self._locks.setdefault(dependency_id, RLock())
+
+        return lock
+
     def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
-        if input_data.dependency_registry.implementation_details.instance is None:
-            instance = self._construct(input_data)
-            input_data.dependency_registry.implementation_details.instance = instance
+        implementation_details = input_data.dependency_registry.implementation_details
+        instance = implementation_details.instance
+
+        if instance is not None:
+            return instance
+
+        with self._get_lock(input_data.dependency_registry.dependency_id):
+            if implementation_details.instance is None:
+                implementation_details.instance = self._construct(input_data)
+
+            return implementation_details.instance
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        implementation_details = dependency_registry.implementation_details
+        construct = self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
+        lock = self._get_lock(dependency_registry.dependency_id)
+
+        def factory():
+            instance = implementation_details.instance
+
+            if instance is not None:
+                return instance
+
+            with lock:
+                if implementation_details.instance is None:
+                    implementation_details.instance = construct()
+
+                return implementation_details.instance
 
-        return input_data.dependency_registry.implementation_details.instance
+        return factory
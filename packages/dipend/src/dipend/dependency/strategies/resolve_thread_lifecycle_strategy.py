@@ -0,0 +1,116 @@
+import threading
+import weakref
+from typing import Any, Callable, Optional
+from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
+from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...dependency.dependency_registry import DependencyRegistry
+from ...helpers.dispose_helper import DisposeHelper
+
+
+class _ThreadInstances:
+    __slots__ = ("instances", "__weakref__")
+
+    def __init__(self):
+        self.instances: dict[tuple[int, ...], Any] = {}
+
+
+def _dispose_thread_instances(instances: dict[tuple[int, ...], Any]):
+    errors: list[Exception] = []
+
+    # Instances are stored after their dependencies, so the reverse order disposes dependents first.
+    for instance in reversed(list(instances.values())):
+        disposer = DisposeHelper.get_sync_disposer(instance)
+
+        if disposer is None:
+            continue
+
+        try:
+            disposer()
+        except Exception as err:
+            errors.append(err)
+
+    instances.clear()
+
+    if len(errors) > 0:
+        raise errors[0]
+
+
+class ResolveThreadLifecycleStrategy(BaseResolveLifecycleStrategy):
+    """
+    Keeps one instance per thread. The instances of a thread are disposed once the thread exits
+    and its thread-local storage is released.
+    """
+
+    keeps_resolved_instances = True
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _find_thread_instances(self) -> Optional[dict[tuple[int, ...], Any]]:
+        thread_instances: Optional[_ThreadInstances] = getattr(self._local, "thread_instances", None)
+
+        if thread_instances is None:
+            return None
+
+        return thread_instances.instances
+
+    def _get_thread_instances(self) -> dict[tuple[int, ...], Any]:
+        instances = self._find_thread_instances()
+
+        if instances is not None:
+            return instances
+
+        thread_instances = _ThreadInstances()
+
+        # The finalizer only holds the instances dict, so the holder dies along with the thread's local storage.
+        weakref.finalize(thread_instances, _dispose_thread_instances, thread_instances.instances)
+
+        self._local.thread_instances = thread_instances
+
+        return thread_instances.instances
+
+    def find_resolved_instance(self, dependency_registry: DependencyRegistry) -> Optional[Any]:
+        instance = dependency_registry.implementation_details.instance
+
+        if instance is not None:
+            return instance
+
+        instances = self._find_thread_instances()
+
+        if instances is None:
+            return None
+
+        return instances.get(dependency_registry.dependency_id)
+
+    def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
+        instances = self._get_thread_instances()
+        dependency_id = input_data.dependency_registry.dependency_id
+        instance = instances.get(dependency_id)
+
+        if instance is None:
+            instance = self._construct(input_data)
+
+            instances[dependency_id] = instance
+
+        return instance
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        dependency_id = dependency_registry.dependency_id
+        construct = self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
+
+        def factory():
+            instances = self._get_thread_instances()
+            instance = instances.get(dependency_id)
+
+            if instance is None:
+                instance = construct()
+
+                instances[dependency_id] = instance
+
+            return instance
+
+        return factory
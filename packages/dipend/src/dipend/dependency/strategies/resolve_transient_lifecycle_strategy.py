@@ -1,8 +1,16 @@
-from typing import Any
+from typing import Any, Callable
 from .base_resolve_lifecycle_strategy import BaseResolveLifecycleStrategy
 from .resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from ...dependency.dependency_registry import DependencyRegistry
 
 
 class ResolveTransientLifecycleStrategy(BaseResolveLifecycleStrategy):
     def execute(self, input_data: ResolveLifecycleStrategyInput) -> Any:
         return self._construct(input_data)
+
+    def compile(
+        self,
+        dependency_registry: DependencyRegistry,
+        class_constructor_dependencies_factories: list[Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        return self._compile_construct(dependency_registry, class_constructor_dependencies_factories)
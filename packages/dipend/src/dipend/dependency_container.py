@@ -1,9 +1,14 @@
-from typing import Any, Optional, Callable, overload
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Iterator, Optional, Callable, overload
 from dataclasses import dataclass, field
 from .dependency_container_config import DependencyContainerConfig
 from .token.token_store import TokenStore
 from .dependency.dependency_store import DependencyStore
 from .dependency.dependency_resolver import DependencyResolver
+from .dependency.dependency_disposer import DependencyDisposer
+from .context.context_store import ContextStore
+from .context.context_scope import ContextScope
 from .token.token_type_resolver import TokenTypeResolver
 from .token.token_name_resolver import TokenNameResolver
 from .exceptions.exception_handler import ExceptionHandler
@@ -27,9 +32,16 @@ from .commands.resolve_specific_lifecycles_command_handler import (
     ResolveSpecificLifecyclesCommandHandler,
 )
 from .enums.lifecycle_enum import LifecycleEnum
+from .observers.base_dependency_observer import BaseDependencyObserver
+from .observers.build_profile import BuildProfile
+from .observers.build_profiler import BuildProfiler
+from .observers.observer_dispatcher import ObserverDispatcher
+from .dependency.strategies.resolve_cached_lifecycle_strategy import (
+    ResolveCachedLifecycleStrategy,
+)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _AddDependencyInput:
     lifecycle: str
     dependency_token: Optional[Any] = field(default=None)
@@ -38,9 +50,14 @@ class _AddDependencyInput:
     class_constructor: Optional[Callable] = field(default=None)
     builder: Optional[Callable] = field(default=None)
     instance: Optional[Any] = field(default=None)
+    is_async_builder: Optional[bool] = field(default=False)
+    builder_timeout: Optional[float] = field(default=None)
+    pool_max_size: Optional[int] = field(default=None)
+    pool_timeout: Optional[float] = field(default=None)
+    cache_ttl: Optional[float] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class _RetrieveDependencyInput:
     dependency_token: Optional[Any] = field(default=None)
     check_qualifier: Optional[bool] = field(default=False)
@@ -60,9 +77,14 @@ class DependencyContainer:
         Args:
             config (Optional[DependencyContainerConfig]): Configuration for the container.
         """
+        if config is None:
+            config = DependencyContainerConfig()
+
         self._token_store = TokenStore()
         self._dependency_store = DependencyStore()
-        self._dependency_resolver = DependencyResolver(self._dependency_store)
+        self._context_store = config.custom_context_store or ContextStore()
+        self._dependency_resolver = DependencyResolver(self._dependency_store, self._context_store)
+        self._dependency_disposer = DependencyDisposer(self._dependency_store, self._context_store)
         self._token_type_resolver = TokenTypeResolver()
         self._token_name_resolver = TokenNameResolver()
         self._exception_handler = ExceptionHandler(
@@ -83,20 +105,24 @@ class DependencyContainer:
             self._dependency_store,
             self._dependency_resolver,
         )
+        self._observer_dispatcher = ObserverDispatcher(self._get_token_names)
 
         self._is_singletons_built = False
         self._is_build_singletons_required = False
+        self._is_lazy_context = False
+        self._compiled_factories: dict[tuple[Any, ...], Callable[[], Any]] = {}
+        self._registration_errors: Optional[list[Exception]] = None
         self._dependency_container_token: Any = DependencyContainer
 
-        if config is None:
-            config = DependencyContainerConfig()
-
         self._load_configs(config)
 
     def _load_configs(self, config: DependencyContainerConfig):
         if config.disable_default_resolve_lifecycle_strategies is False:
             self._dependency_resolver.set_default_resolve_lifecycle_strategies()
 
+        if config.cache_max_entries is not None:
+            self._dependency_resolver.add_resolve_lifecycle_strategy(LifecycleEnum.CACHED, ResolveCachedLifecycleStrategy(config.cache_max_entries))
+
         if config.disable_default_token_type_checkers is False:
             self._token_type_resolver.set_default_token_type_checkers()
 
@@ -104,6 +130,7 @@ class DependencyContainer:
             self._token_name_resolver.set_default_token_name_strategies()
 
         self._is_build_singletons_required = config.build_singletons_required
+        self._is_lazy_context = config.lazy_context
 
         if config.custom_dependency_container_token is not None:
             self._dependency_container_token = config.custom_dependency_container_token
@@ -116,44 +143,234 @@ class DependencyContainer:
 
         self._add_dependency(add_dependency_input)
 
+    def _get_token_names(self, dependency_id: tuple[int, ...]) -> list[str]:
+        token_names: list[str] = []
+
+        for token in self._token_store.get_tokens(dependency_id):
+            token_type = self._token_type_resolver.get_token_type(token)
+
+            token_names.append(self._token_name_resolver.get_token_name(token, token_type))
+
+        return token_names
+
     def _exception_handler_wrapper(self, callback: Callable):
         try:
             return callback()
         except BaseDependencyContainerException as err:
             return self._exception_handler.handle(err)
 
-    def _resolve_lifecycles(self, lifecycles: list[str]):
-        resolve_specific_lifecycles_command = ResolveSpecificLifecyclesCommand(lifecycles)
+    async def _async_exception_handler_wrapper(self, callback: Callable):
+        try:
+            return await callback()
+        except BaseDependencyContainerException as err:
+            return self._exception_handler.handle(err)
+
+    def _resolve_lifecycles(self, lifecycles: list[str], max_workers: Optional[int] = None, use_process_pool: bool = False):
+        resolve_specific_lifecycles_command = ResolveSpecificLifecyclesCommand(lifecycles, max_workers, use_process_pool)
 
         self._exception_handler_wrapper(lambda: self._resolve_specific_lifecycles_command_handler.handle(resolve_specific_lifecycles_command))
 
-    def build_singletons(self):
+    def build_singletons(self, max_workers: Optional[int] = None, use_process_pool: bool = False):
         """
         Builds resolving singleton lifecycle dependencies.
 
+        When `max_workers` or `use_process_pool` is given, singletons are grouped into dependency levels
+        and every level is constructed concurrently, so the build takes as long as its critical path.
+
+        Args:
+            max_workers (Optional[int]): Maximum number of workers constructing a level at once.
+            use_process_pool (bool): Whether to construct on a process pool instead of a thread pool.
+                Builders, class constructors, their dependencies and the built instances must be picklable.
+
+        Returns:
+            DependencyContainer: The built dependency container.
+        """
+        self._resolve_lifecycles([LifecycleEnum.SINGLETON], max_workers, use_process_pool)
+
+        self._is_singletons_built = True
+
+        self._compile()
+
+        return self
+
+    async def build_singletons_async(self):
+        """
+        Builds resolving singleton lifecycle dependencies, awaiting async builders.
+
+        Async builders of the same dependency level are awaited concurrently, each one bounded by
+        the timeout it was registered with.
+
         Returns:
             DependencyContainer: The built dependency container.
         """
-        self._resolve_lifecycles([LifecycleEnum.SINGLETON])
+        resolve_specific_lifecycles_command = ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON])
+
+        await self._async_exception_handler_wrapper(lambda: self._resolve_specific_lifecycles_command_handler.handle_async(resolve_specific_lifecycles_command))
 
         self._is_singletons_built = True
 
+        self._compile()
+
+        return self
+
+    def profile_build(self) -> BuildProfile:
+        """
+        Builds resolving singleton lifecycle dependencies one at a time, timing every construction.
+
+        Singletons already built are not constructed again, so they are missing from the profile.
+
+        Returns:
+            BuildProfile: The exclusive and inclusive construction time of every singleton in the
+                order they were built, and the critical path, the chain of dependencies that took the
+                longest to construct.
+        """
+        build_profiler = BuildProfiler(self._dependency_store)
+
+        self.add_observer(build_profiler)
+
+        start = perf_counter_ns()
+
+        try:
+            self.build_singletons()
+        finally:
+            total_ns = perf_counter_ns() - start
+
+            self.remove_observer(build_profiler)
+
+        return build_profiler.get_profile(total_ns)
+
+    def _compile_factories(self) -> dict[tuple[Any, ...], Callable[[], Any]]:
+        compiled_factories: dict[tuple[Any, ...], Callable[[], Any]] = {}
+
+        for dependency_id, compiled_factory in self._dependency_resolver.compile().items():
+            dependency_tokens = self._token_store.get_tokens(dependency_id)
+
+            compiled_factories[tuple(dependency_tokens)] = compiled_factory
+
+        return compiled_factories
+
+    def _compile(self):
+        self._compiled_factories = self._exception_handler_wrapper(self._compile_factories)
+
+    def compile(self):
+        """
+        Compiles every registered dependency into a prebuilt factory, so later retrievals
+        skip token lookup and recursive resolution. Any registration change discards the compiled factories.
+
+        Returns:
+            DependencyContainer: The compiled dependency container.
+
+        Raises:
+            ValueError: If singletons must be built before retrieving dependencies and they were not.
+        """
+        if self._is_singletons_built is False and self._is_build_singletons_required is True:
+            raise ValueError(
+                "Dependency container singletons not initialized. Please call the 'build_singletons()' method before compiling.",
+            )
+
+        self._compile()
+
         return self
 
-    def build_context(self):
+    def build_context(self, roots: Optional[list[Any]] = None):
         """
         Builds the container, resolving singleton and per context lifecycle dependencies.
 
+        In lazy context mode only `roots` and their dependencies are resolved, and any other per
+        context instance is constructed on its first retrieval and kept for the rest of the context.
+
+        Args:
+            roots (Optional[list[Any]]): Tokens of the dependencies to preload instead of every per context dependency.
+
         Returns:
             DependencyContainer: The built dependency container.
         """
+        if roots is not None:
+            for root in roots:
+                self.get_required_dependency(root)
+
+            return self
+
+        if self._is_lazy_context is True:
+            return self
+
         lifecycles = [LifecycleEnum.CONTEXT]
 
         self._resolve_lifecycles(lifecycles)
 
         return self
 
+    def context(self) -> ContextScope:
+        """
+        Opens a context scope. Per-context instances resolved inside it are disposed and released when it exits.
+
+        Usage:
+            with dependency_container.context():
+                dependency_container.build_context()
+
+        Returns:
+            ContextScope: The scope, entering it returns the dependency container.
+        """
+        return ContextScope(self._context_store, self, self._dependency_disposer)
+
+    def acontext(self) -> ContextScope:
+        """
+        Opens a context scope for `async with`. Per-context instances resolved inside it are disposed,
+        awaiting async disposers concurrently, and released when it exits.
+
+        Usage:
+            async with dependency_container.acontext():
+                await dependency_container.build_context_async()
+
+        Returns:
+            ContextScope: The scope, entering it returns the dependency container.
+        """
+        return ContextScope(self._context_store, self, self._dependency_disposer)
+
+    async def build_context_async(self, roots: Optional[list[Any]] = None):
+        """
+        Builds the current context, resolving per context lifecycle dependencies and awaiting async builders.
+
+        In lazy context mode only `roots` and their dependencies are resolved.
+
+        Args:
+            roots (Optional[list[Any]]): Tokens of the dependencies to preload instead of every per context dependency.
+
+        Returns:
+            DependencyContainer: The built dependency container.
+        """
+        if roots is not None:
+            for root in roots:
+                await self._retrieve_dependency_async(_RetrieveDependencyInput(dependency_token=root, required=True))
+
+            return self
+
+        if self._is_lazy_context is True:
+            return self
+
+        resolve_specific_lifecycles_command = ResolveSpecificLifecyclesCommand([LifecycleEnum.CONTEXT])
+
+        await self._async_exception_handler_wrapper(lambda: self._resolve_specific_lifecycles_command_handler.handle_async(resolve_specific_lifecycles_command))
+
+        return self
+
+    def _reject_registration(self, error: Exception):
+        if self._registration_errors is None:
+            raise error
+
+        self._registration_errors.append(error)
+
     def _add_dependency(self, input_data: _AddDependencyInput):
+        if self._registration_errors is None:
+            self._register_dependency(input_data)
+            return
+
+        try:
+            self._register_dependency(input_data)
+        except Exception as err:
+            self._registration_errors.append(err)
+
+    def _register_dependency(self, input_data: _AddDependencyInput):
         dependency_token = input_data.dependency_token or input_data.class_constructor
 
         if dependency_token is None:
@@ -162,17 +379,72 @@ class DependencyContainer:
         if input_data.check_qualifier is True and len(input_data.qualifier_tokens) == 0:
             raise ValueError("Missing qualifier tokens.")
 
+        self._compiled_factories = {}
+
         add_dependency_command_input = AddDependencyCommand(
             [dependency_token, *input_data.qualifier_tokens],
             input_data.lifecycle,
             input_data.class_constructor,
             input_data.builder,
             input_data.instance,
+            input_data.is_async_builder,
+            input_data.builder_timeout,
+            input_data.pool_max_size,
+            input_data.pool_timeout,
+            input_data.cache_ttl,
         )
 
         self._exception_handler_wrapper(lambda: self._add_dependency_command_handler.handle(add_dependency_command_input))
 
-    def _retrieve_dependency(self, input_data: _RetrieveDependencyInput):
+    @contextmanager
+    def batch(self) -> Iterator["DependencyContainer"]:
+        """
+        Registers dependencies in bulk. Inside the block the dependency order is not maintained on
+        every registration, and failed registrations do not stop the others. On exit the order is
+        rebuilt once, checking the whole graph for cycles, and every error is raised together. When the
+        block raises, its error is raised along with the registration errors collected before it.
+
+        Usage:
+            with dependency_container.batch():
+                dependency_container.add_singleton(Service)
+                dependency_container.add_transient(Repository)
+
+        Returns:
+            Iterator[DependencyContainer]: The block, entering it returns the dependency container.
+
+        Raises:
+            ExceptionGroup: The errors of the failed registrations and the graph check.
+        """
+        if self._registration_errors is not None:
+            yield self
+            return
+
+        self._registration_errors = []
+        self._dependency_store.invalidate_sorted_dependencies_ids()
+
+        try:
+            yield self
+        except Exception as err:
+            if len(self._registration_errors) > 0:
+                # The errors collected before the block failed are raised along with its error.
+                block_errors = [*self._registration_errors, err]
+
+                raise ExceptionGroup(f"{len(block_errors)} dependency registration errors.", block_errors) from None
+
+            raise
+        finally:
+            registration_errors = self._registration_errors
+            self._registration_errors = None
+
+        try:
+            self._exception_handler_wrapper(self._dependency_store.get_sorted_dependencies_ids)
+        except Exception as err:
+            registration_errors.append(err)
+
+        if len(registration_errors) > 0:
+            raise ExceptionGroup(f"{len(registration_errors)} dependency registration errors.", registration_errors)
+
+    def _validate_retrieve_dependency_input(self, input_data: _RetrieveDependencyInput):
         if input_data.dependency_token is None:
             raise ValueError("Missing dependency token.")
 
@@ -184,6 +456,9 @@ class DependencyContainer:
                 "Dependency container singletons not initialized. Please call the 'build_singletons()' method before attempting to retrieve dependencies.",
             )
 
+    def _retrieve_dependency(self, input_data: _RetrieveDependencyInput):
+        self._validate_retrieve_dependency_input(input_data)
+
         resolve_dependency_command_input = ResolveDependencyCommand(
             tokens=[input_data.dependency_token, *input_data.qualifier_tokens],
             required=input_data.required,
@@ -197,6 +472,22 @@ class DependencyContainer:
 
         return dependency_instance
 
+    async def _retrieve_dependency_async(self, input_data: _RetrieveDependencyInput):
+        self._validate_retrieve_dependency_input(input_data)
+
+        resolve_dependency_command_input = ResolveDependencyCommand(
+            tokens=[input_data.dependency_token, *input_data.qualifier_tokens],
+            required=input_data.required,
+        )
+
+        dependency_instance = await self._async_exception_handler_wrapper(
+            lambda: self._resolve_dependency_command_handler.handle_async(
+                resolve_dependency_command_input,
+            ),
+        )
+
+        return dependency_instance
+
     def delete_dependency(
         self,
         dependency_token: Any,
@@ -209,6 +500,8 @@ class DependencyContainer:
             dependency_token (Any): The dependency token to remove.
             qualifier_token (Optional[Any]): A token used to distinguish different constructors of the same dependency.
         """
+        self._compiled_factories = {}
+
         dependency_id = self._token_store.retrieve_or_create_dependency_id_by_tokens([dependency_token, qualifier_token])
 
         self._dependency_store.delete_dependency(dependency_id)
@@ -216,6 +509,84 @@ class DependencyContainer:
         for token in [dependency_token, qualifier_token]:
             self._token_store.delete_token(token)
 
+    def dispose(self):
+        """
+        Disposes the singletons built by the container and the idle pooled instances in reverse
+        dependency order, calling their `dispose()` or `close()` method or exiting them as context
+        managers. Instances added with `add_singleton_instance` are left to their owner. Instances
+        only disposable asynchronously require `adispose()`.
+
+        Disposed singletons are released, so building singletons again constructs new ones.
+
+        Returns:
+            DependencyContainer: The disposed dependency container.
+        """
+        self._compiled_factories = {}
+        self._is_singletons_built = False
+
+        self._exception_handler_wrapper(self._dependency_disposer.dispose_singletons)
+
+        return self
+
+    async def adispose(self):
+        """
+        Disposes the singletons built by the container and the idle pooled instances in reverse
+        dependency order, awaiting their `adispose()` or `aclose()` method or exiting them as async
+        context managers. Instances of the same dependency level are disposed concurrently.
+
+        Returns:
+            DependencyContainer: The disposed dependency container.
+        """
+        self._compiled_factories = {}
+        self._is_singletons_built = False
+
+        await self._async_exception_handler_wrapper(self._dependency_disposer.adispose_singletons)
+
+        return self
+
+    def _update_observed_resolution(self):
+        if self._observer_dispatcher.has_observers() is True:
+            self._dependency_resolver.set_observer_dispatcher(self._observer_dispatcher)
+        else:
+            self._dependency_resolver.set_observer_dispatcher(None)
+
+        # Compiled factories are rebuilt, so observation is compiled in or out of them.
+        if len(self._compiled_factories) > 0:
+            self._compile()
+
+    def add_observer(self, observer: BaseDependencyObserver):
+        """
+        Registers an observer notified when dependencies are resolved and constructed. Without
+        observers, resolution and compiled factories run without any instrumentation.
+
+        Args:
+            observer (BaseDependencyObserver): The observer to notify.
+
+        Returns:
+            DependencyContainer: The dependency container.
+        """
+        self._observer_dispatcher.add_observer(observer)
+
+        self._update_observed_resolution()
+
+        return self
+
+    def remove_observer(self, observer: BaseDependencyObserver):
+        """
+        Unregisters an observer.
+
+        Args:
+            observer (BaseDependencyObserver): The observer to stop notifying.
+
+        Returns:
+            DependencyContainer: The dependency container.
+        """
+        self._observer_dispatcher.remove_observer(observer)
+
+        self._update_observed_resolution()
+
+        return self
+
     def reset(self):
         """
         Resets the dependency container, clearing all stored dependencies.
@@ -223,30 +594,36 @@ class DependencyContainer:
         self._token_store.reset()
         self._dependency_store.reset()
         self._is_singletons_built = False
+        self._compiled_factories = {}
+
+    def _get_singleton_lifecycle(self, lazy: bool) -> LifecycleEnum:
+        return LifecycleEnum.LAZY_SINGLETON if lazy is True else LifecycleEnum.SINGLETON
 
-    def add_singleton_builder(self, dependency_token: Any, builder: Callable):
+    def add_singleton_builder(self, dependency_token: Any, builder: Callable, lazy: bool = False):
         """
         Registers a singleton dependency using a builder function.
 
         Args:
             dependency_token (Any): The token representing the dependency.
             builder (Callable): A function that builds the dependency instance.
+            lazy (bool): Whether to inject a proxy that only builds the dependency on first use.
 
         Raises:
             ValueError: If the builder function is not provided.
         """
         if builder is None:
-            raise ValueError("Missing builder function.")
+            self._reject_registration(ValueError("Missing builder function."))
+            return
 
         add_dependency_input = _AddDependencyInput(
-            lifecycle=LifecycleEnum.SINGLETON,
+            lifecycle=self._get_singleton_lifecycle(lazy),
             dependency_token=dependency_token,
             builder=builder,
         )
 
         self._add_dependency(add_dependency_input)
 
-    def add_mapped_singleton_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable):
+    def add_mapped_singleton_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable, lazy: bool = False):
         """
         Registers a mapped singleton dependency using a builder function.
 
@@ -254,9 +631,64 @@ class DependencyContainer:
             dependency_token (Any): The token representing the dependency.
             qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
             builder (Callable): A function that builds the dependency instance.
+            lazy (bool): Whether to inject a proxy that only builds the dependency on first use.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=self._get_singleton_lifecycle(lazy),
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_async_singleton_builder(self, dependency_token: Any, builder: Callable, timeout: Optional[float] = None):
+        """
+        Registers a singleton dependency using an async builder function, awaited by `build_singletons_async()`.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            builder (Callable): An async function that builds the dependency instance.
+            timeout (Optional[float]): Seconds to wait for the builder before failing.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.SINGLETON,
+            dependency_token=dependency_token,
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_async_singleton_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable, timeout: Optional[float] = None):
+        """
+        Registers a mapped singleton dependency using an async builder function, awaited by `build_singletons_async()`.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            builder (Callable): An async function that builds the dependency instance.
+            timeout (Optional[float]): Seconds to wait for the builder before failing.
+
+        Raises:
+            ValueError: If the builder function is not provided.
         """
         if builder is None:
-            raise ValueError("Missing builder function.")
+            self._reject_registration(ValueError("Missing builder function."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.SINGLETON,
@@ -264,6 +696,8 @@ class DependencyContainer:
             check_qualifier=True,
             qualifier_tokens=[qualifier_token],
             builder=builder,
+            is_async_builder=True,
+            builder_timeout=timeout,
         )
 
         self._add_dependency(add_dependency_input)
@@ -284,7 +718,8 @@ class DependencyContainer:
             ValueError: If the instance is not provided.
         """
         if instance is None:
-            raise ValueError("Missing instance.")
+            self._reject_registration(ValueError("Missing instance."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.SINGLETON,
@@ -312,7 +747,8 @@ class DependencyContainer:
             ValueError: If the instance is not provided.
         """
         if instance is None:
-            raise ValueError("Missing instance.")
+            self._reject_registration(ValueError("Missing instance."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.SINGLETON,
@@ -325,14 +761,14 @@ class DependencyContainer:
         self._add_dependency(add_dependency_input)
 
     @overload
-    def add_singleton(self, dependency_token: Callable):
+    def add_singleton(self, dependency_token: Callable, *, lazy: bool = False):
         pass
 
     @overload
-    def add_singleton(self, dependency_token: Any, class_constructor: Callable):
+    def add_singleton(self, dependency_token: Any, class_constructor: Callable, lazy: bool = False):
         pass
 
-    def add_singleton(self, dependency_token: Any, class_constructor: Optional[Callable] = None):
+    def add_singleton(self, dependency_token: Any, class_constructor: Optional[Callable] = None, lazy: bool = False):
         """
         Registers a singleton dependency in the container.
 
@@ -345,12 +781,13 @@ class DependencyContainer:
             class_constructor (Optional[Callable]):
                 A callable class constructor used to instantiate the dependency. If not provided,
                 `dependency_token` is used as the constructor.
+            lazy (bool): Whether to inject a proxy that only builds the dependency on first use.
         """
         if class_constructor is None:
             class_constructor = dependency_token
 
         add_dependency_input = _AddDependencyInput(
-            lifecycle=LifecycleEnum.SINGLETON,
+            lifecycle=self._get_singleton_lifecycle(lazy),
             dependency_token=dependency_token,
             class_constructor=class_constructor,
         )
@@ -362,6 +799,7 @@ class DependencyContainer:
         dependency_token: Any,
         qualifier_token: Any,
         class_constructor: Optional[Callable] = None,
+        lazy: bool = False,
     ):
         """
         Registers a mapped singleton dependency in the container.
@@ -370,12 +808,13 @@ class DependencyContainer:
             dependency_token (Any): The token representing the dependency.
             qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
             class_constructor (Callable): A callable class constructor used to instantiate the dependency.
+            lazy (bool): Whether to inject a proxy that only builds the dependency on first use.
         """
         if class_constructor is None:
             class_constructor = dependency_token
 
         add_dependency_input = _AddDependencyInput(
-            lifecycle=LifecycleEnum.SINGLETON,
+            lifecycle=self._get_singleton_lifecycle(lazy),
             dependency_token=dependency_token,
             check_qualifier=True,
             qualifier_tokens=[qualifier_token],
@@ -396,7 +835,8 @@ class DependencyContainer:
             ValueError: If the builder function is not provided.
         """
         if builder is None:
-            raise ValueError("Missing builder function.")
+            self._reject_registration(ValueError("Missing builder function."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.TRANSIENT,
@@ -419,7 +859,61 @@ class DependencyContainer:
             ValueError: If the builder function is not provided.
         """
         if builder is None:
-            raise ValueError("Missing builder function.")
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.TRANSIENT,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_async_transient_builder(self, dependency_token: Any, builder: Callable, timeout: Optional[float] = None):
+        """
+        Registers a transient dependency using an async builder function, resolved with `aget_dependency()`.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            builder (Callable): An async function that builds and returns a new instance.
+            timeout (Optional[float]): Seconds to wait for the builder before failing.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.TRANSIENT,
+            dependency_token=dependency_token,
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_async_transient_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable, timeout: Optional[float] = None):
+        """
+        Registers a mapped transient dependency using an async builder function, resolved with `aget_mapped_dependency()`.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different instances of the same dependency.
+            builder (Callable): An async function that builds and returns a new instance.
+            timeout (Optional[float]): Seconds to wait for the builder before failing.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.TRANSIENT,
@@ -427,6 +921,8 @@ class DependencyContainer:
             check_qualifier=True,
             qualifier_tokens=[qualifier_token],
             builder=builder,
+            is_async_builder=True,
+            builder_timeout=timeout,
         )
 
         self._add_dependency(add_dependency_input)
@@ -503,7 +999,8 @@ class DependencyContainer:
             ValueError: If the builder function is not provided.
         """
         if builder is None:
-            raise ValueError("Missing builder function.")
+            self._reject_registration(ValueError("Missing builder function."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.CONTEXT,
@@ -526,7 +1023,8 @@ class DependencyContainer:
             ValueError: If the builder function is not provided.
         """
         if builder is None:
-            raise ValueError("Missing builder function.")
+            self._reject_registration(ValueError("Missing builder function."))
+            return
 
         add_dependency_input = _AddDependencyInput(
             lifecycle=LifecycleEnum.CONTEXT,
@@ -538,6 +1036,61 @@ class DependencyContainer:
 
         self._add_dependency(add_dependency_input)
 
+    def add_async_per_context_builder(self, dependency_token: Any, builder: Callable, timeout: Optional[float] = None):
+        """
+        Registers a per-context dependency using an async builder function, awaited by `build_context_async()`.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            builder (Callable): An async function that builds and returns a new instance per context.
+            timeout (Optional[float]): Seconds to wait for the builder before failing.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CONTEXT,
+            dependency_token=dependency_token,
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_async_per_context_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable, timeout: Optional[float] = None):
+        """
+        Registers a mapped per-context dependency using an async builder function, awaited by `build_context_async()`.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            builder (Callable): An async function that builds and returns a new instance per context.
+            timeout (Optional[float]): Seconds to wait for the builder before failing.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CONTEXT,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
     @overload
     def add_per_context(self, dependency_token: Callable):
         pass
@@ -598,6 +1151,370 @@ class DependencyContainer:
 
         self._add_dependency(add_dependency_input)
 
+    def add_per_thread_builder(self, dependency_token: Any, builder: Callable):
+        """
+        Registers a per-thread dependency using a builder function.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            builder (Callable): A function that builds and returns a new instance per thread.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token=dependency_token,
+            builder=builder,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_per_thread_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable):
+        """
+        Registers a mapped per-thread dependency using a builder function.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            builder (Callable): A function that builds and returns a new instance per thread.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    @overload
+    def add_per_thread(self, dependency_token: Callable):
+        pass
+
+    @overload
+    def add_per_thread(self, dependency_token: Any, class_constructor: Callable):
+        pass
+
+    def add_per_thread(self, dependency_token: Any, class_constructor: Optional[Callable] = None):
+        """
+        Registers a per-thread dependency in the container. Each thread gets its own instance,
+        disposed once the thread exits.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            class_constructor (Optional[Callable]):
+                A callable class constructor used to instantiate the dependency. If not provided,
+                `dependency_token` is used as the constructor.
+        """
+        if class_constructor is None:
+            class_constructor = dependency_token
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token=dependency_token,
+            class_constructor=class_constructor,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_per_thread(
+        self,
+        dependency_token: Any,
+        qualifier_token: Any,
+        class_constructor: Optional[Callable] = None,
+    ):
+        """
+        Registers a mapped per-thread dependency in the container.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            class_constructor (Callable): A callable class constructor used to instantiate the dependency.
+        """
+        if class_constructor is None:
+            class_constructor = dependency_token
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            class_constructor=class_constructor,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_cached_builder(self, dependency_token: Any, builder: Callable, ttl: Optional[float] = None):
+        """
+        Registers a cached dependency using a builder function.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            builder (Callable): A function that builds and returns a new instance once the cached one expires.
+            ttl (Optional[float]): Seconds a built instance is reused for, or None to keep it until invalidated or evicted.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token=dependency_token,
+            builder=builder,
+            cache_ttl=ttl,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_cached_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable, ttl: Optional[float] = None):
+        """
+        Registers a mapped cached dependency using a builder function. Each qualifier is cached separately.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            builder (Callable): A function that builds and returns a new instance once the cached one expires.
+            ttl (Optional[float]): Seconds a built instance is reused for, or None to keep it until invalidated or evicted.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+            cache_ttl=ttl,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    @overload
+    def add_cached(self, dependency_token: Callable, *, ttl: Optional[float] = None):
+        pass
+
+    @overload
+    def add_cached(self, dependency_token: Any, class_constructor: Callable, ttl: Optional[float] = None):
+        pass
+
+    def add_cached(self, dependency_token: Any, class_constructor: Optional[Callable] = None, ttl: Optional[float] = None):
+        """
+        Registers a cached dependency in the container. A built instance is reused until its time
+        to live expires, it is evicted or `invalidate_cached()` drops it, then the next retrieval
+        builds a new one.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            class_constructor (Optional[Callable]):
+                A callable class constructor used to instantiate the dependency. If not provided,
+                `dependency_token` is used as the constructor.
+            ttl (Optional[float]): Seconds a built instance is reused for, or None to keep it until invalidated or evicted.
+        """
+        if class_constructor is None:
+            class_constructor = dependency_token
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token=dependency_token,
+            class_constructor=class_constructor,
+            cache_ttl=ttl,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_cached(
+        self,
+        dependency_token: Any,
+        qualifier_token: Any,
+        class_constructor: Optional[Callable] = None,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Registers a mapped cached dependency in the container. Each qualifier is cached separately.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            class_constructor (Callable): A callable class constructor used to instantiate the dependency.
+            ttl (Optional[float]): Seconds a built instance is reused for, or None to keep it until invalidated or evicted.
+        """
+        if class_constructor is None:
+            class_constructor = dependency_token
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            class_constructor=class_constructor,
+            cache_ttl=ttl,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def invalidate_cached(self, dependency_token: Optional[Any] = None, qualifier_token: Optional[Any] = None):
+        """
+        Drops cached instances, so the next retrieval builds a new one.
+
+        Args:
+            dependency_token (Optional[Any]): The token of the cached dependency to drop, or None to drop every cached dependency.
+            qualifier_token (Optional[Any]): A token used to distinguish different constructors of the same dependency.
+        """
+        if dependency_token is None:
+            self._dependency_resolver.invalidate_cached()
+            return
+
+        dependency_id = self._token_store.retrieve_or_create_dependency_id_by_tokens([dependency_token, qualifier_token])
+
+        self._dependency_resolver.invalidate_cached(dependency_id)
+
+    def add_pooled_builder(self, dependency_token: Any, builder: Callable, max_size: int = 10, timeout: Optional[float] = None):
+        """
+        Registers a pooled dependency using a builder function. Each context scope checks an
+        instance out of the pool on first use and returns it when the scope exits.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            builder (Callable): A function that builds and returns a new pooled instance.
+            max_size (int): Maximum number of instances existing at once.
+            timeout (Optional[float]): Seconds to wait for an instance once every one is checked out, or None to wait indefinitely.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token=dependency_token,
+            builder=builder,
+            pool_max_size=max_size,
+            pool_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_pooled_builder(self, dependency_token: Any, qualifier_token: Any, builder: Callable, max_size: int = 10, timeout: Optional[float] = None):
+        """
+        Registers a mapped pooled dependency using a builder function.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            builder (Callable): A function that builds and returns a new pooled instance.
+            max_size (int): Maximum number of instances existing at once.
+            timeout (Optional[float]): Seconds to wait for an instance once every one is checked out, or None to wait indefinitely.
+
+        Raises:
+            ValueError: If the builder function is not provided.
+        """
+        if builder is None:
+            self._reject_registration(ValueError("Missing builder function."))
+            return
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+            pool_max_size=max_size,
+            pool_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    @overload
+    def add_pooled(self, dependency_token: Callable, *, max_size: int = 10, timeout: Optional[float] = None):
+        pass
+
+    @overload
+    def add_pooled(self, dependency_token: Any, class_constructor: Callable, max_size: int = 10, timeout: Optional[float] = None):
+        pass
+
+    def add_pooled(self, dependency_token: Any, class_constructor: Optional[Callable] = None, max_size: int = 10, timeout: Optional[float] = None):
+        """
+        Registers a pooled dependency in the container. Each context scope checks an instance out
+        of the pool on first use and returns it when the scope exits, so expensive instances that
+        are not thread-safe are reused without being shared.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            class_constructor (Optional[Callable]):
+                A callable class constructor used to instantiate the dependency. If not provided,
+                `dependency_token` is used as the constructor.
+            max_size (int): Maximum number of instances existing at once.
+            timeout (Optional[float]): Seconds to wait for an instance once every one is checked out, or None to wait indefinitely.
+        """
+        if class_constructor is None:
+            class_constructor = dependency_token
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token=dependency_token,
+            class_constructor=class_constructor,
+            pool_max_size=max_size,
+            pool_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
+    def add_mapped_pooled(
+        self,
+        dependency_token: Any,
+        qualifier_token: Any,
+        class_constructor: Optional[Callable] = None,
+        max_size: int = 10,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Registers a mapped pooled dependency in the container.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+            class_constructor (Callable): A callable class constructor used to instantiate the dependency.
+            max_size (int): Maximum number of instances existing at once.
+            timeout (Optional[float]): Seconds to wait for an instance once every one is checked out, or None to wait indefinitely.
+        """
+        if class_constructor is None:
+            class_constructor = dependency_token
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            class_constructor=class_constructor,
+            pool_max_size=max_size,
+            pool_timeout=timeout,
+        )
+
+        self._add_dependency(add_dependency_input)
+
     def get_dependency(self, dependency_token: Any):
         """
         Retrieves a dependency from the container.
@@ -608,6 +1525,11 @@ class DependencyContainer:
         Returns:
             Any: The resolved dependency instance.
         """
+        compiled_factory = self._compiled_factories.get((dependency_token,))
+
+        if compiled_factory is not None:
+            return self._exception_handler_wrapper(compiled_factory)
+
         retrieve_dependency_input = _RetrieveDependencyInput(
             dependency_token=dependency_token,
         )
@@ -627,6 +1549,11 @@ class DependencyContainer:
         Raises:
             KeyError: If the dependency is not found.
         """
+        compiled_factory = self._compiled_factories.get((dependency_token,))
+
+        if compiled_factory is not None:
+            return self._exception_handler_wrapper(compiled_factory)
+
         retrieve_dependency_input = _RetrieveDependencyInput(dependency_token=dependency_token, required=True)
 
         return self._retrieve_dependency(retrieve_dependency_input)
@@ -642,6 +1569,11 @@ class DependencyContainer:
         Returns:
             Any: The resolved dependency instance.
         """
+        compiled_factory = self._compiled_factories.get((dependency_token, qualifier_token))
+
+        if compiled_factory is not None:
+            return self._exception_handler_wrapper(compiled_factory)
+
         retrieve_dependency_input = _RetrieveDependencyInput(
             dependency_token=dependency_token,
             check_qualifier=True,
@@ -664,6 +1596,11 @@ class DependencyContainer:
         Raises:
             KeyError: If the dependency is not found.
         """
+        compiled_factory = self._compiled_factories.get((dependency_token, qualifier_token))
+
+        if compiled_factory is not None:
+            return self._exception_handler_wrapper(compiled_factory)
+
         retrieve_dependency_input = _RetrieveDependencyInput(
             dependency_token=dependency_token,
             check_qualifier=True,
@@ -672,3 +1609,41 @@ class DependencyContainer:
         )
 
         return self._retrieve_dependency(retrieve_dependency_input)
+
+    async def aget_dependency(self, dependency_token: Any):
+        """
+        Retrieves a dependency from the container, awaiting the async builders it depends on.
+
+        Async builders reachable from the dependency are awaited concurrently, and per-context
+        instances are stored in the caller's context.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+
+        Returns:
+            Any: The resolved dependency instance.
+        """
+        retrieve_dependency_input = _RetrieveDependencyInput(
+            dependency_token=dependency_token,
+        )
+
+        return await self._retrieve_dependency_async(retrieve_dependency_input)
+
+    async def aget_mapped_dependency(self, dependency_token: Any, qualifier_token: Any):
+        """
+        Retrieves a mapped dependency, awaiting the async builders it depends on.
+
+        Args:
+            dependency_token (Any): The token representing the dependency.
+            qualifier_token (Any): A token used to distinguish different constructors of the same dependency.
+
+        Returns:
+            Any: The resolved dependency instance.
+        """
+        retrieve_dependency_input = _RetrieveDependencyInput(
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+        )
+
+        return await self._retrieve_dependency_async(retrieve_dependency_input)
@@ -1,5 +1,6 @@
 from typing import Any, Optional
 from dataclasses import dataclass, field
+from .context.base_context_store import BaseContextStore
 
 
 @dataclass
@@ -18,6 +19,12 @@ class DependencyContainerConfig:
             Whether to disable build requirement.
         custom_dependency_container_token (Optional[Any]):
             Custom token for dependency container.
+        custom_context_store (Optional[BaseContextStore]):
+            Custom storage for per context instances, such as `ScopedContextStore`.
+        lazy_context (Optional[bool]):
+            Whether `build_context()` skips eager resolution, constructing per context instances on first retrieval.
+        cache_max_entries (Optional[int]):
+            Maximum number of cached lifecycle dependencies kept at once, evicting the least recently used.
     """
 
     disable_default_resolve_lifecycle_strategies: Optional[bool] = field(default=False)
@@ -25,3 +32,6 @@ class DependencyContainerConfig:
     disable_default_token_name_strategies: Optional[bool] = field(default=False)
     build_singletons_required: Optional[bool] = field(default=False)
     custom_dependency_container_token: Optional[Any] = None
+    custom_context_store: Optional[BaseContextStore] = None
+    lazy_context: Optional[bool] = field(default=False)
+    cache_max_entries: Optional[int] = None
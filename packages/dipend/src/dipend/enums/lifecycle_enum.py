@@ -5,3 +5,7 @@ class LifecycleEnum(Enum):
     SINGLETON = "SINGLETON"
     TRANSIENT = "TRANSIENT"
     CONTEXT = "CONTEXT"
+    LAZY_SINGLETON = "LAZY_SINGLETON"
+    POOLED = "POOLED"
+    THREAD = "THREAD"
+    CACHED = "CACHED"
@@ -0,0 +1,6 @@
+from .base_dependency_container_exception import BaseDependencyContainerException
+
+
+class AsyncBuilderTimeoutException(BaseDependencyContainerException):
+    def __init__(self, dependency_ids: list[tuple[int, ...]]):
+        super().__init__(dependency_ids, "Async builder timed out")
@@ -1,4 +1,4 @@
 class BaseDependencyContainerException(BaseException):
-    def __init__(self, dependency_ids: list[str], message: str):
+    def __init__(self, dependency_ids: list[tuple[int, ...]], message: str):
         super().__init__(message)
         self.dependency_ids = dependency_ids
@@ -2,5 +2,5 @@ from .base_dependency_container_exception import BaseDependencyContainerExceptio
 
 
 class CanNotConstructDependencyException(BaseDependencyContainerException):
-    def __init__(self, dependency_ids: list[str]):
+    def __init__(self, dependency_ids: list[tuple[int, ...]]):
         super().__init__(dependency_ids, "Can not construct dependency")
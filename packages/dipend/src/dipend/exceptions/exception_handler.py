@@ -19,7 +19,7 @@ class ExceptionHandler(HandlerInterface[BaseDependencyContainerException, None])
     def _create_error_message(self, token_name: str, description: str):
         return f"error: {description} - caused by: [{token_name}]"
 
-    def _get_token_names(self, dependency_ids: list[str]) -> list[str]:
+    def _get_token_names(self, dependency_ids: list[tuple[int, ...]]) -> list[str]:
         token_names: list[str] = []
 
         for dependency_id in dependency_ids:
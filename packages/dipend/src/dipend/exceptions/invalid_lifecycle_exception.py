@@ -2,5 +2,5 @@ from .base_dependency_container_exception import BaseDependencyContainerExceptio
 
 
 class InvalidLifecycleException(BaseDependencyContainerException):
-    def __init__(self, dependency_ids: list[str], lifecycle_policy: str):
+    def __init__(self, dependency_ids: list[tuple[int, ...]], lifecycle_policy: str):
         super().__init__(dependency_ids, "Invalid lifecycle: " + lifecycle_policy)
@@ -0,0 +1,6 @@
+from .base_dependency_container_exception import BaseDependencyContainerException
+
+
+class MissingContextScopeException(BaseDependencyContainerException):
+    def __init__(self, dependency_ids: list[tuple[int, ...]]):
+        super().__init__(dependency_ids, "Dependency must be resolved inside a context scope")
@@ -0,0 +1,39 @@
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Optional
+
+
+SYNC_DISPOSE_METHODS = ["dispose", "close"]
+
+ASYNC_DISPOSE_METHODS = ["adispose", "aclose"]
+
+
+class DisposeHelper:
+    @staticmethod
+    def get_sync_disposer(instance: Any) -> Optional[Callable[[], Any]]:
+        for method_name in SYNC_DISPOSE_METHODS:
+            method = getattr(instance, method_name, None)
+
+            if callable(method) and not iscoroutinefunction(method):
+                return method
+
+        exit_method = getattr(instance, "__exit__", None)
+
+        if callable(exit_method):
+            return lambda: exit_method(None, None, None)
+
+        return None
+
+    @staticmethod
+    def get_async_disposer(instance: Any) -> Optional[Callable[[], Any]]:
+        for method_name in ASYNC_DISPOSE_METHODS:
+            method = getattr(instance, method_name, None)
+
+            if callable(method):
+                return method
+
+        exit_method = getattr(instance, "__aexit__", None)
+
+        if callable(exit_method):
+            return lambda: exit_method(None, None, None)
+
+        return None
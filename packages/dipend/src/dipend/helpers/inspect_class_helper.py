@@ -1,12 +1,80 @@
 import inspect
-from typing import Callable
+from typing import Any, Callable, NewType, TypeVar, get_origin
+from weakref import WeakKeyDictionary
 
 
 class InspectClassHelper:
+    # Classes are inspected once per process, and the entry goes away with the class.
+    _constructor_dependencies_cache: WeakKeyDictionary[Callable, tuple[Any, ...]] = WeakKeyDictionary()
+
+    @staticmethod
+    def _get_annotation_namespaces(class_constructor: Callable) -> tuple[dict[str, Any], dict[str, Any]]:
+        if not isinstance(class_constructor, type):
+            return getattr(inspect.unwrap(class_constructor), "__globals__", {}), {}
+
+        constructor = inspect.unwrap(getattr(class_constructor, "__init__"))
+
+        return getattr(constructor, "__globals__", {}), dict(vars(class_constructor))
+
     @staticmethod
-    def get_constructor_dependencies(class_constructor: Callable):
-        class_signature = inspect.signature(class_constructor)
+    def _is_type(value: Any) -> bool:
+        return isinstance(value, (type, TypeVar, NewType)) or get_origin(value) is not None
 
-        class_args = [parameter.annotation for parameter in class_signature.parameters.values()]
+    @staticmethod
+    def _resolve_annotation(annotation: Any, global_namespace: dict[str, Any], local_namespace: dict[str, Any]) -> tuple[Any, bool]:
+        """
+        Evaluates a string annotation like typing.get_type_hints, returning the token and whether it is
+        final. Strings that do not evaluate to a class or typing construct are kept as the token.
+        """
+        if not isinstance(annotation, str):
+            return annotation, True
+
+        try:
+            resolved_annotation = eval(annotation, global_namespace, local_namespace)
+        except (NameError, AttributeError):
+            # Names defined later in the module may resolve on a later inspection.
+            return annotation, False
+        except (SyntaxError, TypeError):
+            return annotation, True
+
+        # Quoted annotations in modules with postponed evaluation evaluate to their inner string.
+        if isinstance(resolved_annotation, str) and resolved_annotation != annotation:
+            return InspectClassHelper._resolve_annotation(resolved_annotation, global_namespace, local_namespace)
+
+        if InspectClassHelper._is_type(resolved_annotation) is False:
+            return annotation, True
+
+        return resolved_annotation, True
+
+    @staticmethod
+    def _inspect_constructor_dependencies(class_constructor: Callable) -> tuple[tuple[Any, ...], bool]:
+        parameters = inspect.signature(class_constructor).parameters.values()
+
+        if not any(isinstance(parameter.annotation, str) for parameter in parameters):
+            return tuple(parameter.annotation for parameter in parameters), True
+
+        global_namespace, local_namespace = InspectClassHelper._get_annotation_namespaces(class_constructor)
+        resolved_annotations = [InspectClassHelper._resolve_annotation(parameter.annotation, global_namespace, local_namespace) for parameter in parameters]
+
+        return tuple(annotation for annotation, _ in resolved_annotations), all(is_final for _, is_final in resolved_annotations)
+
+    @staticmethod
+    def get_constructor_dependencies(class_constructor: Callable) -> tuple[Any, ...]:
+        try:
+            class_args = InspectClassHelper._constructor_dependencies_cache.get(class_constructor)
+        except TypeError:
+            # Callables that can not be weakly referenced are inspected every time.
+            return InspectClassHelper._inspect_constructor_dependencies(class_constructor)[0]
+
+        if class_args is None:
+            class_args, is_final = InspectClassHelper._inspect_constructor_dependencies(class_constructor)
+
+            # Forward references still missing are inspected again until they resolve.
+            if is_final is True:
+                InspectClassHelper._constructor_dependencies_cache[class_constructor] = class_args
 
         return class_args
+
+    @staticmethod
+    def clear_cache():
+        InspectClassHelper._constructor_dependencies_cache.clear()
@@ -0,0 +1,24 @@
+from .dependency_event import DependencyEvent
+
+
+class BaseDependencyObserver:
+    """
+    Receives resolution and construction events. Every hook does nothing by default, so observers
+    only override the ones they need. End events carry the elapsed nanoseconds and the error raised, if any.
+
+    Resolve events are only reported for the dependency requested from the container, the walk over
+    its constructor dependencies is covered by that one event. Construct events are reported for
+    every dependency built, so they show where resolution time goes.
+    """
+
+    def on_resolve_start(self, event: DependencyEvent):
+        pass
+
+    def on_resolve_end(self, event: DependencyEvent):
+        pass
+
+    def on_construct_start(self, event: DependencyEvent):
+        pass
+
+    def on_construct_end(self, event: DependencyEvent):
+        pass
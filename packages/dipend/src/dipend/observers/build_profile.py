@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class DependencyBuildTiming:
+    dependency_id: tuple[int, ...]
+    token_names: list[str]
+    order: int
+    exclusive_ns: int
+    inclusive_ns: int
+    dependencies_ids: list[tuple[int, ...]] = field(default_factory=lambda: [])
+
+
+@dataclass
+class BuildProfile:
+    timings: list[DependencyBuildTiming]
+    critical_path: list[DependencyBuildTiming]
+    critical_path_ns: int
+    total_ns: int
+
+    def get_slowest(self, count: int = 10) -> list[DependencyBuildTiming]:
+        return sorted(self.timings, key=lambda timing: timing.exclusive_ns, reverse=True)[:count]
@@ -0,0 +1,190 @@
+from typing import Optional
+from .base_dependency_observer import BaseDependencyObserver
+from .build_profile import BuildProfile, DependencyBuildTiming
+from .dependency_event import DependencyEvent
+from ..dependency.dependency_store import DependencyStore
+
+
+class _Construction:
+    __slots__ = ("dependency_id", "nested_ns", "nested_dependencies_ids")
+
+    def __init__(self, dependency_id: tuple[int, ...]):
+        self.dependency_id = dependency_id
+        self.nested_ns = 0
+        self.nested_dependencies_ids: list[tuple[int, ...]] = []
+
+
+class BuildProfiler(BaseDependencyObserver):
+    """
+    Records every construction of a build in the order it finished.
+
+    Exclusive time leaves out constructions nested in a builder, which are reported on their own.
+    Inclusive time adds the exclusive time of every dependency it reaches constructed during the
+    build, counting a dependency shared by several paths once.
+    The critical path is the chain of dependencies with the largest exclusive time sum.
+    """
+
+    def __init__(self, dependency_store: DependencyStore):
+        self._dependency_store = dependency_store
+        self._constructions: list[_Construction] = []
+        self._timings: dict[tuple[int, ...], DependencyBuildTiming] = {}
+
+    def on_construct_start(self, event: DependencyEvent):
+        self._constructions.append(_Construction(event.dependency_id))
+
+    def on_construct_end(self, event: DependencyEvent):
+        construction = self._constructions.pop()
+
+        if len(self._constructions) > 0:
+            parent_construction = self._constructions[-1]
+            parent_construction.nested_ns += event.elapsed_ns
+            parent_construction.nested_dependencies_ids.append(event.dependency_id)
+
+        if event.error is not None:
+            return
+
+        dependency_registry = self._dependency_store.find_dependency(event.dependency_id)
+        dependencies_ids = list(construction.nested_dependencies_ids)
+
+        if dependency_registry is not None:
+            dependencies_ids.extend(dependency_registry.implementation_details.class_constructor_dependencies_ids)
+
+        exclusive_ns = event.elapsed_ns - construction.nested_ns
+
+        self._timings[event.dependency_id] = DependencyBuildTiming(
+            event.dependency_id,
+            event.token_names,
+            len(self._timings),
+            exclusive_ns,
+            exclusive_ns,
+            dependencies_ids,
+        )
+
+    def _get_built_dependencies_ids(self, timing: DependencyBuildTiming) -> list[tuple[int, ...]]:
+        return [dependency_id for dependency_id in dict.fromkeys(timing.dependencies_ids) if dependency_id in self._timings]
+
+    def _get_exclusive_ns_masks(self) -> list[int]:
+        # The dependencies whose exclusive time has each bit set, so a set of dependencies sums its
+        # exclusive times with a popcount per bit instead of a step per dependency.
+        masks_bytes: list[bytearray] = []
+
+        for bit, timing in enumerate(self._timings.values()):
+            exclusive_ns = timing.exclusive_ns
+
+            while len(masks_bytes) < exclusive_ns.bit_length():
+                masks_bytes.append(bytearray((len(self._timings) + 7) // 8))
+
+            for exclusive_ns_bit in range(exclusive_ns.bit_length()):
+                if exclusive_ns >> exclusive_ns_bit & 1 == 1:
+                    masks_bytes[exclusive_ns_bit][bit // 8] |= 1 << bit % 8
+
+        return [int.from_bytes(mask_bytes, "little") for mask_bytes in masks_bytes]
+
+    @staticmethod
+    def _get_exclusive_ns_sum(dependencies_bits: int, exclusive_ns_by_bit: list[int], exclusive_ns_masks: list[int]) -> int:
+        if dependencies_bits.bit_count() > len(exclusive_ns_masks):
+            return sum((dependencies_bits & mask).bit_count() << exclusive_ns_bit for exclusive_ns_bit, mask in enumerate(exclusive_ns_masks))
+
+        exclusive_ns_sum = 0
+
+        while dependencies_bits != 0:
+            lowest_bit = dependencies_bits & -dependencies_bits
+            exclusive_ns_sum += exclusive_ns_by_bit[lowest_bit.bit_length() - 1]
+            dependencies_bits ^= lowest_bit
+
+        return exclusive_ns_sum
+
+    def _set_inclusive_times(self):
+        # Every dependency is a bit of the dependencies it reaches, in build order. Dependencies
+        # finish before their dependents, so one pass in build order sees every reachable set.
+        exclusive_ns_by_bit = [timing.exclusive_ns for timing in self._timings.values()]
+        exclusive_ns_masks = self._get_exclusive_ns_masks()
+        built_dependencies_ids = {dependency_id: self._get_built_dependencies_ids(timing) for dependency_id, timing in self._timings.items()}
+        pending_dependents: dict[tuple[int, ...], int] = dict.fromkeys(self._timings.keys(), 0)
+        reachable_bits: dict[tuple[int, ...], tuple[int, int]] = {}
+
+        for dependencies_ids in built_dependencies_ids.values():
+            for dependency_id in dependencies_ids:
+                pending_dependents[dependency_id] += 1
+
+        for bit, (dependency_id, timing) in enumerate(self._timings.items()):
+            dependencies_reachable_bits = [(reachable_bits[built_dependency_id], built_dependency_id) for built_dependency_id in built_dependencies_ids[dependency_id]]
+            dependency_bits = 1 << bit
+            dependency_bits_count = 1
+            inclusive_ns = timing.exclusive_ns
+
+            for _, built_dependency_id in dependencies_reachable_bits:
+                pending_dependents[built_dependency_id] -= 1
+
+                if pending_dependents[built_dependency_id] == 0:
+                    del reachable_bits[built_dependency_id]
+
+            if len(dependencies_reachable_bits) > 0:
+                # The dependency reaching the most is added whole, the others add what it does not reach.
+                dependencies_reachable_bits.sort(key=lambda item: item[0][1], reverse=True)
+                (largest_dependency_bits, largest_dependency_bits_count), largest_dependency_id = dependencies_reachable_bits[0]
+                other_dependencies_bits = 0
+                other_dependencies_bits_count = 0
+                other_dependencies_inclusive_ns = 0
+
+                for (built_dependency_bits, built_dependency_bits_count), built_dependency_id in dependencies_reachable_bits[1:]:
+                    other_dependencies_bits |= built_dependency_bits
+                    other_dependencies_bits_count += built_dependency_bits_count
+                    other_dependencies_inclusive_ns += self._timings[built_dependency_id].inclusive_ns
+
+                missing_dependencies_bits = other_dependencies_bits ^ (other_dependencies_bits & largest_dependency_bits)
+                missing_dependencies_bits_count = missing_dependencies_bits.bit_count()
+                inclusive_ns += self._timings[largest_dependency_id].inclusive_ns
+
+                # Dependencies sharing none of their own dependencies just add up, shared ones are counted once.
+                if missing_dependencies_bits_count == other_dependencies_bits_count:
+                    inclusive_ns += other_dependencies_inclusive_ns
+                else:
+                    inclusive_ns += self._get_exclusive_ns_sum(missing_dependencies_bits, exclusive_ns_by_bit, exclusive_ns_masks)
+
+                dependency_bits |= largest_dependency_bits | missing_dependencies_bits
+                dependency_bits_count += largest_dependency_bits_count + missing_dependencies_bits_count
+
+            timing.inclusive_ns = inclusive_ns
+
+            if pending_dependents[dependency_id] > 0:
+                reachable_bits[dependency_id] = (dependency_bits, dependency_bits_count)
+
+    def _get_critical_path(self) -> tuple[list[DependencyBuildTiming], int]:
+        paths_ns: dict[tuple[int, ...], int] = {}
+        previous_ids: dict[tuple[int, ...], Optional[tuple[int, ...]]] = {}
+        last_id: Optional[tuple[int, ...]] = None
+
+        for dependency_id, timing in self._timings.items():
+            previous_id: Optional[tuple[int, ...]] = None
+
+            for built_dependency_id in self._get_built_dependencies_ids(timing):
+                if previous_id is None or paths_ns[built_dependency_id] > paths_ns[previous_id]:
+                    previous_id = built_dependency_id
+
+            paths_ns[dependency_id] = timing.exclusive_ns + (0 if previous_id is None else paths_ns[previous_id])
+            previous_ids[dependency_id] = previous_id
+
+            if last_id is None or paths_ns[dependency_id] > paths_ns[last_id]:
+                last_id = dependency_id
+
+        if last_id is None:
+            return [], 0
+
+        critical_path: list[DependencyBuildTiming] = []
+        dependency_id = last_id
+
+        while dependency_id is not None:
+            critical_path.append(self._timings[dependency_id])
+            dependency_id = previous_ids[dependency_id]
+
+        critical_path.reverse()
+
+        return critical_path, paths_ns[last_id]
+
+    def get_profile(self, total_ns: int) -> BuildProfile:
+        self._set_inclusive_times()
+
+        critical_path, critical_path_ns = self._get_critical_path()
+
+        return BuildProfile(list(self._timings.values()), critical_path, critical_path_ns, total_ns)
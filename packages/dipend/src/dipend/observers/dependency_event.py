@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class DependencyEvent:
+    dependency_id: tuple[int, ...]
+    lifecycle: Any
+    token_names: list[str]
+    elapsed_ns: Optional[int] = field(default=None)
+    error: Optional[BaseException] = field(default=None)
@@ -0,0 +1,87 @@
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Optional
+from .base_dependency_observer import BaseDependencyObserver
+from .dependency_event import DependencyEvent
+from ..dependency.dependency_registry import DependencyRegistry
+
+
+class ObserverDispatcher:
+    def __init__(self, get_token_names: Callable[[tuple[int, ...]], list[str]]):
+        self._get_token_names = get_token_names
+        self._observers: list[BaseDependencyObserver] = []
+        self._token_names: dict[tuple[int, ...], list[str]] = {}
+
+    def add_observer(self, observer: BaseDependencyObserver):
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: BaseDependencyObserver):
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def has_observers(self) -> bool:
+        return len(self._observers) > 0
+
+    def _create_event(self, dependency_registry: DependencyRegistry, elapsed_ns: Optional[int] = None, error: Optional[BaseException] = None) -> DependencyEvent:
+        dependency_id = dependency_registry.dependency_id
+        token_names = self._token_names.get(dependency_id)
+
+        if token_names is None:
+            token_names = self._token_names.setdefault(dependency_id, self._get_token_names(dependency_id))
+
+        return DependencyEvent(dependency_id, dependency_registry.lifecycle, token_names, elapsed_ns, error)
+
+    def _dispatch(self, hook_name: str, event: DependencyEvent):
+        for observer in self._observers:
+            getattr(observer, hook_name)(event)
+
+    def _observe(self, start_hook_name: str, end_hook_name: str, dependency_registry: DependencyRegistry, callback: Callable[[], Any]) -> Any:
+        self._dispatch(start_hook_name, self._create_event(dependency_registry))
+
+        start = perf_counter_ns()
+
+        try:
+            result = callback()
+        except BaseException as err:
+            self._dispatch(end_hook_name, self._create_event(dependency_registry, perf_counter_ns() - start, err))
+            raise
+
+        self._dispatch(end_hook_name, self._create_event(dependency_registry, perf_counter_ns() - start))
+
+        return result
+
+    def observe_resolve(self, dependency_registry: DependencyRegistry, callback: Callable[[], Any]) -> Any:
+        return self._observe("on_resolve_start", "on_resolve_end", dependency_registry, callback)
+
+    def observe_construct(self, dependency_registry: DependencyRegistry, callback: Callable[[], Any]) -> Any:
+        return self._observe("on_construct_start", "on_construct_end", dependency_registry, callback)
+
+    def report_construct(self, dependency_registry: DependencyRegistry, elapsed_ns: int):
+        """
+        Reports a construction timed where it ran, such as in another process.
+        """
+        self._dispatch("on_construct_start", self._create_event(dependency_registry))
+        self._dispatch("on_construct_end", self._create_event(dependency_registry, elapsed_ns))
+
+    async def _observe_async(self, start_hook_name: str, end_hook_name: str, dependency_registry: DependencyRegistry, callback: Callable[[], Awaitable[Any]]) -> Any:
+        self._dispatch(start_hook_name, self._create_event(dependency_registry))
+
+        start = perf_counter_ns()
+
+        try:
+            result = await callback()
+        except BaseException as err:
+            self._dispatch(end_hook_name, self._create_event(dependency_registry, perf_counter_ns() - start, err))
+            raise
+
+        self._dispatch(end_hook_name, self._create_event(dependency_registry, perf_counter_ns() - start))
+
+        return result
+
+    async def observe_resolve_async(self, dependency_registry: DependencyRegistry, callback: Callable[[], Awaitable[Any]]) -> Any:
+        return await self._observe_async("on_resolve_start", "on_resolve_end", dependency_registry, callback)
+
+    async def observe_construct_async(self, dependency_registry: DependencyRegistry, callback: Callable[[], Awaitable[Any]]) -> Any:
+        return await self._observe_async("on_construct_start", "on_construct_end", dependency_registry, callback)
+
+    def wrap_resolve(self, dependency_registry: DependencyRegistry, factory: Callable[[], Any]) -> Callable[[], Any]:
+        return lambda: self.observe_resolve(dependency_registry, factory)
@@ -1,9 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
-from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenRegistry:
     token: Any
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: int
@@ -1,4 +1,5 @@
 from typing import Any
+from itertools import count
 from .token_registry import TokenRegistry
 from ..__seedwork.dictionary import Dictionary
 from ..exceptions.missing_dependency_token_exception import (
@@ -9,19 +10,22 @@ from ..exceptions.missing_dependency_token_exception import (
 class TokenStore:
     def __init__(self):
         self._tokens = Dictionary[Any, TokenRegistry]()
+        self._tokens_by_id = Dictionary[int, TokenRegistry]()
+        self._dependency_ids = Dictionary[tuple[Any, ...], tuple[int, ...]]()
+        # Every token points to the cached tokens keys holding it, so deleting a token does not scan them all.
+        self._tokens_keys_by_token = Dictionary[Any, set[tuple[Any, ...]]]()
+        self._token_ids = count(1)
 
     def _create_token_registry(self, token: Any) -> TokenRegistry:
-        token_registry = TokenRegistry(token)
+        token_registry = TokenRegistry(token, next(self._token_ids))
 
         self._tokens.set(token, token_registry)
+        self._tokens_by_id.set(token_registry.id, token_registry)
 
         return token_registry
 
-    def retrieve_or_create_dependency_id_by_tokens(
-        self,
-        tokens: list[Any],
-    ) -> str:
-        token_registry_ids: list[str] = []
+    def _create_dependency_id(self, tokens: tuple[Any, ...]) -> tuple[int, ...]:
+        token_registry_ids: list[int] = []
 
         for token in tokens:
             if token is None:
@@ -35,18 +39,45 @@ class TokenStore:
 
             token_registry_ids.append(self._create_token_registry(token).id)
 
-        return "_".join(token_registry_ids)
+        return tuple(token_registry_ids)
+
+    def retrieve_or_create_dependency_id_by_tokens(
+        self,
+        tokens: list[Any],
+    ) -> tuple[int, ...]:
+        tokens_key = tuple(tokens)
+
+        dependency_id = self._dependency_ids.get(tokens_key)
+
+        if dependency_id is not None:
+            return dependency_id
+
+        dependency_id = self._create_dependency_id(tokens_key)
+
+        self._dependency_ids.set(tokens_key, dependency_id)
+
+        for token in tokens_key:
+            if token is None:
+                continue
+
+            tokens_keys = self._tokens_keys_by_token.get(token)
+
+            if tokens_keys is None:
+                tokens_keys = set()
+                self._tokens_keys_by_token.set(token, tokens_keys)
+
+            tokens_keys.add(tokens_key)
 
-    def get_tokens(self, dependency_id: str) -> list[Any]:
-        tokens_ids = dependency_id.split("_")
+        return dependency_id
 
+    def get_tokens(self, dependency_id: tuple[int, ...]) -> list[Any]:
         tokens: list[Any] = []
 
-        for token_id in tokens_ids:
-            for registry in self._tokens.values():
-                if registry.id == token_id:
-                    tokens.append(registry.token)
-                    break
+        for token_id in dependency_id:
+            registry = self._tokens_by_id.get(token_id)
+
+            if registry is not None:
+                tokens.append(registry.token)
 
         if len(tokens) == 0:
             raise MissingDependencyTokenException([dependency_id])
@@ -55,6 +86,30 @@ class TokenStore:
 
     def reset(self):
         self._tokens.clear()
+        self._tokens_by_id.clear()
+        self._dependency_ids.clear()
+        self._tokens_keys_by_token.clear()
 
     def delete_token(self, token: Any):
+        token_registry = self._tokens.get(token)
+
+        if token_registry is not None:
+            self._tokens_by_id.delete(token_registry.id)
+
         self._tokens.delete(token)
+
+        tokens_keys = self._tokens_keys_by_token.get(token)
+
+        if tokens_keys is None:
+            return
+
+        self._tokens_keys_by_token.delete(token)
+
+        for tokens_key in tokens_keys:
+            self._dependency_ids.delete(tokens_key)
+
+            for other_token in tokens_key:
+                other_tokens_keys = None if other_token is None else self._tokens_keys_by_token.get(other_token)
+
+                if other_tokens_keys is not None:
+                    other_tokens_keys.discard(tokens_key)
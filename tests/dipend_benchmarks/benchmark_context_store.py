@@ -0,0 +1,83 @@
+import argparse
+from statistics import median
+from time import perf_counter_ns
+from typing import Callable
+from dipend import DependencyContainer, DependencyContainerConfig
+from dipend.context.base_context_store import BaseContextStore
+from dipend.context.context_store import ContextStore
+from dipend.context.scoped_context_store import ScopedContextStore
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from .graph_generator import create_graph
+
+
+CONTEXT_STORE_CLASSES: list[type[BaseContextStore]] = [ContextStore, ScopedContextStore]
+
+
+def create_request_on_store(context_store: BaseContextStore, size: int) -> Callable[[], object]:
+    var_names = [(index,) for index in range(size)]
+
+    def request():
+        scope_token = context_store.open_scope()
+
+        for var_name in var_names:
+            context_store.set(var_name, var_name)
+
+        for var_name in var_names:
+            context_store.get(var_name)
+
+        context_store.close_scope(scope_token)
+
+    return request
+
+
+def create_request_on_container(context_store: BaseContextStore, size: int) -> Callable[[], object]:
+    graph = create_graph([[] for _ in range(size)], {LifecycleEnum.CONTEXT: 1.0})
+    dependency_container = graph.register(DependencyContainer(DependencyContainerConfig(custom_context_store=context_store)))
+
+    dependency_container.build_singletons()
+
+    def request():
+        with dependency_container.context():
+            dependency_container.build_context()
+
+            for class_constructor in graph.classes:
+                dependency_container.get_dependency(class_constructor)
+
+    return request
+
+
+def measure(callback: Callable[[], object], repeat: int) -> list[int]:
+    timings: list[int] = []
+
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        callback()
+        timings.append(perf_counter_ns() - start)
+
+    return timings
+
+
+def report(name: str, timings: list[int]):
+    print(f"  {name:<20} min: {min(timings) / 1_000:10.1f} us  median: {median(timings) / 1_000:10.1f} us")
+
+
+def compare(title: str, create_request: Callable[[BaseContextStore, int], Callable[[], object]], size: int, repeat: int):
+    print(title)
+
+    for context_store_class in CONTEXT_STORE_CLASSES:
+        report(context_store_class.__name__, measure(create_request(context_store_class(), size), repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per request overhead of the context store backends.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        compare(f"store request: {size} context dependencies", create_request_on_store, size, args.repeat)
+        compare(f"container request: {size} context dependencies", create_request_on_container, size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import sys
+from statistics import median
+from time import perf_counter_ns
+from typing import Callable
+from dipend.dependency.dependency_store import DependencyStore
+from dipend.dependency.dependency_resolver import DependencyResolver
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from .graph_generator import create_chain, create_dependency_store, create_fan_out
+
+
+class RecursiveDependencyResolver(DependencyResolver):
+    def resolve(self, dependency_id: tuple[int, ...]):
+        dependency_registry = self._dependency_store.get_dependency(dependency_id)
+        resolved_instance = self._resolved_instance(dependency_registry)
+
+        if resolved_instance is not None:
+            return resolved_instance
+
+        resolved_class_constructor_dependencies = []
+
+        for constructor_dependency_id in dependency_registry.implementation_details.class_constructor_dependencies_ids:
+            resolved_class_constructor_dependencies.append(self.resolve(constructor_dependency_id))
+
+        return self._use_lifecycle_strategy(dependency_registry, resolved_class_constructor_dependencies)
+
+
+class Node:
+    def __init__(self, *dependencies):
+        self.dependencies = dependencies
+
+
+def measure(callback: Callable[[], object], repeat: int) -> list[int]:
+    timings: list[int] = []
+
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        callback()
+        timings.append(perf_counter_ns() - start)
+
+    return timings
+
+
+def report(name: str, timings: list[int]):
+    print(f"  {name:<10} min: {min(timings) / 1_000_000:8.2f} ms  median: {median(timings) / 1_000_000:8.2f} ms")
+
+
+def compare(title: str, dependency_store: DependencyStore, root_id: tuple[int, ...], repeat: int):
+    print(title)
+
+    for name, resolver_class in [("recursive", RecursiveDependencyResolver), ("iterative", DependencyResolver)]:
+        resolver = resolver_class(dependency_store)
+        resolver.set_default_resolve_lifecycle_strategies()
+
+        try:
+            report(name, measure(lambda: resolver.resolve(root_id), repeat))
+        except RecursionError:
+            print(f"  {name:<10} RecursionError")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the iterative DependencyResolver.resolve against a recursive reference.")
+    parser.add_argument("--depth", type=int, default=5_000)
+    parser.add_argument("--fan-out", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--recursion-limit", type=int, default=sys.getrecursionlimit())
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(args.recursion_limit)
+
+    deep_dependency_store = create_dependency_store(create_chain(args.depth), LifecycleEnum.TRANSIENT, Node)
+    wide_dependency_store = create_dependency_store(create_fan_out(args.fan_out + 1), LifecycleEnum.TRANSIENT, Node)
+
+    compare(f"deep chain: depth {args.depth}", deep_dependency_store, (args.depth - 1,), args.repeat)
+    compare(f"wide graph: fan-out {args.fan_out}", wide_dependency_store, (args.fan_out,), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
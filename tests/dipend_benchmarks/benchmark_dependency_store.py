@@ -0,0 +1,70 @@
+import argparse
+import random
+from statistics import median
+from time import perf_counter_ns
+from dipend.dependency.dependency_store import DependencyStore
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from .graph_generator import create_dependency_store, create_random_dag
+
+
+def measure_get_sorted_dependencies_ids(dependency_store: DependencyStore, repeat: int) -> list[int]:
+    timings: list[int] = []
+
+    for _ in range(repeat):
+        dependency_store._sorted_dependencies_ids_cache_invalidated = True
+
+        start = perf_counter_ns()
+        dependency_store.get_sorted_dependencies_ids()
+        timings.append(perf_counter_ns() - start)
+
+    return timings
+
+
+def measure_late_registration(dependency_store: DependencyStore, nodes: int, repeat: int, seed: int) -> list[int]:
+    randomizer = random.Random(seed)
+    dependency_store.get_sorted_dependencies_ids()
+    timings: list[int] = []
+
+    for index in range(nodes, nodes + repeat):
+        # Late registrations used by the existing graph force the reordering path.
+        dependent_id = (randomizer.randrange(nodes),)
+        class_constructor_dependencies_ids = dependency_store.get_dependency(dependent_id).implementation_details.class_constructor_dependencies_ids + [(index,)]
+        dependent_registry = DependencyRegistry(dependent_id, LifecycleEnum.SINGLETON, ImplementationDetails(None, class_constructor_dependencies_ids, None, None))
+        registry = DependencyRegistry((index,), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None))
+
+        start = perf_counter_ns()
+        dependency_store.add_dependency(dependent_registry)
+        dependency_store.add_dependency(registry)
+        dependency_store.get_sorted_dependencies_ids()
+        timings.append(perf_counter_ns() - start)
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DependencyStore.get_sorted_dependencies_ids on synthetic graphs.")
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--edges-per-node", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dependency_store = create_dependency_store(create_random_dag(args.nodes, args.edges_per_node, args.seed))
+
+    timings = measure_get_sorted_dependencies_ids(dependency_store, args.repeat)
+
+    print(f"get_sorted_dependencies_ids: {args.nodes} nodes, {args.edges_per_node} edges per node")
+    print(f"  min:    {min(timings) / 1_000_000:.2f} ms")
+    print(f"  median: {median(timings) / 1_000_000:.2f} ms")
+
+    timings = measure_late_registration(dependency_store, args.nodes, args.repeat, args.seed)
+
+    print("late registration + get_sorted_dependencies_ids")
+    print(f"  min:    {min(timings) / 1_000_000:.2f} ms")
+    print(f"  median: {median(timings) / 1_000_000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
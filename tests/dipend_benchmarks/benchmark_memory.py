@@ -0,0 +1,71 @@
+import argparse
+import sys
+import tracemalloc
+from typing import Any, Callable
+from dipend import DependencyContainer
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.dependency.strategies.resolve_lifecycle_strategy_input import ResolveLifecycleStrategyInput
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.token.token_registry import TokenRegistry
+from .graph_generator import create_graph, create_random_dag
+
+
+def measure_instance_size(create_instance: Callable[[], Any], count: int = 10_000) -> float:
+    tracemalloc.start()
+    instances = [create_instance() for _ in range(count)]
+    traced_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The list holding the instances is not part of their size.
+    return (traced_memory - sys.getsizeof(instances)) / count
+
+
+def report_instance_sizes():
+    implementation_details = ImplementationDetails(object, [], None, None)
+    dependency_registry = DependencyRegistry((0,), LifecycleEnum.SINGLETON, implementation_details)
+    create_instances: dict[str, Callable[[], Any]] = {
+        "DependencyRegistry": lambda: DependencyRegistry((0,), LifecycleEnum.SINGLETON, implementation_details),
+        "ImplementationDetails": lambda: ImplementationDetails(object, [], None, None),
+        "TokenRegistry": lambda: TokenRegistry(object, 0),
+        "ResolveLifecycleStrategyInput": lambda: ResolveLifecycleStrategyInput(dependency_registry, []),
+    }
+
+    print("bytes per instance")
+
+    for name, create_instance in create_instances.items():
+        print(f"  {name:<32} {measure_instance_size(create_instance):8.1f} B")
+
+
+def measure_registration(size: int, edge_density: float, seed: int) -> int:
+    graph = create_graph(create_random_dag(size, edge_density, seed))
+    dependency_container = DependencyContainer()
+
+    tracemalloc.start()
+    graph.register(dependency_container)
+    dependency_container.get_dependency(DependencyContainer)
+    traced_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return traced_memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the memory held per registration in a DependencyContainer.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 20_000])
+    parser.add_argument("--edge-density", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report_instance_sizes()
+
+    print("bytes per registration")
+
+    for size in args.sizes:
+        traced_memory = measure_registration(size, args.edge_density, args.seed)
+
+        print(f"  {size:>8} registrations  total: {traced_memory / 1_048_576:8.2f} MiB  per registration: {traced_memory / size:8.1f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+from typing import Callable, Optional
+from dipend import DependencyContainer
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from .graph_generator import SyntheticGraph, create_chain, create_diamonds, create_fan_out, create_graph, create_random_dag
+
+
+REGISTRATION_LIFECYCLES = [LifecycleEnum.SINGLETON, LifecycleEnum.TRANSIENT, LifecycleEnum.CONTEXT, LifecycleEnum.THREAD, LifecycleEnum.CACHED, LifecycleEnum.POOLED]
+RESOLUTION_LIFECYCLES = [
+    LifecycleEnum.SINGLETON,
+    LifecycleEnum.LAZY_SINGLETON,
+    LifecycleEnum.TRANSIENT,
+    LifecycleEnum.CONTEXT,
+    LifecycleEnum.THREAD,
+    LifecycleEnum.CACHED,
+    LifecycleEnum.POOLED,
+]
+RESOLUTION_CALLS = 1_000
+BENCHMARK_NAMES = ["registration", "get_dependency", "scope", "build", "graph_data"]
+SHAPES: dict[str, Callable[[int, float, int], list[list[int]]]] = {
+    "random": create_random_dag,
+    "chain": lambda size, edge_density, seed: create_chain(size),
+    "fan_out": lambda size, edge_density, seed: create_fan_out(size),
+    "diamonds": lambda size, edge_density, seed: create_diamonds(size),
+}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    operations: int
+    min_ns: float
+    median_ns: float
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline_ns: float
+    median_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median_ns / self.baseline_ns
+
+
+def measure(name: str, create_sample: Callable[[], Callable[[], object]], repeat: int, operations: int = 1) -> BenchmarkResult:
+    timings: list[float] = []
+
+    for _ in range(repeat):
+        sample = create_sample()
+
+        start = perf_counter_ns()
+        sample()
+        timings.append((perf_counter_ns() - start) / operations)
+
+    return BenchmarkResult(name, operations, min(timings), median(timings))
+
+
+def get_repeat(repeat: int, size: int) -> int:
+    # Large graphs take seconds per sample, so they are measured fewer times.
+    return max(1, min(repeat, repeat * 1_000 // size))
+
+
+def benchmark_registration(create_dependencies: Callable[[int], list[list[int]]], sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+
+    for size in sizes:
+        dependencies = create_dependencies(size)
+
+        for lifecycle in REGISTRATION_LIFECYCLES:
+            graph = create_graph(dependencies, {lifecycle: 1.0})
+
+            results.append(measure(f"registration/{lifecycle.value.lower()}/{size}", lambda: graph.create_container, get_repeat(repeat, size), size))
+
+        graph = create_graph(dependencies)
+
+        def register_batch():
+            dependency_container = DependencyContainer()
+
+            with dependency_container.batch():
+                graph.register(dependency_container)
+
+        results.append(measure(f"registration/batch/{size}", lambda: register_batch, get_repeat(repeat, size), size))
+
+    return results
+
+
+def create_resolution_sample(dependency_container: DependencyContainer, class_constructor: type) -> Callable[[], object]:
+    def sample():
+        with dependency_container.context():
+            for _ in range(RESOLUTION_CALLS):
+                dependency_container.get_dependency(class_constructor)
+
+    return sample
+
+
+def benchmark_resolution(create_dependencies: Callable[[int], list[list[int]]], repeat: int) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    graph = create_graph(create_dependencies(10))
+
+    for lifecycle in RESOLUTION_LIFECYCLES:
+        # Only the root changes lifecycle, so every sample resolves it over the same singleton dependencies.
+        root_graph: SyntheticGraph = replace(graph, lifecycles=graph.lifecycles[:-1] + [lifecycle])
+        dependency_container = root_graph.create_container().build_singletons()
+
+        sample = create_resolution_sample(dependency_container, root_graph.classes[-1])
+
+        results.append(measure(f"get_dependency/{lifecycle.value.lower()}", lambda: sample, repeat, RESOLUTION_CALLS))
+
+    return results
+
+
+def benchmark_scope(create_dependencies: Callable[[int], list[list[int]]], sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+
+    for size in sizes:
+        graph = create_graph(create_dependencies(size))
+        # Every scope resolves one per-context root over singletons, so exiting it must not depend on the graph size.
+        root_graph: SyntheticGraph = replace(graph, lifecycles=graph.lifecycles[:-1] + [LifecycleEnum.CONTEXT])
+        dependency_container = root_graph.create_container().build_singletons()
+        class_constructor = root_graph.classes[-1]
+
+        def open_scopes():
+            for _ in range(RESOLUTION_CALLS):
+                with dependency_container.context():
+                    dependency_container.get_dependency(class_constructor)
+
+        async def aopen_scopes():
+            for _ in range(RESOLUTION_CALLS):
+                async with dependency_container.acontext():
+                    await dependency_container.aget_dependency(class_constructor)
+
+        results.append(measure(f"scope/sync/{size}", lambda: open_scopes, repeat, RESOLUTION_CALLS))
+        results.append(measure(f"scope/async/{size}", lambda: lambda: asyncio.run(aopen_scopes()), repeat, RESOLUTION_CALLS))
+
+        dependency_container.dispose()
+
+    return results
+
+
+def benchmark_build(create_dependencies: Callable[[int], list[list[int]]], sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+
+    for size in sizes:
+        dependencies = create_dependencies(size)
+        graph = create_graph(dependencies)
+
+        results.append(measure(f"build_singletons/{size}", lambda: graph.create_container().build_singletons, get_repeat(repeat, size)))
+
+        dependency_container = create_graph(dependencies, {LifecycleEnum.CONTEXT: 1.0}).create_container()
+
+        def build_context():
+            with dependency_container.context():
+                dependency_container.build_context()
+
+        results.append(measure(f"build_context/{size}", lambda: build_context, get_repeat(repeat, size)))
+
+    return results
+
+
+def benchmark_graph_data(create_dependencies: Callable[[int], list[list[int]]], sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    try:
+        from dipend_graph.graph_data_handler import GraphDataHandler
+    except ImportError:
+        print("dipend-graph is not installed, skipping the graph data benchmarks.")
+        return []
+
+    results: list[BenchmarkResult] = []
+
+    for size in sizes:
+        graph_data_handler = GraphDataHandler(create_graph(create_dependencies(size)).create_container())
+
+        results.append(measure(f"graph_data/{size}", lambda: lambda: json.dumps(graph_data_handler.handle()), get_repeat(repeat, size)))
+
+    return results
+
+
+def report(result: BenchmarkResult, baseline_result: Optional[BenchmarkResult]):
+    line = f"  {result.name:<36} min: {result.min_ns / 1_000:12.2f} us  median: {result.median_ns / 1_000:12.2f} us"
+
+    if baseline_result is not None:
+        line += f"  baseline: {(result.median_ns / baseline_result.median_ns - 1) * 100:+7.1f} %"
+
+    print(line)
+
+
+def load_baseline(path: Path) -> dict[str, BenchmarkResult]:
+    if not path.exists():
+        return {}
+
+    return {result["name"]: BenchmarkResult(**result) for result in json.loads(path.read_text())["results"]}
+
+
+def save_baseline(path: Path, results: list[BenchmarkResult]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"python": sys.version, "results": [asdict(result) for result in results]}, indent=2))
+
+
+def find_regressions(results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult], threshold: float) -> list[Regression]:
+    regressions: list[Regression] = []
+
+    for result in results:
+        baseline_result = baseline.get(result.name)
+
+        if baseline_result is not None and result.median_ns > baseline_result.median_ns * (1 + threshold):
+            regressions.append(Regression(result.name, baseline_result.median_ns, result.median_ns))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark registration, resolution, build and graph data generation, comparing against a JSON baseline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--shape", choices=list(SHAPES.keys()), default="random")
+    parser.add_argument("--edge-density", type=float, default=3.0, help="Average dependencies per node of random graphs.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARK_NAMES, default=BENCHMARK_NAMES)
+    parser.add_argument("--baseline", type=Path, help="The JSON baseline, baselines/<shape>.json by default.")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with this run's results.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Median slowdown over the baseline that fails the run, as a fraction.")
+    args = parser.parse_args()
+
+    if args.baseline is None:
+        args.baseline = Path(__file__).parent / "baselines" / f"{args.shape}.json"
+
+    baseline = load_baseline(args.baseline)
+    results: list[BenchmarkResult] = []
+
+    def create_dependencies(size: int) -> list[list[int]]:
+        return SHAPES[args.shape](size, args.edge_density, args.seed)
+
+    benchmarks: dict[str, Callable[[], list[BenchmarkResult]]] = {
+        "registration": lambda: benchmark_registration(create_dependencies, args.sizes, args.repeat),
+        "get_dependency": lambda: benchmark_resolution(create_dependencies, args.repeat),
+        "scope": lambda: benchmark_scope(create_dependencies, args.sizes, args.repeat),
+        "build": lambda: benchmark_build(create_dependencies, args.sizes, args.repeat),
+        "graph_data": lambda: benchmark_graph_data(create_dependencies, args.sizes, args.repeat),
+    }
+
+    for benchmark_name in args.benchmarks:
+        for result in benchmarks[benchmark_name]():
+            report(result, baseline.get(result.name))
+            results.append(result)
+
+    if args.save_baseline is True:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    regressions = find_regressions(results, baseline, args.threshold)
+
+    for regression in regressions:
+        print(f"Regression: {regression.name} is {regression.ratio:.2f}x its baseline median")
+
+    if len(regressions) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import random
+from dataclasses import dataclass, field
+from inspect import Parameter, Signature
+from typing import Any, Callable, Optional
+from dipend import DependencyContainer
+from dipend.decorators.inject_mapped_dependency import inject_mapped_dependency
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.dependency_store import DependencyStore
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.enums.lifecycle_enum import LifecycleEnum
+
+
+REGISTRATION_METHODS: dict[LifecycleEnum, tuple[str, str, dict[str, Any]]] = {
+    LifecycleEnum.SINGLETON: ("add_singleton", "add_mapped_singleton", {}),
+    LifecycleEnum.LAZY_SINGLETON: ("add_singleton", "add_mapped_singleton", {"lazy": True}),
+    LifecycleEnum.TRANSIENT: ("add_transient", "add_mapped_transient", {}),
+    LifecycleEnum.CONTEXT: ("add_per_context", "add_mapped_per_context", {}),
+    LifecycleEnum.THREAD: ("add_per_thread", "add_mapped_per_thread", {}),
+    LifecycleEnum.CACHED: ("add_cached", "add_mapped_cached", {}),
+    LifecycleEnum.POOLED: ("add_pooled", "add_mapped_pooled", {}),
+}
+
+
+@dataclass
+class SyntheticGraph:
+    """
+    Generated classes whose typed `__init__` signatures form a dependency graph.
+
+    Nodes only depend on nodes with a lower index, so the last class is a root of the graph.
+    Nodes with a qualifier are registered as mapped dependencies, and their dependents select
+    them through `inject_mapped_dependency`.
+    """
+
+    classes: list[type]
+    dependencies: list[list[int]]
+    lifecycles: list[LifecycleEnum]
+    qualifiers: dict[int, str] = field(default_factory=lambda: {})
+
+    @property
+    def edges_count(self) -> int:
+        return sum(len(node_dependencies) for node_dependencies in self.dependencies)
+
+    def register(self, dependency_container: DependencyContainer) -> DependencyContainer:
+        for index, class_constructor in enumerate(self.classes):
+            method_name, mapped_method_name, options = REGISTRATION_METHODS[self.lifecycles[index]]
+            qualifier_token = self.qualifiers.get(index)
+
+            if qualifier_token is None:
+                getattr(dependency_container, method_name)(class_constructor, **options)
+            else:
+                getattr(dependency_container, mapped_method_name)(class_constructor, qualifier_token, class_constructor, **options)
+
+        return dependency_container
+
+    def create_container(self) -> DependencyContainer:
+        return self.register(DependencyContainer())
+
+
+def create_chain(size: int) -> list[list[int]]:
+    return [[index - 1] if index > 0 else [] for index in range(size)]
+
+
+def create_fan_out(size: int) -> list[list[int]]:
+    return [[] for _ in range(size - 1)] + [list(range(size - 1))]
+
+
+def create_diamonds(size: int) -> list[list[int]]:
+    # Every diamond adds two siblings depending on the previous bottom and a bottom depending on both.
+    dependencies: list[list[int]] = [[]]
+
+    while len(dependencies) < size:
+        bottom = len(dependencies) - 1
+        dependencies.append([bottom])
+        dependencies.append([bottom])
+        dependencies.append([bottom + 1, bottom + 2])
+
+    return dependencies[:size]
+
+
+def create_random_dag(size: int, edge_density: float, seed: int = 0) -> list[list[int]]:
+    """
+    Creates a random DAG where every node depends on `edge_density` lower nodes on average.
+    """
+    randomizer = random.Random(seed)
+    dependencies: list[list[int]] = []
+
+    for index in range(size):
+        count = int(edge_density) + (1 if randomizer.random() < edge_density % 1 else 0)
+
+        dependencies.append(randomizer.sample(range(index), min(index, count)))
+
+    return dependencies
+
+
+def _create_class(index: int, dependencies: list[type], mapped_dependencies: dict[int, str]) -> type:
+    def init(self, *args):
+        self.dependencies = args
+
+    # A signature is enough for the container to read the constructor dependencies.
+    init.__signature__ = Signature(
+        [Parameter("self", Parameter.POSITIONAL_OR_KEYWORD)]
+        + [Parameter(f"dependency_{position}", Parameter.POSITIONAL_OR_KEYWORD, annotation=dependency) for position, dependency in enumerate(dependencies)]
+    )
+
+    class_constructor = type(f"Node{index}", (), {"__init__": init})
+
+    for position, qualifier_token in mapped_dependencies.items():
+        class_constructor = inject_mapped_dependency(position, qualifier_token)(class_constructor)
+
+    return class_constructor
+
+
+def create_graph(
+    dependencies: list[list[int]],
+    lifecycles: Optional[dict[LifecycleEnum, float]] = None,
+    mapped_ratio: float = 0.0,
+    seed: int = 0,
+) -> SyntheticGraph:
+    """
+    Creates the classes of a graph shape.
+
+    Args:
+        dependencies (list[list[int]]): The lower indexes every node depends on, in constructor order.
+        lifecycles (Optional[dict[LifecycleEnum, float]]): The weight of every lifecycle in the mix. Nodes are singletons by default.
+            Lifecycles must fit how the container is built, for example pooled nodes are only resolvable in a context scope.
+        mapped_ratio (float): The fraction of nodes registered as mapped dependencies.
+        seed (int): The seed of the lifecycle and qualifier choices.
+
+    Returns:
+        SyntheticGraph: The generated graph.
+    """
+    randomizer = random.Random(seed)
+    lifecycles = lifecycles or {LifecycleEnum.SINGLETON: 1.0}
+    lifecycles_choices = randomizer.choices(list(lifecycles.keys()), weights=list(lifecycles.values()), k=len(dependencies))
+    qualifiers = {index: f"qualifier{index}" for index in range(len(dependencies)) if randomizer.random() < mapped_ratio}
+    classes: list[type] = []
+
+    for index, node_dependencies in enumerate(dependencies):
+        mapped_dependencies = {position: qualifiers[dependency] for position, dependency in enumerate(node_dependencies) if dependency in qualifiers}
+
+        classes.append(_create_class(index, [classes[dependency] for dependency in node_dependencies], mapped_dependencies))
+
+    return SyntheticGraph(classes, dependencies, lifecycles_choices, qualifiers)
+
+
+def create_dependency_store(
+    dependencies: list[list[int]],
+    lifecycle: LifecycleEnum = LifecycleEnum.SINGLETON,
+    class_constructor: Optional[Callable] = None,
+) -> DependencyStore:
+    """
+    Registers a graph shape straight into a DependencyStore, using `(index,)` as dependency ids,
+    to benchmark the store and the resolver without the container.
+    """
+    dependency_store = DependencyStore()
+
+    for index, node_dependencies in enumerate(dependencies):
+        implementation_details = ImplementationDetails(class_constructor, [(dependency,) for dependency in node_dependencies], None, None)
+
+        dependency_store.add_dependency(DependencyRegistry((index,), lifecycle, implementation_details))
+
+    return dependency_store
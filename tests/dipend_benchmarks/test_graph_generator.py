@@ -0,0 +1,90 @@
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from .graph_generator import (
+    create_chain,
+    create_dependency_store,
+    create_diamonds,
+    create_fan_out,
+    create_graph,
+    create_random_dag,
+)
+
+
+class TestGraphGenerator:
+    def test_create_chain(self):
+        assert create_chain(4) == [[], [0], [1], [2]]
+
+    def test_create_fan_out(self):
+        assert create_fan_out(4) == [[], [], [], [0, 1, 2]]
+
+    def test_create_diamonds(self):
+        assert create_diamonds(7) == [[], [0], [0], [1, 2], [3], [3], [4, 5]]
+        assert create_diamonds(5) == [[], [0], [0], [1, 2], [3]]
+
+    def test_create_random_dag(self):
+        dependencies = create_random_dag(1_000, 2.5, 1)
+
+        assert len(dependencies) == 1_000
+        assert all(len(set(node_dependencies)) == len(node_dependencies) for node_dependencies in dependencies)
+        assert all(dependency < index for index, node_dependencies in enumerate(dependencies) for dependency in node_dependencies)
+        assert all(len(node_dependencies) in (2, 3) for node_dependencies in dependencies[3:])
+        assert 2_400 < sum(len(node_dependencies) for node_dependencies in dependencies) < 2_600
+        assert create_random_dag(1_000, 2.5, 1) == dependencies
+
+    def test_create_random_dag_with_whole_edge_density(self):
+        dependencies = create_random_dag(100, 3.0)
+
+        assert sum(len(node_dependencies) for node_dependencies in dependencies) == 0 + 1 + 2 + 3 * 97
+
+    def test_create_graph(self):
+        dependencies = create_diamonds(7)
+        graph = create_graph(dependencies, {LifecycleEnum.TRANSIENT: 1.0})
+
+        assert graph.dependencies is dependencies
+        assert graph.edges_count == 8
+        assert graph.lifecycles == [LifecycleEnum.TRANSIENT] * 7
+        assert graph.qualifiers == {}
+        assert [class_constructor.__name__ for class_constructor in graph.classes] == [f"Node{index}" for index in range(7)]
+
+    def test_create_graph_wires_mapped_dependencies(self):
+        graph = create_graph(create_chain(3), mapped_ratio=1.0)
+        dependency_container = graph.create_container().build_singletons()
+
+        assert graph.qualifiers == {0: "qualifier0", 1: "qualifier1", 2: "qualifier2"}
+
+        root = dependency_container.get_mapped_dependency(graph.classes[2], "qualifier2")
+
+        assert isinstance(root.dependencies[0], graph.classes[1])
+        assert isinstance(root.dependencies[0].dependencies[0], graph.classes[0])
+
+    def test_create_dependency_store(self):
+        dependency_store = create_dependency_store(create_diamonds(4), LifecycleEnum.TRANSIENT)
+
+        assert dependency_store.get_sorted_dependencies_ids() == [(0,), (1,), (2,), (3,)]
+        assert dependency_store.get_dependency((3,)).lifecycle == LifecycleEnum.TRANSIENT
+        assert dependency_store.get_dependency((3,)).implementation_details.class_constructor_dependencies_ids == [(1,), (2,)]
+
+    def test_register_resolves_root_of_mixed_mapped_graph(self):
+        # Eager singletons are left out, they can not be built over dependencies only resolvable in a context scope.
+        lifecycles = [
+            LifecycleEnum.LAZY_SINGLETON,
+            LifecycleEnum.TRANSIENT,
+            LifecycleEnum.CONTEXT,
+            LifecycleEnum.THREAD,
+            LifecycleEnum.CACHED,
+            LifecycleEnum.POOLED,
+        ]
+        graph = create_graph(create_random_dag(60, 2.5, 1), dict.fromkeys(lifecycles, 1.0), mapped_ratio=0.3, seed=1)
+        dependency_container = graph.create_container().build_singletons()
+        root_index = len(graph.classes) - 1
+
+        assert set(graph.lifecycles) == set(lifecycles)
+        assert len(graph.qualifiers) > 0
+
+        with dependency_container.context():
+            if root_index in graph.qualifiers:
+                root = dependency_container.get_mapped_dependency(graph.classes[root_index], graph.qualifiers[root_index])
+            else:
+                root = dependency_container.get_dependency(graph.classes[root_index])
+
+            assert len(root.dependencies) == len(graph.dependencies[root_index])
+            assert all(isinstance(dependency, graph.classes[index]) for dependency, index in zip(root.dependencies, graph.dependencies[root_index]))
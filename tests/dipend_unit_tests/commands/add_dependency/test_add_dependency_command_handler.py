@@ -106,6 +106,42 @@ class TestAddDependencyCommandHandler:
         token_store.retrieve_or_create_dependency_id_by_tokens.assert_called_once()
         dependency_store.add_dependency.assert_called_once()
 
+    def test_handle_creates_pool(self, setup_handler):
+        handler, token_store, dependency_store, _ = setup_handler
+
+        command = AddDependencyCommand(
+            tokens=[MyClass1],
+            lifecycle=LifecycleEnum.POOLED,
+            class_constructor=MyClass1,
+            pool_max_size=3,
+            pool_timeout=1.0,
+        )
+
+        token_store.retrieve_or_create_dependency_id_by_tokens.return_value = "dependency_id"
+
+        handler.handle(command)
+
+        pool = dependency_store.add_dependency.call_args.args[0].implementation_details.pool
+
+        assert pool.max_size == 3
+        assert pool._timeout == 1.0
+
+    def test_handle_sets_cache_ttl(self, setup_handler):
+        handler, token_store, dependency_store, _ = setup_handler
+
+        command = AddDependencyCommand(
+            tokens=[MyClass1],
+            lifecycle=LifecycleEnum.CACHED,
+            class_constructor=MyClass1,
+            cache_ttl=30.0,
+        )
+
+        token_store.retrieve_or_create_dependency_id_by_tokens.return_value = "dependency_id"
+
+        handler.handle(command)
+
+        assert dependency_store.add_dependency.call_args.args[0].implementation_details.cache_ttl == 30.0
+
     def test_handle_with_mapped_dependency_class_constructor_dependencies(self, setup_handler):
         handler, token_store, dependency_store, _ = setup_handler
 
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 from dipend.token.token_store import (
     TokenStore,
@@ -41,3 +42,18 @@ class TestResolveDependencyCommandHandler:
         dependency_resolver.resolve.assert_called_once()
 
         assert result == "resolved_instance"
+
+    def test_handle_async_resolves_dependency(self, setup_handler):
+        handler, token_store, dependency_resolver = setup_handler
+
+        command = ResolveDependencyCommand(tokens=["token1"])
+
+        token_store.retrieve_or_create_dependency_id_by_tokens.return_value = "dependency_id"
+        dependency_resolver.resolve_async = AsyncMock(return_value="resolved_instance")
+
+        result = asyncio.run(handler.handle_async(command))
+
+        token_store.retrieve_or_create_dependency_id_by_tokens.assert_called_once_with(command.tokens)
+        dependency_resolver.resolve_async.assert_awaited_once_with("dependency_id")
+
+        assert result == "resolved_instance"
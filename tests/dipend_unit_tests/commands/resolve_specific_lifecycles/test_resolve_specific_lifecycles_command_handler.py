@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 from dipend.dependency.dependency_registry import (
     DependencyRegistry,
@@ -14,6 +15,12 @@ from dipend.enums.lifecycle_enum import LifecycleEnum
 from dipend.exceptions.missing_dependency_exception import (
     MissingDependencyException,
 )
+from dipend.exceptions.can_not_construct_dependency_exception import (
+    CanNotConstructDependencyException,
+)
+from dipend.exceptions.async_builder_not_awaited_exception import (
+    AsyncBuilderNotAwaitedException,
+)
 from dipend.commands.resolve_specific_lifecycles_command import (
     ResolveSpecificLifecyclesCommand,
 )
@@ -22,6 +29,15 @@ from dipend.commands.resolve_specific_lifecycles_command_handler import (
 )
 
 
+class Connection:
+    def __init__(self, name):
+        self.name = name
+
+
+def build_name():
+    return "name"
+
+
 class TestResolveSingletonsCommandHandler:
     @pytest.fixture
     def setup_handler(self):
@@ -94,3 +110,123 @@ class TestResolveSingletonsCommandHandler:
 
         with pytest.raises(MissingDependencyException):
             handler.handle(command)
+
+    def _set_levels(self, dependency_store, registries, levels):
+        dependency_store.get_dependencies_ids_by_level.return_value = levels
+        dependency_store.get_dependency.side_effect = lambda id_: registries[id_]
+
+    def test_handle_resolves_levels_on_thread_pool(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        registries = {
+            "dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(None, ["dep2", "dep3"], None, None)),
+            "dep2": DependencyRegistry("dep2", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None)),
+            "dep3": DependencyRegistry("dep3", LifecycleEnum.TRANSIENT, ImplementationDetails(None, [], None, None)),
+        }
+        resolved_ids = []
+
+        self._set_levels(dependency_store, registries, [["dep2", "dep3"], ["dep1"]])
+        resolver.resolve.side_effect = resolved_ids.append
+
+        handler.handle(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON], max_workers=2))
+
+        dependency_store.get_sorted_dependencies_ids.assert_not_called()
+        assert resolved_ids == ["dep2", "dep1"]
+
+    def test_handle_propagates_thread_pool_exceptions(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        registries = {"dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None))}
+
+        self._set_levels(dependency_store, registries, [["dep1"]])
+        resolver.resolve.side_effect = MissingDependencyException(["dep1"])
+
+        with pytest.raises(MissingDependencyException):
+            handler.handle(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON], max_workers=2))
+
+    def test_handle_constructs_on_process_pool(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        existing_instance = Connection("existing")
+        registries = {
+            "dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(Connection, ["dep2"], None, None)),
+            "dep2": DependencyRegistry("dep2", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], build_name, None)),
+            "dep3": DependencyRegistry("dep3", LifecycleEnum.SINGLETON, ImplementationDetails(Connection, [], None, existing_instance)),
+        }
+
+        self._set_levels(dependency_store, registries, [["dep2", "dep3"], ["dep1"]])
+        resolver.resolve_class_constructor_dependencies.side_effect = lambda registry: [
+            registries[dependency_id].implementation_details.instance for dependency_id in registry.implementation_details.class_constructor_dependencies_ids
+        ]
+
+        published = []
+
+        def resolve_built(dependency_registry, built_instance, construct_elapsed_ns):
+            published.append(dependency_registry.dependency_id)
+            dependency_registry.implementation_details.instance = built_instance
+
+        resolver.resolve_built.side_effect = resolve_built
+
+        handler.handle(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON], max_workers=2, use_process_pool=True))
+
+        assert published == ["dep2", "dep1"]
+        assert registries["dep2"].implementation_details.instance == "name"
+        assert registries["dep1"].implementation_details.instance.name == "name"
+        assert registries["dep3"].implementation_details.instance is existing_instance
+        resolver.resolve.assert_not_called()
+
+    def test_handle_process_pool_raises_can_not_construct_dependency_exception(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        registries = {"dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None))}
+
+        self._set_levels(dependency_store, registries, [["dep1"]])
+
+        with pytest.raises(CanNotConstructDependencyException):
+            handler.handle(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON], use_process_pool=True))
+
+    def test_handle_process_pool_raises_async_builder_not_awaited_exception(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        registries = {"dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], build_name, None, True))}
+
+        self._set_levels(dependency_store, registries, [["dep1"]])
+
+        with pytest.raises(AsyncBuilderNotAwaitedException):
+            handler.handle(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON], use_process_pool=True))
+
+    def test_handle_async_awaits_builders_before_resolving_level(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        registries = {
+            "dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(None, ["dep2"], None, None)),
+            "dep2": DependencyRegistry("dep2", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], build_name, None, True)),
+            "dep3": DependencyRegistry("dep3", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], build_name, "Built", True)),
+            "dep4": DependencyRegistry("dep4", LifecycleEnum.CONTEXT, ImplementationDetails(None, [], build_name, None, True)),
+        }
+        calls = []
+
+        async def build_async_builder(dependency_registry):
+            calls.append(("construct", dependency_registry.dependency_id))
+            return "Built"
+
+        self._set_levels(dependency_store, registries, [["dep2", "dep3", "dep4"], ["dep1"]])
+        resolver.build_async_builder.side_effect = build_async_builder
+        resolver.resolve_built.side_effect = lambda dependency_registry, built_instance: calls.append(("built", dependency_registry.dependency_id))
+        resolver.resolve.side_effect = lambda dependency_id: calls.append(("resolve", dependency_id))
+
+        asyncio.run(handler.handle_async(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON])))
+
+        assert calls == [("construct", "dep2"), ("built", "dep2"), ("resolve", "dep1")]
+
+    def test_handle_async_resolves_async_subgraphs_asynchronously(self, setup_handler):
+        dependency_store, resolver, handler = setup_handler
+        registries = {
+            "dep1": DependencyRegistry("dep1", LifecycleEnum.SINGLETON, ImplementationDetails(None, ["dep2"], None, None)),
+            "dep2": DependencyRegistry("dep2", LifecycleEnum.SINGLETON, ImplementationDetails(None, ["dep3"], None, None)),
+            "dep3": DependencyRegistry("dep3", LifecycleEnum.TRANSIENT, ImplementationDetails(None, [], build_name, None, True)),
+            "dep4": DependencyRegistry("dep4", LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None)),
+        }
+
+        self._set_levels(dependency_store, registries, [["dep3", "dep4"], ["dep2"], ["dep1"]])
+        resolver.resolve_async = AsyncMock()
+
+        asyncio.run(handler.handle_async(ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON])))
+
+        assert [call.args[0] for call in resolver.resolve_async.await_args_list] == ["dep2", "dep1"]
+        resolver.resolve.assert_called_once_with("dep4")
+        resolver.build_async_builder.assert_not_called()
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from dipend.context.context_store import ContextStore
+from dipend.context.context_scope import ContextScope
+from dipend.dependency.dependency_disposer import DependencyDisposer
+
+
+class TestContextScope:
+    @pytest.fixture
+    def setup_scope(self):
+        context_store = MagicMock(spec=ContextStore)
+        context_store.open_scope.return_value = "scope-token"
+
+        return context_store, ContextScope(context_store, "value")
+
+    def test_with_opens_and_closes_scope(self, setup_scope):
+        context_store, scope = setup_scope
+
+        with scope as value:
+            assert value == "value"
+            context_store.open_scope.assert_called_once()
+            context_store.close_scope.assert_not_called()
+
+        context_store.close_scope.assert_called_once_with("scope-token")
+
+    def test_with_closes_scope_on_exception(self, setup_scope):
+        context_store, scope = setup_scope
+
+        with pytest.raises(KeyError):
+            with scope:
+                raise KeyError("error")
+
+        context_store.close_scope.assert_called_once_with("scope-token")
+
+    def test_async_with_opens_and_closes_scope(self, setup_scope):
+        context_store, scope = setup_scope
+
+        async def enter():
+            async with scope as value:
+                return value
+
+        assert asyncio.run(enter()) == "value"
+        context_store.open_scope.assert_called_once()
+        context_store.close_scope.assert_called_once_with("scope-token")
+
+    def test_enter_twice_raises(self, setup_scope):
+        context_store, scope = setup_scope
+
+        with scope:
+            with pytest.raises(RuntimeError):
+                scope.__enter__()
+
+    def test_scope_can_be_reused_after_exit(self, setup_scope):
+        context_store, scope = setup_scope
+
+        with scope:
+            pass
+
+        with scope:
+            pass
+
+        assert context_store.close_scope.call_count == 2
+
+    def test_with_disposes_context_before_closing_scope(self, setup_scope):
+        context_store, _ = setup_scope
+        dependency_disposer = MagicMock(spec=DependencyDisposer)
+        dependency_disposer.dispose_context.side_effect = lambda: context_store.close_scope.assert_not_called()
+        scope = ContextScope(context_store, "value", dependency_disposer)
+
+        with scope:
+            pass
+
+        dependency_disposer.dispose_context.assert_called_once()
+        context_store.close_scope.assert_called_once_with("scope-token")
+
+    def test_with_closes_scope_when_dispose_raises(self, setup_scope):
+        context_store, _ = setup_scope
+        dependency_disposer = MagicMock(spec=DependencyDisposer)
+        dependency_disposer.dispose_context.side_effect = KeyError("error")
+        scope = ContextScope(context_store, "value", dependency_disposer)
+
+        with pytest.raises(KeyError):
+            with scope:
+                pass
+
+        context_store.close_scope.assert_called_once_with("scope-token")
+
+    def test_async_with_awaits_context_disposal(self, setup_scope):
+        context_store, _ = setup_scope
+        dependency_disposer = MagicMock(spec=DependencyDisposer)
+        dependency_disposer.adispose_context = AsyncMock()
+        scope = ContextScope(context_store, "value", dependency_disposer)
+
+        async def enter():
+            async with scope:
+                pass
+
+        asyncio.run(enter())
+
+        dependency_disposer.adispose_context.assert_awaited_once()
+        dependency_disposer.dispose_context.assert_not_called()
+        context_store.close_scope.assert_called_once_with("scope-token")
@@ -1,3 +1,6 @@
+import asyncio
+import gc
+import weakref
 import pytest
 from dipend.context.context_store import ContextStore
 
@@ -31,3 +34,110 @@ class TestContextStore:
         context_wrapper._context_vars.set("test_var", None)
         context_wrapper.reset("test_var", context_token)
         assert context_wrapper.get("test_var") is None
+
+    def test_close_scope_resets_vars_set_inside_scope(self, context_wrapper):
+        context_wrapper.set("outer_var", "outer_value")
+
+        scope_token = context_wrapper.open_scope()
+
+        context_wrapper.set("outer_var", "scoped_value")
+        context_wrapper.set("scoped_var", "first_value")
+        context_wrapper.set("scoped_var", "second_value")
+
+        context_wrapper.close_scope(scope_token)
+
+        assert context_wrapper.get("outer_var") == "outer_value"
+        assert context_wrapper.get("scoped_var") is None
+        assert context_wrapper._scope.get() is None
+
+    def test_nested_scopes_restore_outer_scope_values(self, context_wrapper):
+        outer_scope_token = context_wrapper.open_scope()
+        context_wrapper.set("test_var", "outer_value")
+
+        inner_scope_token = context_wrapper.open_scope()
+        context_wrapper.set("test_var", "inner_value")
+        context_wrapper.close_scope(inner_scope_token)
+
+        assert context_wrapper.get("test_var") == "outer_value"
+
+        context_wrapper.close_scope(outer_scope_token)
+
+        assert context_wrapper.get("test_var") is None
+
+    def test_close_scope_releases_values(self, context_wrapper):
+        class Value:
+            pass
+
+        scope_token = context_wrapper.open_scope()
+        value = Value()
+        value_reference = weakref.ref(value)
+        context_wrapper.set("test_var", value)
+        del value
+
+        context_wrapper.close_scope(scope_token)
+        gc.collect()
+
+        assert value_reference() is None
+
+    def test_close_scope_skips_vars_set_in_copied_context(self, context_wrapper):
+        async def set_in_task():
+            context_wrapper.set("test_var", "task_value")
+
+        async def run():
+            scope_token = context_wrapper.open_scope()
+            await asyncio.create_task(set_in_task())
+            context_wrapper.close_scope(scope_token)
+
+        asyncio.run(run())
+
+        assert context_wrapper.get("test_var") is None
+
+    def test_close_scope_resets_vars_set_after_a_copied_context(self, context_wrapper):
+        async def set_in_task():
+            context_wrapper.set("test_var", "task_value")
+
+        async def run():
+            scope_token = context_wrapper.open_scope()
+            await asyncio.create_task(set_in_task())
+            context_wrapper.set("test_var", "scoped_value")
+            scope_values = context_wrapper.get_scope_values()
+            context_wrapper.close_scope(scope_token)
+            return scope_values, context_wrapper.get("test_var")
+
+        assert asyncio.run(run()) == ({"test_var": "scoped_value"}, None)
+
+    def test_get_scope_values(self, context_wrapper):
+        context_wrapper.set("outer_var", "outer_value")
+
+        scope_token = context_wrapper.open_scope()
+        context_wrapper.set("scoped_var", "scoped_value")
+
+        assert context_wrapper.get_scope_values() == {"scoped_var": "scoped_value"}
+
+        context_wrapper.close_scope(scope_token)
+
+        assert context_wrapper.get_scope_values() == {}
+
+    def test_get_scope_values_skips_vars_set_in_copied_context(self, context_wrapper):
+        async def set_in_task():
+            context_wrapper.set("test_var", "task_value")
+
+        async def run():
+            scope_token = context_wrapper.open_scope()
+            await asyncio.create_task(set_in_task())
+            scope_values = context_wrapper.get_scope_values()
+            context_wrapper.close_scope(scope_token)
+            return scope_values
+
+        assert asyncio.run(run()) == {}
+
+    def test_is_scope_open(self, context_wrapper):
+        assert context_wrapper.is_scope_open() is False
+
+        scope_token = context_wrapper.open_scope()
+
+        assert context_wrapper.is_scope_open() is True
+
+        context_wrapper.close_scope(scope_token)
+
+        assert context_wrapper.is_scope_open() is False
@@ -0,0 +1,143 @@
+import asyncio
+import contextvars
+import gc
+import weakref
+import pytest
+from dipend.context.scoped_context_store import ScopedContextStore
+
+
+class TestScopedContextStore:
+    @pytest.fixture
+    def context_store(self):
+        return ScopedContextStore()
+
+    def test_set_and_get_var(self, context_store):
+        context_store.set("test_var", "test_value")
+        assert context_store.get("test_var") == "test_value"
+
+    def test_get_nonexistent_var(self, context_store):
+        assert context_store.get("nonexistent_var") is None
+
+    def test_set_updates_value(self, context_store):
+        context_store.set("test_var", "initial_value")
+        context_store.set("test_var", "updated_value")
+        assert context_store.get("test_var") == "updated_value"
+
+    def test_set_inside_scope_does_not_touch_context_var(self, context_store):
+        scope_token = context_store.open_scope()
+        scope = context_store._scope.get()
+
+        context_store.set("first_var", "first_value")
+        context_store.set("second_var", "second_value")
+
+        assert context_store._scope.get() is scope
+        assert scope.values == {"first_var": "first_value", "second_var": "second_value"}
+
+        context_store.close_scope(scope_token)
+
+    def test_close_scope_drops_vars_set_inside_scope(self, context_store):
+        context_store.set("outer_var", "outer_value")
+
+        scope_token = context_store.open_scope()
+
+        assert context_store.get("outer_var") == "outer_value"
+
+        context_store.set("outer_var", "scoped_value")
+        context_store.set("scoped_var", "scoped_value")
+
+        assert context_store.get("outer_var") == "scoped_value"
+
+        context_store.close_scope(scope_token)
+
+        assert context_store.get("outer_var") == "outer_value"
+        assert context_store.get("scoped_var") is None
+
+    def test_nested_scopes_restore_outer_scope_values(self, context_store):
+        outer_scope_token = context_store.open_scope()
+        context_store.set("test_var", "outer_value")
+
+        inner_scope_token = context_store.open_scope()
+        context_store.set("test_var", "inner_value")
+        context_store.close_scope(inner_scope_token)
+
+        assert context_store.get("test_var") == "outer_value"
+
+        context_store.close_scope(outer_scope_token)
+
+        assert context_store.get("test_var") is None
+        assert context_store._scope.get() is None
+
+    def test_close_scope_releases_values(self, context_store):
+        class Value:
+            pass
+
+        scope_token = context_store.open_scope()
+        value = Value()
+        value_reference = weakref.ref(value)
+        context_store.set("test_var", value)
+        del value
+
+        context_store.close_scope(scope_token)
+        gc.collect()
+
+        assert value_reference() is None
+
+    def test_tasks_started_inside_scope_share_scope_values(self, context_store):
+        async def set_in_task():
+            context_store.set("test_var", "task_value")
+
+        async def run():
+            scope_token = context_store.open_scope()
+            await asyncio.create_task(set_in_task())
+            value = context_store.get("test_var")
+            context_store.close_scope(scope_token)
+            return value
+
+        assert asyncio.run(run()) == "task_value"
+        assert context_store.get("test_var") is None
+
+    def test_tasks_outside_scope_do_not_share_values(self, context_store):
+        async def set_in_task(value):
+            context_store.set("test_var", value)
+            await asyncio.sleep(0)
+            return context_store.get("test_var")
+
+        async def run():
+            context_store.set("test_var", "outer_value")
+            results = await asyncio.gather(set_in_task("first_value"), set_in_task("second_value"))
+            return results, context_store.get("test_var")
+
+        assert asyncio.run(run()) == (["first_value", "second_value"], "outer_value")
+
+    def test_set_outside_scope_does_not_copy_values(self, context_store):
+        context_store.set("first_var", "first_value")
+        copied_context = contextvars.copy_context()
+        context_store.set("second_var", "second_value")
+
+        assert context_store._scope.get() is None
+        assert copied_context.run(context_store.get, "first_var") == "first_value"
+        assert copied_context.run(context_store.get, "second_var") is None
+        assert context_store.get("second_var") == "second_value"
+
+    def test_get_scope_values(self, context_store):
+        context_store.set("outer_var", "outer_value")
+
+        assert context_store.get_scope_values() == {}
+
+        scope_token = context_store.open_scope()
+        context_store.set("scoped_var", "scoped_value")
+
+        assert context_store.get_scope_values() == {"scoped_var": "scoped_value"}
+
+        context_store.close_scope(scope_token)
+
+    def test_is_scope_open(self, context_store):
+        context_store.set("outer_var", "outer_value")
+
+        assert context_store.is_scope_open() is False
+
+        scope_token = context_store.open_scope()
+
+        assert context_store.is_scope_open() is True
+
+        context_store.close_scope(scope_token)
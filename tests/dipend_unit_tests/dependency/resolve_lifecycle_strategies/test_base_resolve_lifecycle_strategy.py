@@ -4,6 +4,9 @@ import pytest
 from dipend.exceptions.can_not_construct_dependency_exception import (
     CanNotConstructDependencyException,
 )
+from dipend.exceptions.async_builder_not_awaited_exception import (
+    AsyncBuilderNotAwaitedException,
+)
 from dipend.dependency.strategies.base_resolve_lifecycle_strategy import (
     BaseResolveLifecycleStrategy,
 )
@@ -21,6 +24,11 @@ class TestBaseResolveLifecycleStrategy:
     def mock_strategy(self):
         return self.MockStrategy()
 
+    def test_find_resolved_instance_returns_registered_instance(self, mock_strategy):
+        dependency_registry = MagicMock(implementation_details=MagicMock(instance="InstanceObject"))
+
+        assert mock_strategy.find_resolved_instance(dependency_registry) == "InstanceObject"
+
     def test_construct_returns_instance_if_present(self, mock_strategy):
         implementation_details = MagicMock(instance="InstanceObject", builder=None, class_constructor=None)
         dependency_registry = MagicMock(implementation_details=implementation_details)
@@ -39,6 +47,23 @@ class TestBaseResolveLifecycleStrategy:
 
         assert result == "BuiltObject"
 
+    def test_construct_returns_built_instance(self, mock_strategy):
+        implementation_details = MagicMock(instance=None, is_async_builder=True)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+        input_data = ResolveLifecycleStrategyInput(dependency_registry, [], "BuiltObject")
+
+        result = mock_strategy._construct(input_data)
+
+        assert result == "BuiltObject"
+
+    def test_construct_raises_exception_when_async_builder_is_not_awaited(self, mock_strategy):
+        implementation_details = MagicMock(instance=None, is_async_builder=True)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+        input_data = ResolveLifecycleStrategyInput(dependency_registry, [])
+
+        with pytest.raises(AsyncBuilderNotAwaitedException):
+            mock_strategy._construct(input_data)
+
     def test_construct_raises_exception_when_instance_builder_and_class_constructor_is_none(self, mock_strategy):
         implementation_details = MagicMock(instance=None, builder=None, class_constructor=None)
         dependency_registry = MagicMock(implementation_details=implementation_details)
@@ -70,3 +95,120 @@ class TestBaseResolveLifecycleStrategy:
         input_data = MagicMock()
 
         assert mock_strategy.execute(input_data) == "Executed"
+
+    def test_compile_construct_returns_instance_if_present(self, mock_strategy):
+        implementation_details = MagicMock(instance="InstanceObject", builder=None, class_constructor=None)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        factory = mock_strategy._compile_construct(dependency_registry, [])
+
+        assert factory() == "InstanceObject"
+
+    def test_compile_construct_returns_builder(self, mock_strategy):
+        def builder():
+            return "BuiltObject"
+
+        implementation_details = MagicMock(instance=None, builder=builder, class_constructor=None)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        factory = mock_strategy._compile_construct(dependency_registry, [])
+
+        assert factory is builder
+
+    def test_compile_construct_raises_exception_when_async_builder_is_not_awaited(self, mock_strategy):
+        implementation_details = MagicMock(instance=None, is_async_builder=True)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        construct = mock_strategy._compile_construct(dependency_registry, [])
+
+        with pytest.raises(AsyncBuilderNotAwaitedException):
+            construct()
+
+    def test_compile_construct_raises_exception_when_instance_builder_and_class_constructor_is_none(self, mock_strategy):
+        implementation_details = MagicMock(instance=None, builder=None, class_constructor=None)
+        dependency_registry = MagicMock(dependency_id="dep1", implementation_details=implementation_details)
+
+        factory = mock_strategy._compile_construct(dependency_registry, [])
+
+        with pytest.raises(CanNotConstructDependencyException) as excinfo:
+            factory()
+
+        assert excinfo.value.dependency_ids == ["dep1"]
+
+    def test_compile_construct_returns_class_constructor_without_dependencies(self, mock_strategy):
+        class_constructor = MagicMock(return_value="ConstructedObject")
+        implementation_details = MagicMock(instance=None, builder=None, class_constructor=class_constructor)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        factory = mock_strategy._compile_construct(dependency_registry, [])
+
+        assert factory is class_constructor
+
+    def test_compile_construct_binds_class_constructor_dependencies_factories(self, mock_strategy):
+        class_constructor = MagicMock(return_value="ConstructedObject")
+        implementation_details = MagicMock(instance=None, builder=None, class_constructor=class_constructor)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        factory = mock_strategy._compile_construct(dependency_registry, [lambda: "dep1", lambda: "dep2"])
+
+        assert factory() == "ConstructedObject"
+        class_constructor.assert_called_once_with("dep1", "dep2")
+
+    def test_compile_executes_strategy_with_resolved_dependencies(self, mock_strategy):
+        implementation_details = MagicMock(instance=None)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+        mock_strategy.execute = MagicMock(return_value="Executed")
+
+        factory = mock_strategy.compile(dependency_registry, [lambda: "dep1"])
+
+        assert factory() == "Executed"
+        mock_strategy.execute.assert_called_once_with(ResolveLifecycleStrategyInput(dependency_registry, ["dep1"]))
+
+    def test_compile_returns_instance_if_present(self, mock_strategy):
+        implementation_details = MagicMock(instance="InstanceObject")
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+        mock_strategy.execute = MagicMock()
+
+        factory = mock_strategy.compile(dependency_registry, [])
+
+        assert factory() == "InstanceObject"
+        mock_strategy.execute.assert_not_called()
+
+    def test_create_instance_is_observed(self, mock_strategy):
+        observer_dispatcher = MagicMock()
+        observer_dispatcher.observe_construct.side_effect = lambda dependency_registry, construct: construct()
+        mock_strategy.set_observer_dispatcher(observer_dispatcher)
+        implementation_details = MagicMock(instance=None, builder=lambda: "BuiltObject", is_async_builder=False)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        assert mock_strategy._construct(ResolveLifecycleStrategyInput(dependency_registry, [])) == "BuiltObject"
+        observer_dispatcher.observe_construct.assert_called_once()
+        assert observer_dispatcher.observe_construct.call_args.args[0] is dependency_registry
+
+    def test_create_instance_does_not_observe_built_instance(self, mock_strategy):
+        observer_dispatcher = MagicMock()
+        mock_strategy.set_observer_dispatcher(observer_dispatcher)
+        dependency_registry = MagicMock(implementation_details=MagicMock(instance=None))
+
+        assert mock_strategy._construct(ResolveLifecycleStrategyInput(dependency_registry, [], "BuiltObject")) == "BuiltObject"
+        observer_dispatcher.observe_construct.assert_not_called()
+
+    def test_compile_construct_observes_construction_after_dependencies(self, mock_strategy):
+        calls = []
+        observer_dispatcher = MagicMock()
+
+        def observe_construct(dependency_registry, construct):
+            calls.append("observe")
+            return construct()
+
+        observer_dispatcher.observe_construct.side_effect = observe_construct
+        mock_strategy.set_observer_dispatcher(observer_dispatcher)
+        class_constructor = MagicMock(return_value="ConstructedObject")
+        implementation_details = MagicMock(instance=None, builder=None, class_constructor=class_constructor, is_async_builder=False)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+
+        factory = mock_strategy._compile_construct(dependency_registry, [lambda: calls.append("dep1") or "dep1"])
+
+        assert factory() == "ConstructedObject"
+        assert calls == ["dep1", "observe"]
+        class_constructor.assert_called_once_with("dep1")
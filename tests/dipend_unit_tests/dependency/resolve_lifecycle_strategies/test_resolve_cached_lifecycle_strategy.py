@@ -0,0 +1,100 @@
+from unittest.mock import patch
+import pytest
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.dependency.strategies.resolve_lifecycle_strategy_input import (
+    ResolveLifecycleStrategyInput,
+)
+from dipend.dependency.strategies.resolve_cached_lifecycle_strategy import (
+    ResolveCachedLifecycleStrategy,
+)
+
+
+class ConfigClient:
+    def __init__(self, *args):
+        self.args = args
+
+
+def create_registry(dependency_id, cache_ttl=None):
+    return DependencyRegistry(dependency_id, LifecycleEnum.CACHED, ImplementationDetails(ConfigClient, [], None, None, cache_ttl=cache_ttl))
+
+
+class TestResolveCachedLifecycleStrategy:
+    @pytest.fixture
+    def monotonic(self):
+        with patch("dipend.dependency.strategies.resolve_cached_lifecycle_strategy.monotonic", return_value=100.0) as monotonic:
+            yield monotonic
+
+    def test_execute_reuses_instance_until_ttl_expires(self, monotonic):
+        strategy = ResolveCachedLifecycleStrategy()
+        dependency_registry = create_registry(("dep1",), cache_ttl=10)
+
+        instance = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, ["arg"]))
+
+        assert instance.args == ("arg",)
+
+        monotonic.return_value = 109.0
+
+        assert strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])) is instance
+        assert strategy.find_resolved_instance(dependency_registry) is instance
+
+        monotonic.return_value = 110.0
+
+        assert strategy.find_resolved_instance(dependency_registry) is None
+        assert strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])) is not instance
+
+    def test_execute_without_ttl_keeps_instance(self, monotonic):
+        strategy = ResolveCachedLifecycleStrategy()
+        dependency_registry = create_registry(("dep1",))
+
+        instance = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+        monotonic.return_value = 1_000_000.0
+
+        assert strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])) is instance
+
+    def test_evicts_least_recently_used_entry(self, monotonic):
+        strategy = ResolveCachedLifecycleStrategy(max_entries=2)
+        first_registry = create_registry(("dep1",))
+        second_registry = create_registry(("dep2",))
+        third_registry = create_registry(("dep3",))
+
+        first_instance = strategy.execute(ResolveLifecycleStrategyInput(first_registry, []))
+        strategy.execute(ResolveLifecycleStrategyInput(second_registry, []))
+        strategy.execute(ResolveLifecycleStrategyInput(first_registry, []))
+        strategy.execute(ResolveLifecycleStrategyInput(third_registry, []))
+
+        assert strategy.find_resolved_instance(first_registry) is first_instance
+        assert strategy.find_resolved_instance(second_registry) is None
+        assert strategy.find_resolved_instance(third_registry) is not None
+
+    def test_invalidate(self, monotonic):
+        strategy = ResolveCachedLifecycleStrategy()
+        first_registry = create_registry(("dep1",))
+        second_registry = create_registry(("dep2",))
+
+        strategy.execute(ResolveLifecycleStrategyInput(first_registry, []))
+        strategy.execute(ResolveLifecycleStrategyInput(second_registry, []))
+
+        strategy.invalidate(("dep1",))
+
+        assert strategy.find_resolved_instance(first_registry) is None
+        assert strategy.find_resolved_instance(second_registry) is not None
+
+        strategy.invalidate()
+
+        assert strategy.find_resolved_instance(second_registry) is None
+
+    def test_compile_reuses_instance_until_ttl_expires(self, monotonic):
+        strategy = ResolveCachedLifecycleStrategy()
+        dependency_registry = create_registry(("dep1",), cache_ttl=10)
+        factory = strategy.compile(dependency_registry, [lambda: "arg"])
+
+        instance = factory()
+
+        assert instance.args == ("arg",)
+        assert factory() is instance
+
+        monotonic.return_value = 110.0
+
+        assert factory() is not instance
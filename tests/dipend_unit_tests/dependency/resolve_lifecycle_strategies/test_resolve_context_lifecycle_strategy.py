@@ -63,3 +63,47 @@ class TestResolveContextLifecycleStrategy:
             strategy.execute(input_data)
 
         context_wrapper_mock.set.assert_called_once_with("test_dependency", new_instance)
+
+    def test_compile_returns_existing_instance(self, setup_strategy):
+        context_wrapper_mock, strategy, input_data = setup_strategy
+
+        existing_instance = MagicMock()
+        context_wrapper_mock.get.return_value = existing_instance
+        construct = MagicMock()
+
+        with patch.object(strategy, "_compile_construct", return_value=construct):
+            factory = strategy.compile(input_data.dependency_registry, [])
+
+        assert factory() == existing_instance
+        context_wrapper_mock.get.assert_called_once_with("test_dependency")
+        construct.assert_not_called()
+
+    def test_compile_creates_new_instance(self, setup_strategy):
+        context_wrapper_mock, strategy, input_data = setup_strategy
+
+        context_wrapper_mock.get.return_value = None
+        new_instance = MagicMock()
+        construct = MagicMock(return_value=new_instance)
+
+        with patch.object(strategy, "_compile_construct", return_value=construct):
+            factory = strategy.compile(input_data.dependency_registry, [])
+
+        assert factory() == new_instance
+        construct.assert_called_once()
+        context_wrapper_mock.set.assert_called_once_with("test_dependency", new_instance)
+
+    def test_find_resolved_instance_returns_context_instance(self, setup_strategy):
+        context_wrapper_mock, strategy, input_data = setup_strategy
+        dependency_registry = MagicMock(dependency_id="test_dependency", implementation_details=MagicMock(instance=None))
+
+        context_wrapper_mock.get.return_value = "ContextInstance"
+
+        assert strategy.find_resolved_instance(dependency_registry) == "ContextInstance"
+        context_wrapper_mock.get.assert_called_once_with("test_dependency")
+
+    def test_find_resolved_instance_returns_registered_instance(self, setup_strategy):
+        context_wrapper_mock, strategy, input_data = setup_strategy
+        dependency_registry = MagicMock(dependency_id="test_dependency", implementation_details=MagicMock(instance="Instance"))
+
+        assert strategy.find_resolved_instance(dependency_registry) == "Instance"
+        context_wrapper_mock.get.assert_not_called()
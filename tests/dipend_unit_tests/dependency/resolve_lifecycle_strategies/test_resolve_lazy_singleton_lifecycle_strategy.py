@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+import pytest
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.dependency.dependency_resolver import DependencyResolver
+from dipend.dependency.lazy_proxy import LazyProxy
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.dependency.strategies.resolve_lazy_singleton_lifecycle_strategy import (
+    ResolveLazySingletonLifecycleStrategy,
+)
+from dipend.dependency.strategies.resolve_lifecycle_strategy_input import (
+    ResolveLifecycleStrategyInput,
+)
+
+
+class Service:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestResolveLazySingletonLifecycleStrategy:
+    @pytest.fixture
+    def setup_strategy(self):
+        dependency_resolver = MagicMock(spec=DependencyResolver)
+        strategy = ResolveLazySingletonLifecycleStrategy(dependency_resolver)
+
+        return dependency_resolver, strategy
+
+    def test_does_not_resolve_class_constructor_dependencies(self, setup_strategy):
+        dependency_resolver, strategy = setup_strategy
+
+        assert strategy.resolves_class_constructor_dependencies is False
+
+    def test_execute_publishes_proxy(self, setup_strategy):
+        dependency_resolver, strategy = setup_strategy
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.LAZY_SINGLETON, ImplementationDetails(Service, [("dep2",)], None, None))
+
+        dependency_resolver.resolve_class_constructor_dependencies.return_value = ["service-name"]
+
+        result = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+        assert isinstance(result, LazyProxy)
+        assert isinstance(result, Service)
+        assert dependency_registry.implementation_details.instance is result
+        dependency_resolver.resolve_class_constructor_dependencies.assert_not_called()
+
+        assert result.name == "service-name"
+        dependency_resolver.resolve_class_constructor_dependencies.assert_called_once_with(dependency_registry)
+
+    def test_execute_returns_existing_instance(self, setup_strategy):
+        dependency_resolver, strategy = setup_strategy
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.LAZY_SINGLETON, ImplementationDetails(Service, [], None, "ExistingInstance"))
+
+        result = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+        assert result == "ExistingInstance"
+
+    def test_execute_uses_builder(self, setup_strategy):
+        dependency_resolver, strategy = setup_strategy
+        builder = MagicMock(return_value=Service("built"))
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.LAZY_SINGLETON, ImplementationDetails(None, [], builder, None))
+
+        dependency_resolver.resolve_class_constructor_dependencies.return_value = []
+
+        result = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+        builder.assert_not_called()
+        assert result.name == "built"
+        builder.assert_called_once()
+
+    def test_compile_publishes_proxy_built_from_factories(self, setup_strategy):
+        dependency_resolver, strategy = setup_strategy
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.LAZY_SINGLETON, ImplementationDetails(Service, [("dep2",)], None, None))
+        class_constructor_dependency_factory = MagicMock(return_value="service-name")
+
+        factory = strategy.compile(dependency_registry, [class_constructor_dependency_factory])
+
+        result = factory()
+
+        assert factory() is result
+        class_constructor_dependency_factory.assert_not_called()
+        assert result.name == "service-name"
+        class_constructor_dependency_factory.assert_called_once()
@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.context.context_store import ContextStore
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.dependency.object_pool import ObjectPool
+from dipend.dependency.strategies.resolve_lifecycle_strategy_input import (
+    ResolveLifecycleStrategyInput,
+)
+from dipend.dependency.strategies.resolve_pooled_lifecycle_strategy import (
+    ResolvePooledLifecycleStrategy,
+)
+from dipend.exceptions.can_not_construct_dependency_exception import (
+    CanNotConstructDependencyException,
+)
+from dipend.exceptions.missing_context_scope_exception import (
+    MissingContextScopeException,
+)
+from dipend.exceptions.pool_timeout_exception import PoolTimeoutException
+
+
+class Parser:
+    def __init__(self, *args):
+        self.args = args
+
+
+class TestResolvePooledLifecycleStrategy:
+    @pytest.fixture
+    def setup_strategy(self):
+        context_store = ContextStore()
+        strategy = ResolvePooledLifecycleStrategy(context_store)
+        implementation_details = ImplementationDetails(Parser, [], None, None, pool=ObjectPool(1, timeout=0.01))
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.POOLED, implementation_details)
+
+        return context_store, strategy, dependency_registry
+
+    def test_execute_checks_out_once_per_scope(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+
+        scope_token = context_store.open_scope()
+
+        instance = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, ["arg"]))
+
+        assert isinstance(instance, Parser)
+        assert instance.args == ("arg",)
+        assert strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])) is instance
+        assert strategy.find_resolved_instance(dependency_registry) is instance
+
+        context_store.close_scope(scope_token)
+
+    def test_execute_reuses_released_instance(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+
+        scope_token = context_store.open_scope()
+        instance = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+        context_store.close_scope(scope_token)
+
+        dependency_registry.implementation_details.pool.release(instance)
+
+        scope_token = context_store.open_scope()
+        assert strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])) is instance
+        context_store.close_scope(scope_token)
+
+    def test_execute_raises_outside_scope(self, setup_strategy):
+        _, strategy, dependency_registry = setup_strategy
+
+        with pytest.raises(MissingContextScopeException):
+            strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+    def test_execute_raises_without_pool(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+        dependency_registry.implementation_details.pool = None
+
+        scope_token = context_store.open_scope()
+
+        with pytest.raises(CanNotConstructDependencyException):
+            strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+        context_store.close_scope(scope_token)
+
+    def test_execute_raises_when_pool_is_exhausted(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+        dependency_registry.implementation_details.pool.acquire(Parser)
+
+        scope_token = context_store.open_scope()
+
+        with pytest.raises(PoolTimeoutException):
+            strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+        context_store.close_scope(scope_token)
+
+    def test_execute_async_checks_out(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+
+        async def run():
+            scope_token = context_store.open_scope()
+            instance = await strategy.execute_async(ResolveLifecycleStrategyInput(dependency_registry, []))
+            found_instance = strategy.find_resolved_instance(dependency_registry)
+            context_store.close_scope(scope_token)
+            return instance, found_instance
+
+        instance, found_instance = asyncio.run(run())
+
+        assert isinstance(instance, Parser)
+        assert found_instance is instance
+
+    def test_execute_async_raises_when_pool_is_exhausted(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+        dependency_registry.implementation_details.pool.acquire(Parser)
+
+        async def run():
+            scope_token = context_store.open_scope()
+
+            try:
+                await strategy.execute_async(ResolveLifecycleStrategyInput(dependency_registry, []))
+            finally:
+                context_store.close_scope(scope_token)
+
+        with pytest.raises(PoolTimeoutException):
+            asyncio.run(run())
+
+    def test_compile_checks_out_once_per_scope(self, setup_strategy):
+        context_store, strategy, dependency_registry = setup_strategy
+        factory = strategy.compile(dependency_registry, [lambda: "arg"])
+
+        scope_token = context_store.open_scope()
+
+        instance = factory()
+
+        assert instance.args == ("arg",)
+        assert factory() is instance
+
+        context_store.close_scope(scope_token)
+
+        with pytest.raises(MissingContextScopeException):
+            factory()
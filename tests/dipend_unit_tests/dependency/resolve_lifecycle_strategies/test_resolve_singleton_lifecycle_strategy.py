@@ -1,4 +1,7 @@
 from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
 import pytest
 from dipend.dependency.strategies.resolve_singleton_lifecycle_strategy import (
     ResolveSingletonLifecycleStrategy,
@@ -43,3 +46,78 @@ class TestResolveSingletonLifecycleStrategy:
         singleton_strategy._construct.assert_not_called()
         assert result == existing_instance
         assert dependency_registry.implementation_details.instance == existing_instance
+
+    def test_compile_creates_instance_once(self, singleton_strategy):
+        implementation_details = MagicMock(instance=None)
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+        construct = MagicMock(return_value="NewInstance")
+
+        singleton_strategy._compile_construct = MagicMock(return_value=construct)
+
+        factory = singleton_strategy.compile(dependency_registry, [])
+
+        assert factory() == "NewInstance"
+        assert factory() == "NewInstance"
+        construct.assert_called_once()
+        assert implementation_details.instance == "NewInstance"
+
+    def test_compile_returns_existing_instance(self, singleton_strategy):
+        implementation_details = MagicMock(instance="ExistingInstance")
+        dependency_registry = MagicMock(implementation_details=implementation_details)
+        construct = MagicMock()
+
+        singleton_strategy._compile_construct = MagicMock(return_value=construct)
+
+        factory = singleton_strategy.compile(dependency_registry, [])
+
+        assert factory() == "ExistingInstance"
+        construct.assert_not_called()
+
+    def _construct_concurrently(self, factory, threads):
+        barrier = Barrier(threads)
+
+        def resolve():
+            barrier.wait()
+            return factory()
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(lambda _: resolve(), range(threads)))
+
+    def test_execute_constructs_once_across_threads(self, singleton_strategy):
+        implementation_details = MagicMock(instance=None)
+        dependency_registry = MagicMock(dependency_id=(1,), implementation_details=implementation_details)
+        input_data = ResolveLifecycleStrategyInput(dependency_registry, [])
+
+        def construct(_):
+            sleep(0.01)
+            return object()
+
+        singleton_strategy._construct = MagicMock(side_effect=construct)
+
+        results = self._construct_concurrently(lambda: singleton_strategy.execute(input_data), 8)
+
+        singleton_strategy._construct.assert_called_once()
+        assert all(result is implementation_details.instance for result in results)
+
+    def test_compile_constructs_once_across_threads(self, singleton_strategy):
+        implementation_details = MagicMock(instance=None)
+        dependency_registry = MagicMock(dependency_id=(1,), implementation_details=implementation_details)
+
+        def construct_instance():
+            sleep(0.01)
+            return object()
+
+        construct = MagicMock(side_effect=construct_instance)
+
+        singleton_strategy._compile_construct = MagicMock(return_value=construct)
+
+        factory = singleton_strategy.compile(dependency_registry, [])
+
+        results = self._construct_concurrently(factory, 8)
+
+        construct.assert_called_once()
+        assert all(result is implementation_details.instance for result in results)
+
+    def test_get_lock_is_shared_per_dependency_id(self, singleton_strategy):
+        assert singleton_strategy._get_lock((1,)) is singleton_strategy._get_lock((1,))
+        assert singleton_strategy._get_lock((1,)) is not singleton_strategy._get_lock((2,))
@@ -0,0 +1,77 @@
+import gc
+import threading
+import pytest
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.dependency.strategies.resolve_lifecycle_strategy_input import (
+    ResolveLifecycleStrategyInput,
+)
+from dipend.dependency.strategies.resolve_thread_lifecycle_strategy import (
+    ResolveThreadLifecycleStrategy,
+)
+
+
+class Cursor:
+    def __init__(self, *args):
+        self.args = args
+        self.is_closed = False
+
+    def close(self):
+        self.is_closed = True
+
+
+def run_in_thread(callback):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(callback()))
+    thread.start()
+    thread.join()
+
+    return results[0]
+
+
+class TestResolveThreadLifecycleStrategy:
+    @pytest.fixture
+    def setup_strategy(self):
+        strategy = ResolveThreadLifecycleStrategy()
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.THREAD, ImplementationDetails(Cursor, [], None, None))
+
+        return strategy, dependency_registry
+
+    def test_execute_keeps_one_instance_per_thread(self, setup_strategy):
+        strategy, dependency_registry = setup_strategy
+
+        instance = strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, ["arg"]))
+
+        assert instance.args == ("arg",)
+        assert strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])) is instance
+        assert strategy.find_resolved_instance(dependency_registry) is instance
+
+        thread_instance = run_in_thread(lambda: strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])))
+
+        assert thread_instance is not instance
+
+    def test_find_resolved_instance_in_thread_without_instances(self, setup_strategy):
+        strategy, dependency_registry = setup_strategy
+
+        strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, []))
+
+        assert run_in_thread(lambda: strategy.find_resolved_instance(dependency_registry)) is None
+
+    def test_instances_are_disposed_when_thread_exits(self, setup_strategy):
+        strategy, dependency_registry = setup_strategy
+
+        thread_instance = run_in_thread(lambda: strategy.execute(ResolveLifecycleStrategyInput(dependency_registry, [])))
+        gc.collect()
+
+        assert thread_instance.is_closed is True
+
+    def test_compile_keeps_one_instance_per_thread(self, setup_strategy):
+        strategy, dependency_registry = setup_strategy
+        factory = strategy.compile(dependency_registry, [lambda: "arg"])
+
+        instance = factory()
+
+        assert instance.args == ("arg",)
+        assert factory() is instance
+        assert run_in_thread(factory) is not instance
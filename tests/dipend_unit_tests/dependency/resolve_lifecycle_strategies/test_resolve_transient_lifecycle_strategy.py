@@ -26,3 +26,14 @@ class TestResolveTransientLifecycleStrategy:
 
         transient_strategy._construct.assert_called_once_with(input_data)
         assert result == "TransientInstance"
+
+    def test_compile_uses_compiled_construct(self, transient_strategy):
+        dependency_registry = MagicMock()
+        class_constructor_dependencies_factories = [lambda: "dep1"]
+
+        transient_strategy._compile_construct = MagicMock(return_value="TransientFactory")
+
+        result = transient_strategy.compile(dependency_registry, class_constructor_dependencies_factories)
+
+        transient_strategy._compile_construct.assert_called_once_with(dependency_registry, class_constructor_dependencies_factories)
+        assert result == "TransientFactory"
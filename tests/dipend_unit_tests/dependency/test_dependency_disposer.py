@@ -0,0 +1,252 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.context.context_store import ContextStore
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.dependency.dependency_store import DependencyStore
+from dipend.dependency.dependency_disposer import DependencyDisposer
+from dipend.dependency.lazy_proxy import LazyProxy
+from dipend.dependency.object_pool import ObjectPool
+from dipend.dependency.strategies.resolve_pooled_lifecycle_strategy import ResolvePooledLifecycleStrategy
+
+
+class Disposable:
+    def __init__(self, name, disposed):
+        self.name = name
+        self.disposed = disposed
+
+    def close(self):
+        self.disposed.append(self.name)
+
+
+class AsyncDisposable(Disposable):
+    async def aclose(self):
+        await asyncio.sleep(0)
+        self.disposed.append(self.name)
+
+
+class TestDependencyDisposer:
+    @pytest.fixture
+    def setup_disposer(self):
+        dependency_store = DependencyStore()
+        context_store = ContextStore()
+
+        return dependency_store, context_store, DependencyDisposer(dependency_store, context_store)
+
+    def add_dependency(self, dependency_store, dependency_id, lifecycle, instance=None, dependencies_ids=None, class_constructor=Disposable):
+        implementation_details = ImplementationDetails(class_constructor, dependencies_ids or [], None, instance)
+        dependency_store.add_dependency(DependencyRegistry(dependency_id, lifecycle, implementation_details))
+
+        return implementation_details
+
+    def test_dispose_singletons_in_reverse_dependency_order(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.SINGLETON, Disposable("connection", disposed))
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.SINGLETON, Disposable("repository", disposed), [(1,)])
+        implementation_details = self.add_dependency(dependency_store, (3,), LifecycleEnum.SINGLETON, Disposable("service", disposed), [(2,)])
+
+        dependency_disposer.dispose_singletons()
+
+        assert disposed == ["service", "repository", "connection"]
+        assert implementation_details.instance is None
+
+    def test_dispose_uses_dispose_method_and_context_manager_exit(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+
+        class WithDispose:
+            def dispose(self):
+                disposed.append("dispose")
+
+            def close(self):
+                disposed.append("close")
+
+        class WithExit:
+            def __exit__(self, exc_type, exc_value, traceback):
+                disposed.append((exc_type, exc_value, traceback))
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.SINGLETON, WithDispose())
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.SINGLETON, WithExit(), [(1,)])
+
+        dependency_disposer.dispose_singletons()
+
+        assert disposed == [(None, None, None), "dispose"]
+
+    def test_dispose_skips_given_instances_and_other_lifecycles(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+
+        given_instance_details = self.add_dependency(dependency_store, (1,), LifecycleEnum.SINGLETON, Disposable("given", disposed), class_constructor=None)
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.TRANSIENT)
+        self.add_dependency(dependency_store, (3,), LifecycleEnum.SINGLETON)
+
+        dependency_disposer.dispose_singletons()
+
+        assert disposed == []
+        assert given_instance_details.instance is not None
+
+    def test_dispose_skips_lazy_singletons_never_built(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+        built_lazy_proxy = LazyProxy(lambda: Disposable("built", disposed))
+        built_lazy_proxy.name
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.LAZY_SINGLETON, LazyProxy(lambda: Disposable("unused", disposed)))
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.LAZY_SINGLETON, built_lazy_proxy)
+
+        dependency_disposer.dispose_singletons()
+
+        assert disposed == ["built"]
+
+    def test_dispose_continues_after_error(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+
+        class Failing:
+            def close(self):
+                raise KeyError("error")
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.SINGLETON, Disposable("connection", disposed))
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.SINGLETON, Failing(), [(1,)])
+
+        with pytest.raises(KeyError):
+            dependency_disposer.dispose_singletons()
+
+        assert disposed == ["connection"]
+
+    def test_adispose_singletons_awaits_async_disposers_by_level(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.SINGLETON, AsyncDisposable("connection", disposed))
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.SINGLETON, AsyncDisposable("first", disposed), [(1,)])
+        self.add_dependency(dependency_store, (3,), LifecycleEnum.SINGLETON, Disposable("second", disposed), [(1,)])
+
+        asyncio.run(dependency_disposer.adispose_singletons())
+
+        assert sorted(disposed[:2]) == ["first", "second"]
+        assert disposed[2] == "connection"
+
+    def test_dispose_context_only_disposes_instances_of_current_scope(self, setup_disposer):
+        dependency_store, context_store, dependency_disposer = setup_disposer
+        disposed = []
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.CONTEXT)
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.CONTEXT, dependencies_ids=[(1,)])
+        context_store.set((1,), Disposable("outer", disposed))
+
+        scope_token = context_store.open_scope()
+        context_store.set((2,), Disposable("scoped", disposed))
+
+        dependency_disposer.dispose_context()
+        context_store.close_scope(scope_token)
+
+        assert disposed == ["scoped"]
+
+    def test_adispose_context(self, setup_disposer):
+        dependency_store, context_store, dependency_disposer = setup_disposer
+        disposed = []
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.CONTEXT)
+
+        async def run():
+            scope_token = context_store.open_scope()
+            context_store.set((1,), AsyncDisposable("scoped", disposed))
+            await dependency_disposer.adispose_context()
+            context_store.close_scope(scope_token)
+
+        asyncio.run(run())
+
+        assert disposed == ["scoped"]
+
+    def test_dispose_context_orders_scope_instances_only(self, setup_disposer):
+        dependency_store, context_store, dependency_disposer = setup_disposer
+        disposed = []
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.CONTEXT)
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.SINGLETON, dependencies_ids=[(1,)])
+        self.add_dependency(dependency_store, (3,), LifecycleEnum.CONTEXT, dependencies_ids=[(2,)])
+        dependency_store.get_sorted_dependencies_ids = MagicMock(side_effect=AssertionError)
+
+        scope_token = context_store.open_scope()
+        context_store.set((1,), Disposable("connection", disposed))
+        context_store.set((3,), Disposable("service", disposed))
+
+        dependency_disposer.dispose_context()
+        context_store.close_scope(scope_token)
+
+        assert disposed == ["service", "connection"]
+
+    def test_dispose_context_without_scope_instances_skips_dependency_order(self, setup_disposer):
+        dependency_store, context_store, dependency_disposer = setup_disposer
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.CONTEXT)
+        dependency_store.sort_dependencies_ids = MagicMock()
+        dependency_store.get_dependencies_levels = MagicMock()
+
+        async def run():
+            scope_token = context_store.open_scope()
+            await dependency_disposer.adispose_context()
+            context_store.close_scope(scope_token)
+
+        scope_token = context_store.open_scope()
+        dependency_disposer.dispose_context()
+        context_store.close_scope(scope_token)
+        asyncio.run(run())
+
+        dependency_store.sort_dependencies_ids.assert_not_called()
+        dependency_store.get_dependencies_levels.assert_not_called()
+
+    def test_adispose_context_awaits_scope_instances_by_level(self, setup_disposer):
+        dependency_store, context_store, dependency_disposer = setup_disposer
+        disposed = []
+
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.CONTEXT)
+        self.add_dependency(dependency_store, (2,), LifecycleEnum.CONTEXT, dependencies_ids=[(1,)])
+        self.add_dependency(dependency_store, (3,), LifecycleEnum.CONTEXT, dependencies_ids=[(2,)])
+
+        async def run():
+            scope_token = context_store.open_scope()
+            context_store.set((1,), AsyncDisposable("connection", disposed))
+            context_store.set((3,), AsyncDisposable("service", disposed))
+            await dependency_disposer.adispose_context()
+            context_store.close_scope(scope_token)
+
+        asyncio.run(run())
+
+        assert disposed == ["service", "connection"]
+
+    def test_dispose_context_releases_pooled_instances(self, setup_disposer):
+        dependency_store, context_store, dependency_disposer = setup_disposer
+        disposed = []
+        implementation_details = self.add_dependency(dependency_store, (1,), LifecycleEnum.POOLED)
+        implementation_details.pool = ObjectPool(1)
+        instance = implementation_details.pool.acquire(lambda: Disposable("pooled", disposed))
+
+        scope_token = context_store.open_scope()
+        ResolvePooledLifecycleStrategy.get_checkouts(context_store.get_scope_state())[((1,), 0, None)] = instance
+
+        dependency_disposer.dispose_context()
+        context_store.close_scope(scope_token)
+
+        assert disposed == []
+        assert implementation_details.pool.acquire(object) is instance
+
+    def test_dispose_singletons_disposes_idle_pooled_instances_before_their_dependencies(self, setup_disposer):
+        dependency_store, _, dependency_disposer = setup_disposer
+        disposed = []
+        self.add_dependency(dependency_store, (1,), LifecycleEnum.SINGLETON, Disposable("connection", disposed))
+        implementation_details = self.add_dependency(dependency_store, (2,), LifecycleEnum.POOLED, dependencies_ids=[(1,)])
+        implementation_details.pool = ObjectPool(2)
+        first_instance = implementation_details.pool.acquire(lambda: Disposable("first", disposed))
+        second_instance = implementation_details.pool.acquire(lambda: Disposable("second", disposed))
+        implementation_details.pool.release(first_instance)
+        implementation_details.pool.release(second_instance)
+
+        dependency_disposer.dispose_singletons()
+
+        assert disposed == ["first", "second", "connection"]
+        assert implementation_details.pool.size == 0
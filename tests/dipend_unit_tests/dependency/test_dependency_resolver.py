@@ -1,9 +1,21 @@
+import asyncio
 from unittest.mock import MagicMock
 import pytest
 from dipend.exceptions.invalid_lifecycle_exception import (
     InvalidLifecycleException,
 )
+from dipend.exceptions.missing_dependency_exception import (
+    MissingDependencyException,
+)
+from dipend.exceptions.async_builder_timeout_exception import (
+    AsyncBuilderTimeoutException,
+)
+from dipend.exceptions.cyclic_dependencies_exception import (
+    CyclicDependenciesException,
+)
 from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
 from dipend.dependency.dependency_store import (
     DependencyStore,
 )
@@ -22,6 +34,20 @@ from dipend.dependency.strategies.resolve_transient_lifecycle_strategy import (
 from dipend.dependency.strategies.resolve_context_lifecycle_strategy import (
     ResolveContextLifecycleStrategy,
 )
+from dipend.dependency.strategies.resolve_lazy_singleton_lifecycle_strategy import (
+    ResolveLazySingletonLifecycleStrategy,
+)
+from dipend.dependency.strategies.resolve_pooled_lifecycle_strategy import (
+    ResolvePooledLifecycleStrategy,
+)
+from dipend.dependency.strategies.resolve_thread_lifecycle_strategy import (
+    ResolveThreadLifecycleStrategy,
+)
+from dipend.dependency.strategies.resolve_cached_lifecycle_strategy import (
+    ResolveCachedLifecycleStrategy,
+)
+from dipend.dependency.lazy_proxy import LazyProxy
+from dipend.context.context_store import ContextStore
 
 
 class TestDependencyResolver:
@@ -47,6 +73,132 @@ class TestDependencyResolver:
             resolver._strategies.get(LifecycleEnum.CONTEXT),
             ResolveContextLifecycleStrategy,
         )
+        assert isinstance(
+            resolver._strategies.get(LifecycleEnum.LAZY_SINGLETON),
+            ResolveLazySingletonLifecycleStrategy,
+        )
+        assert isinstance(
+            resolver._strategies.get(LifecycleEnum.POOLED),
+            ResolvePooledLifecycleStrategy,
+        )
+        assert isinstance(
+            resolver._strategies.get(LifecycleEnum.THREAD),
+            ResolveThreadLifecycleStrategy,
+        )
+        assert isinstance(
+            resolver._strategies.get(LifecycleEnum.CACHED),
+            ResolveCachedLifecycleStrategy,
+        )
+
+    def test_set_observer_dispatcher(self):
+        dependency_store = DependencyStore()
+        dependency_store.add_dependency(DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda: "Instance", [], None, None)))
+        resolver = DependencyResolver(dependency_store)
+        resolver.set_default_resolve_lifecycle_strategies()
+        observer_dispatcher = MagicMock()
+        observer_dispatcher.observe_resolve.side_effect = lambda dependency_registry, callback: callback()
+        observer_dispatcher.observe_construct.side_effect = lambda dependency_registry, callback: callback()
+
+        resolver.set_observer_dispatcher(observer_dispatcher)
+
+        assert resolver.resolve(("dep1",)) == "Instance"
+        assert resolver._strategies.get(LifecycleEnum.TRANSIENT)._observer_dispatcher is observer_dispatcher
+        observer_dispatcher.observe_resolve.assert_called_once()
+        observer_dispatcher.observe_construct.assert_called_once()
+
+        resolver.set_observer_dispatcher(None)
+
+        assert resolver._observer_dispatcher is None
+        assert resolver._strategies.get(LifecycleEnum.TRANSIENT)._observer_dispatcher is None
+        assert resolver.resolve(("dep1",)) == "Instance"
+        observer_dispatcher.observe_resolve.assert_called_once()
+
+    def test_resolve_reports_requested_dependency_only(self):
+        dependency_store = DependencyStore()
+        dependency_store.add_dependency(DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda: "dep1", [], None, None)))
+        dependency_store.add_dependency(DependencyRegistry(("dep2",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda dep1: [dep1], [("dep1",)], None, None)))
+        resolver = DependencyResolver(dependency_store)
+        resolver.set_default_resolve_lifecycle_strategies()
+        observer_dispatcher = MagicMock()
+        observer_dispatcher.observe_resolve.side_effect = lambda dependency_registry, callback: callback()
+        observer_dispatcher.observe_construct.side_effect = lambda dependency_registry, callback: callback()
+        resolver.set_observer_dispatcher(observer_dispatcher)
+
+        assert resolver.resolve(("dep2",)) == ["dep1"]
+        assert [call.args[0].dependency_id for call in observer_dispatcher.observe_resolve.call_args_list] == [("dep2",)]
+        assert [call.args[0].dependency_id for call in observer_dispatcher.observe_construct.call_args_list] == [("dep1",), ("dep2",)]
+
+    def test_add_resolve_lifecycle_strategy_sets_observer_dispatcher(self):
+        resolver = DependencyResolver(MagicMock(DependencyStore))
+        observer_dispatcher = MagicMock()
+        strategy = MagicMock(ResolveTransientLifecycleStrategy)
+        resolver.set_observer_dispatcher(observer_dispatcher)
+
+        resolver.add_resolve_lifecycle_strategy(LifecycleEnum.TRANSIENT, strategy)
+
+        strategy.set_observer_dispatcher.assert_called_once_with(observer_dispatcher)
+
+    def test_resolve_async_and_async_builders_are_observed(self):
+        async def builder():
+            return "Built"
+
+        dependency_store = DependencyStore()
+        dependency_store.add_dependency(DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(None, [], builder, None, True)))
+        resolver = DependencyResolver(dependency_store)
+        resolver.set_default_resolve_lifecycle_strategies()
+        observer_dispatcher = MagicMock()
+
+        async def observe(dependency_registry, callback):
+            return await callback()
+
+        observer_dispatcher.observe_resolve_async.side_effect = observe
+        observer_dispatcher.observe_construct_async.side_effect = observe
+        resolver.set_observer_dispatcher(observer_dispatcher)
+
+        assert asyncio.run(resolver.resolve_async(("dep1",))) == "Built"
+        observer_dispatcher.observe_resolve_async.assert_called_once()
+        observer_dispatcher.observe_construct_async.assert_called_once()
+
+    def test_compile_observes_retrievals_only(self):
+        dependency_store = DependencyStore()
+        dependency_store.add_dependency(DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda: "dep1", [], None, None)))
+        dependency_store.add_dependency(DependencyRegistry(("dep2",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda dep1: [dep1], [("dep1",)], None, None)))
+        resolver = DependencyResolver(dependency_store)
+        resolver.set_default_resolve_lifecycle_strategies()
+        observed = []
+        observer_dispatcher = MagicMock()
+        observer_dispatcher.wrap_resolve.side_effect = lambda dependency_registry, factory: lambda: observed.append(dependency_registry.dependency_id) or factory()
+        observer_dispatcher.observe_construct.side_effect = lambda dependency_registry, construct: construct()
+        resolver.set_observer_dispatcher(observer_dispatcher)
+
+        compiled_factories = resolver.compile()
+
+        assert compiled_factories[("dep2",)]() == ["dep1"]
+        assert observed == [("dep2",)]
+        assert observer_dispatcher.observe_construct.call_count == 2
+
+    def test_invalidate_cached(self):
+        resolver = DependencyResolver(MagicMock(DependencyStore))
+        cached_strategy = MagicMock(ResolveCachedLifecycleStrategy)
+        resolver.add_resolve_lifecycle_strategy(LifecycleEnum.CACHED, cached_strategy)
+
+        resolver.invalidate_cached(("dep1",))
+        resolver.invalidate_cached()
+
+        assert [call.args for call in cached_strategy.invalidate.call_args_list] == [(("dep1",),), (None,)]
+
+    def test_invalidate_cached_without_cached_strategy(self):
+        resolver = DependencyResolver(MagicMock(DependencyStore))
+
+        resolver.invalidate_cached(("dep1",))
+
+    def test_set_default_resolve_lifecycle_strategies_shares_context_store(self):
+        context_store = ContextStore()
+        resolver = DependencyResolver(MagicMock(DependencyStore), context_store)
+
+        resolver.set_default_resolve_lifecycle_strategies()
+
+        assert resolver._strategies.get(LifecycleEnum.CONTEXT)._context_wrapper is context_store
 
     def test_add_resolve_lifecycle_strategy(self, setup_resolver):
         dependency_store, resolver = setup_resolver
@@ -122,3 +274,372 @@ class TestDependencyResolver:
         resolver._use_lifecycle_strategy.assert_called_once_with(dependency_registry_1, ["ResolvedInstance2"])
 
         assert result == "ResolvedInstance1"
+
+    def test_resolve_deep_chain_without_recursion(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        depth = 5000
+        registries = {
+            (index,): DependencyRegistry(
+                (index,),
+                LifecycleEnum.TRANSIENT,
+                ImplementationDetails(lambda *args: 1 + sum(args), [(index - 1,)] if index > 0 else [], None, None),
+            )
+            for index in range(depth)
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        result = resolver.resolve((depth - 1,))
+
+        assert result == depth
+
+    def test_resolve_reuses_buffers_between_siblings(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        registries = {
+            ("leaf",): DependencyRegistry(("leaf",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda: "leaf", [], None, None)),
+            ("left",): DependencyRegistry(("left",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: ("left", *args), [("leaf",)], None, None)),
+            ("right",): DependencyRegistry(
+                ("right",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: ("right", *args), [("leaf",), ("leaf",)], None, None)
+            ),
+            ("root",): DependencyRegistry(("root",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("left",), ("right",)], None, None)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        result = resolver.resolve(("root",))
+
+        assert result == (("left", "leaf"), ("right", "leaf", "leaf"))
+
+    def test_resolve_skips_subgraph_of_context_instances(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        leaf_class_constructor = MagicMock(return_value="leaf")
+        registries = {
+            ("leaf",): DependencyRegistry(("leaf",), LifecycleEnum.TRANSIENT, ImplementationDetails(leaf_class_constructor, [], None, None)),
+            ("shared",): DependencyRegistry(("shared",), LifecycleEnum.CONTEXT, ImplementationDetails(lambda *args: ("shared", *args), [("leaf",)], None, None)),
+            ("left",): DependencyRegistry(("left",), LifecycleEnum.CONTEXT, ImplementationDetails(lambda *args: ("left", *args), [("shared",)], None, None)),
+            ("root",): DependencyRegistry(("root",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("left",), ("shared",)], None, None)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        result = resolver.resolve(("root",))
+
+        assert result == (("left", ("shared", "leaf")), ("shared", "leaf"))
+        assert result[0][1] is result[1]
+        leaf_class_constructor.assert_called_once()
+
+    def test_resolve_only_asks_strategies_keeping_resolved_instances(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        transient_strategy = resolver._strategies.get(LifecycleEnum.TRANSIENT)
+        context_strategy = resolver._strategies.get(LifecycleEnum.CONTEXT)
+        transient_strategy.find_resolved_instance = MagicMock()
+        context_strategy.find_resolved_instance = MagicMock(return_value="context")
+        registries = {
+            ("transient",): DependencyRegistry(("transient",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda: "transient", [], None, None)),
+            ("context",): DependencyRegistry(("context",), LifecycleEnum.CONTEXT, ImplementationDetails(lambda: "built", [], None, None)),
+            ("root",): DependencyRegistry(("root",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("transient",), ("context",)], None, None)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        assert resolver.resolve(("root",)) == ("transient", "context")
+        assert transient_strategy.keeps_resolved_instances is False
+        assert context_strategy.keeps_resolved_instances is True
+        transient_strategy.find_resolved_instance.assert_not_called()
+        context_strategy.find_resolved_instance.assert_called_once_with(registries[("context",)])
+
+    def test_resolve_raises_cyclic_dependencies_exception(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(object, [("dep2",)], None, None)),
+            ("dep2",): DependencyRegistry(("dep2",), LifecycleEnum.TRANSIENT, ImplementationDetails(object, [("dep3",)], None, None)),
+            ("dep3",): DependencyRegistry(("dep3",), LifecycleEnum.TRANSIENT, ImplementationDetails(object, [("dep2",)], None, None)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        with pytest.raises(CyclicDependenciesException) as exception_info:
+            resolver.resolve(("dep1",))
+
+        assert exception_info.value.dependency_ids == [("dep2",), ("dep3",)]
+
+    def test_compile_falls_back_to_resolve_past_max_compiled_depth(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        depth = DependencyResolver.MAX_COMPILED_DEPTH * 20
+        registries = {
+            (index,): DependencyRegistry(
+                (index,),
+                LifecycleEnum.TRANSIENT,
+                ImplementationDetails(lambda *args: 1 + sum(args), [(index - 1,)] if index > 0 else [], None, None),
+            )
+            for index in range(depth)
+        }
+
+        dependency_store.get_sorted_dependencies_ids.return_value = list(registries)
+        dependency_store.find_dependency.side_effect = registries.get
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        result = resolver.compile()
+
+        assert result[(DependencyResolver.MAX_COMPILED_DEPTH - 1,)]() == DependencyResolver.MAX_COMPILED_DEPTH
+        assert result[(depth - 1,)]() == depth
+
+    def test_construct_async_builder_awaits_builder(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+
+        async def builder():
+            return "BuiltInstance"
+
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], builder, None, True))
+
+        result = asyncio.run(resolver.construct_async_builder(dependency_registry))
+
+        assert result == "BuiltInstance"
+
+    def test_construct_async_builder_raises_async_builder_timeout_exception(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+
+        async def builder():
+            await asyncio.sleep(1)
+
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], builder, None, True, 0.01))
+
+        with pytest.raises(AsyncBuilderTimeoutException):
+            asyncio.run(resolver.construct_async_builder(dependency_registry))
+
+    def test_resolve_built_delegates_to_use_lifecycle_strategy(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        dependency_registry = MagicMock(lifecycle=LifecycleEnum.SINGLETON, dependency_id="dep1")
+        resolver._use_lifecycle_strategy = MagicMock(return_value="ResolvedInstance")
+
+        result = resolver.resolve_built(dependency_registry, "BuiltInstance")
+
+        resolver._use_lifecycle_strategy.assert_called_once_with(dependency_registry, [], "BuiltInstance")
+        assert result == "ResolvedInstance"
+
+    def test_resolve_built_publishes_through_strategy_and_reports_construction(self):
+        dependency_store = DependencyStore()
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None))
+        dependency_store.add_dependency(dependency_registry)
+        resolver = DependencyResolver(dependency_store)
+        resolver.set_default_resolve_lifecycle_strategies()
+        observer_dispatcher = MagicMock()
+        observer_dispatcher.observe_resolve.side_effect = lambda dependency_registry, callback: callback()
+        resolver.set_observer_dispatcher(observer_dispatcher)
+
+        assert resolver.resolve_built(dependency_registry, "First", 42) == "First"
+        assert resolver.resolve_built(dependency_registry, "Second", 42) == "First"
+        observer_dispatcher.report_construct.assert_called_with(dependency_registry, 42)
+        assert observer_dispatcher.observe_resolve.call_count == 2
+
+    def _create_async_builder(self, started, delay=0.01):
+        async def builder():
+            started.append(len(started))
+            await asyncio.sleep(delay)
+            return object()
+
+        return builder
+
+    def test_resolve_async_awaits_sibling_builders_concurrently(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        started = []
+        running = []
+
+        async def builder():
+            running.append(len(running))
+            await asyncio.sleep(0.01)
+            started.append(len(running))
+            return len(started)
+
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("dep2",), ("dep3",)], None, None)),
+            ("dep2",): DependencyRegistry(("dep2",), LifecycleEnum.TRANSIENT, ImplementationDetails(None, [], builder, None, True)),
+            ("dep3",): DependencyRegistry(("dep3",), LifecycleEnum.TRANSIENT, ImplementationDetails(None, [], builder, None, True)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        result = asyncio.run(resolver.resolve_async(("dep1",)))
+
+        assert started == [2, 2]
+        assert sorted(result) == [1, 2]
+
+    def test_resolve_async_stores_context_instances_in_caller_context(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        started = []
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.CONTEXT, ImplementationDetails(lambda *args: args, [("dep2",), ("dep2",)], None, None)),
+            ("dep2",): DependencyRegistry(("dep2",), LifecycleEnum.CONTEXT, ImplementationDetails(None, [], self._create_async_builder(started), None, True)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        async def resolve_twice():
+            first = await resolver.resolve_async(("dep1",))
+            second = await resolver.resolve_async(("dep2",))
+            return first, second
+
+        (first_dependency, second_dependency), dependency = asyncio.run(resolve_twice())
+
+        assert started == [0]
+        assert first_dependency is second_dependency is dependency
+
+    def test_resolve_async_builds_transient_for_every_use(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        started = []
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("dep2",), ("dep2",)], None, None)),
+            ("dep2",): DependencyRegistry(("dep2",), LifecycleEnum.TRANSIENT, ImplementationDetails(None, [], self._create_async_builder(started), None, True)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        first_dependency, second_dependency = asyncio.run(resolver.resolve_async(("dep1",)))
+
+        assert started == [0, 1]
+        assert first_dependency is not second_dependency
+
+    def test_resolve_async_returns_resolved_instance(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, "ResolvedInstance"))
+
+        dependency_store.get_dependency.return_value = dependency_registry
+
+        assert asyncio.run(resolver.resolve_async(("dep1",))) == "ResolvedInstance"
+
+    def test_resolve_async_resolves_async_builder_root(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], self._create_async_builder([]), None, True))
+
+        dependency_store.get_dependency.return_value = dependency_registry
+
+        result = asyncio.run(resolver.resolve_async(("dep1",)))
+
+        assert dependency_registry.implementation_details.instance is result
+
+    def test_resolve_async_builds_singleton_once_for_concurrent_calls(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        started = []
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("dep2",)], None, None)),
+            ("dep2",): DependencyRegistry(("dep2",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], self._create_async_builder(started), None, True)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        async def resolve_concurrently():
+            return await asyncio.gather(*[resolver.resolve_async(("dep2",)) for _ in range(5)], *[resolver.resolve_async(("dep1",)) for _ in range(5)])
+
+        results = asyncio.run(resolve_concurrently())
+
+        assert started == [0]
+        assert all(result is results[0] for result in results[:5])
+        assert all(result == (results[0],) for result in results[5:])
+        assert resolver._async_builds == {}
+
+    def test_resolve_async_keeps_shared_build_running_when_a_caller_is_cancelled(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        started = []
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], self._create_async_builder(started), None, True))
+
+        dependency_store.get_dependency.return_value = dependency_registry
+
+        async def cancel_first_caller():
+            first_caller = asyncio.ensure_future(resolver.resolve_async(("dep1",)))
+            second_caller = asyncio.ensure_future(resolver.resolve_async(("dep1",)))
+            await asyncio.sleep(0)
+            first_caller.cancel()
+
+            return await second_caller
+
+        result = asyncio.run(cancel_first_caller())
+
+        assert started == [0]
+        assert dependency_registry.implementation_details.instance is result
+
+    def test_resolve_async_raises_cyclic_dependencies_exception(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(object, [("dep2",)], None, None)),
+            ("dep2",): DependencyRegistry(("dep2",), LifecycleEnum.TRANSIENT, ImplementationDetails(object, [("dep1",)], None, None)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        with pytest.raises(CyclicDependenciesException):
+            asyncio.run(resolver.resolve_async(("dep1",)))
+
+    def test_find_resolved_instance_without_strategy(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        dependency_registry = MagicMock(lifecycle="INVALID", implementation_details=MagicMock(instance="Instance"))
+
+        assert resolver._find_resolved_instance(dependency_registry) == "Instance"
+
+    def test_resolve_defers_lazy_singleton_class_constructor_dependencies(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        built = []
+        registries = {
+            ("dep1",): DependencyRegistry(("dep1",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda *args: args, [("dep2",)], None, None)),
+            ("dep2",): DependencyRegistry(
+                ("dep2",), LifecycleEnum.LAZY_SINGLETON, ImplementationDetails(lambda *args: built.append("dep2") or args, [("dep3",)], None, None)
+            ),
+            ("dep3",): DependencyRegistry(("dep3",), LifecycleEnum.TRANSIENT, ImplementationDetails(lambda: built.append("dep3") or "dep3", [], None, None)),
+        }
+
+        dependency_store.get_dependency.side_effect = registries.__getitem__
+
+        (lazy_dependency,) = resolver.resolve(("dep1",))
+
+        assert isinstance(lazy_dependency, LazyProxy)
+        assert built == []
+        assert list(lazy_dependency) == ["dep3"]
+        assert built == ["dep3", "dep2"]
+
+    def test_compile_binds_class_constructor_dependencies_factories(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        implementation_details_1 = MagicMock(class_constructor_dependencies_ids=["dep2"])
+        implementation_details_2 = MagicMock(class_constructor_dependencies_ids=[])
+        dependency_registry_1 = MagicMock(lifecycle=LifecycleEnum.TRANSIENT, dependency_id="dep1", implementation_details=implementation_details_1)
+        dependency_registry_2 = MagicMock(lifecycle=LifecycleEnum.SINGLETON, dependency_id="dep2", implementation_details=implementation_details_2)
+        singleton_strategy = MagicMock()
+        singleton_strategy.compile.return_value = "Factory2"
+        transient_strategy = MagicMock()
+        transient_strategy.compile.return_value = "Factory1"
+
+        resolver._strategies.set(LifecycleEnum.SINGLETON, singleton_strategy)
+        resolver._strategies.set(LifecycleEnum.TRANSIENT, transient_strategy)
+
+        dependency_store.get_sorted_dependencies_ids.return_value = ["dep2", "dep1"]
+        dependency_store.find_dependency.side_effect = lambda dependency_id: {
+            "dep1": dependency_registry_1,
+            "dep2": dependency_registry_2,
+        }.get(dependency_id)
+
+        result = resolver.compile()
+
+        singleton_strategy.compile.assert_called_once_with(dependency_registry_2, [])
+        transient_strategy.compile.assert_called_once_with(dependency_registry_1, ["Factory2"])
+        assert result == {"dep2": "Factory2", "dep1": "Factory1"}
+
+    def test_compile_missing_dependency_factory_raises(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+
+        dependency_store.get_sorted_dependencies_ids.return_value = ["dep1"]
+        dependency_store.find_dependency.return_value = None
+
+        result = resolver.compile()
+
+        with pytest.raises(MissingDependencyException):
+            result["dep1"]()
+
+    def test_compile_invalid_lifecycle_factory_raises(self, setup_resolver):
+        dependency_store, resolver = setup_resolver
+        dependency_registry = MagicMock(lifecycle="INVALID", dependency_id="dep1")
+
+        dependency_store.get_sorted_dependencies_ids.return_value = ["dep1"]
+        dependency_store.find_dependency.return_value = dependency_registry
+
+        result = resolver.compile()
+
+        with pytest.raises(InvalidLifecycleException):
+            result["dep1"]()
@@ -22,6 +22,13 @@ class TestDependencyStore:
 
         assert result == mock_registry
 
+    def test_find_dependency(self, dependency_store):
+        mock_registry = MagicMock(dependency_id="dep1")
+        dependency_store.add_dependency(mock_registry)
+
+        assert dependency_store.find_dependency("dep1") == mock_registry
+        assert dependency_store.find_dependency("non_existent") is None
+
     def test_get_dependency_return_none_for_missing_dependency(self, dependency_store):
         with pytest.raises(MissingDependencyException):
             dependency_store.get_dependency("non_existent")
@@ -47,6 +54,19 @@ class TestDependencyStore:
         assert result.graph == expected_graph
         assert result.input_degree == expected_input_degree
 
+    def test_initialize_graph_and_degrees_keeps_every_class_constructor_dependency(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2", "dep3"]),
+        )
+
+        dependency_store.add_dependency(mock_registry_1)
+
+        result = dependency_store._initialize_graph_and_degrees()
+
+        assert result.graph == {"dep1": ["dep2", "dep3"]}
+        assert result.input_degree == {"dep1": 0, "dep2": 1, "dep3": 1}
+
     def test_perform_topological_sort(self, dependency_store):
         graph = {"dep1": ["dep2"]}
         input_degree = {"dep1": 0, "dep2": 1}
@@ -62,6 +82,37 @@ class TestDependencyStore:
         with pytest.raises(CyclicDependenciesException):
             dependency_store._detect_and_raise_cyclic_dependencies(graph, input_degree)
 
+    def test_find_strongly_connected_components(self, dependency_store):
+        graph = {"dep1": ["dep2"], "dep2": ["dep3"], "dep3": ["dep1", "dep4"]}
+
+        result = dependency_store._find_strongly_connected_components(graph, ["dep1", "dep4"])
+
+        assert sorted(map(sorted, result)) == [["dep1", "dep2", "dep3"], ["dep4"]]
+
+    def test_detect_and_raise_cyclic_dependencies_reports_only_cycle_members(self, dependency_store):
+        graph = {"dep1": ["dep2"], "dep2": ["dep3"], "dep3": ["dep2", "dep4"]}
+        input_degree = {"dep1": 0, "dep2": 1, "dep3": 1, "dep4": 1}
+
+        with pytest.raises(CyclicDependenciesException) as excinfo:
+            dependency_store._detect_and_raise_cyclic_dependencies(graph, input_degree)
+
+        assert excinfo.value.dependency_ids == ["dep2", "dep3"]
+
+    def test_detect_and_raise_cyclic_dependencies_reports_self_dependency(self, dependency_store):
+        graph = {"dep1": ["dep1"]}
+        input_degree = {"dep1": 1}
+
+        with pytest.raises(CyclicDependenciesException) as excinfo:
+            dependency_store._detect_and_raise_cyclic_dependencies(graph, input_degree)
+
+        assert excinfo.value.dependency_ids == ["dep1"]
+
+    def test_detect_and_raise_cyclic_dependencies_does_not_raise_without_cycles(self, dependency_store):
+        graph = {"dep1": ["dep2"]}
+        input_degree = {"dep1": 0, "dep2": 1}
+
+        dependency_store._detect_and_raise_cyclic_dependencies(graph, input_degree)
+
     def test_get_sorted_dependencies_ids(self, dependency_store):
         mock_registry_1 = MagicMock(
             dependency_id="dep1",
@@ -79,7 +130,7 @@ class TestDependencyStore:
 
         assert result == ["dep2", "dep1"]
 
-    def test_cache_sorted_dependencies_ids(self, dependency_store):
+    def test_get_sorted_dependencies_ids_keeps_order_incrementally(self, dependency_store):
         mock_registry_1 = MagicMock(
             dependency_id="dep1",
             implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"]),
@@ -89,18 +140,97 @@ class TestDependencyStore:
             implementation_details=MagicMock(class_constructor_dependencies_ids=[]),
         )
 
-        dependency_store.add_dependency(mock_registry_1)
-        dependency_store.add_dependency(mock_registry_2)
-
         dependency_store._initialize_graph_and_degrees = MagicMock(wraps=dependency_store._initialize_graph_and_degrees)
 
+        dependency_store.add_dependency(mock_registry_1)
         result = dependency_store.get_sorted_dependencies_ids()
+        dependency_store.add_dependency(mock_registry_2)
         result = dependency_store.get_sorted_dependencies_ids()
 
-        dependency_store._initialize_graph_and_degrees.assert_called_once()
+        dependency_store._initialize_graph_and_degrees.assert_not_called()
 
         assert result == ["dep2", "dep1"]
 
+    def test_invalidate_sorted_dependencies_ids_rebuilds_order_once(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=[]),
+        )
+
+        dependency_store.invalidate_sorted_dependencies_ids()
+        dependency_store._topological_order.add_edge = MagicMock()
+
+        dependency_store.add_dependency(mock_registry_1)
+        dependency_store.add_dependency(mock_registry_2)
+
+        assert dependency_store.get_sorted_dependencies_ids() == ["dep2", "dep1"]
+        dependency_store._topological_order.add_edge.assert_not_called()
+
+    def test_get_sorted_dependencies_ids_after_replacing_dependency(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=[]),
+        )
+        mock_registry_2_replacement = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep3"]),
+        )
+
+        dependency_store.add_dependency(mock_registry_1)
+        dependency_store.add_dependency(mock_registry_2)
+        dependency_store.add_dependency(mock_registry_2_replacement)
+
+        assert dependency_store.get_sorted_dependencies_ids() == ["dep3", "dep2", "dep1"]
+
+    def test_get_sorted_dependencies_ids_after_deleting_dependency(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep3"]),
+        )
+
+        dependency_store.add_dependency(mock_registry_1)
+        dependency_store.add_dependency(mock_registry_2)
+
+        dependency_store.delete_dependency("dep2")
+
+        assert dependency_store.get_sorted_dependencies_ids() == ["dep2", "dep1"]
+
+        dependency_store.delete_dependency("dep1")
+
+        assert dependency_store.get_sorted_dependencies_ids() == []
+
+    def test_get_sorted_dependencies_ids_after_breaking_cycle(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep1"]),
+        )
+
+        dependency_store.add_dependency(mock_registry_1)
+        dependency_store.add_dependency(mock_registry_2)
+
+        with pytest.raises(CyclicDependenciesException):
+            dependency_store.get_sorted_dependencies_ids()
+
+        dependency_store.delete_dependency("dep2")
+
+        assert dependency_store.get_sorted_dependencies_ids() == ["dep2", "dep1"]
+
     def test_get_sorted_dependencies_ids_raises_cyclic_dependencies_exception(self, dependency_store):
         mock_registry_1 = MagicMock(
             dependency_id="dep1",
@@ -117,6 +247,46 @@ class TestDependencyStore:
         with pytest.raises(CyclicDependenciesException):
             dependency_store.get_sorted_dependencies_ids()
 
+    def test_get_sorted_dependencies_ids_with_many_class_constructor_dependencies(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2", "dep3"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep3"]),
+        )
+        mock_registry_3 = MagicMock(
+            dependency_id="dep3",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=[]),
+        )
+
+        dependency_store.add_dependency(mock_registry_1)
+        dependency_store.add_dependency(mock_registry_2)
+        dependency_store.add_dependency(mock_registry_3)
+
+        result = dependency_store.get_sorted_dependencies_ids()
+
+        assert result == ["dep3", "dep2", "dep1"]
+
+    def test_get_sorted_dependencies_ids_raises_cyclic_dependencies_exception_with_missing_dependency(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2", "missing"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep1"]),
+        )
+
+        dependency_store.add_dependency(mock_registry_1)
+        dependency_store.add_dependency(mock_registry_2)
+
+        with pytest.raises(CyclicDependenciesException) as excinfo:
+            dependency_store.get_sorted_dependencies_ids()
+
+        assert sorted(excinfo.value.dependency_ids) == ["dep1", "dep2"]
+
     def test_delete_token_removes_token_registry(self, dependency_store):
         dependency_id = "dep1"
         mock_registry = MagicMock(
@@ -144,3 +314,52 @@ class TestDependencyStore:
 
         with pytest.raises(MissingDependencyException):
             dependency_store.get_dependency(dependency_id)
+
+    def test_get_dependencies_ids_by_level(self, dependency_store):
+        mock_registry_1 = MagicMock(
+            dependency_id="dep1",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2", "dep3"]),
+        )
+        mock_registry_2 = MagicMock(
+            dependency_id="dep2",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep3"]),
+        )
+        mock_registry_3 = MagicMock(
+            dependency_id="dep3",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=[]),
+        )
+        mock_registry_4 = MagicMock(
+            dependency_id="dep4",
+            implementation_details=MagicMock(class_constructor_dependencies_ids=["dep5"]),
+        )
+
+        for mock_registry in [mock_registry_1, mock_registry_2, mock_registry_3, mock_registry_4]:
+            dependency_store.add_dependency(mock_registry)
+
+        result = dependency_store.get_dependencies_ids_by_level()
+
+        assert [sorted(level) for level in result] == [["dep3", "dep5"], ["dep2", "dep4"], ["dep1"]]
+
+    def test_sort_dependencies_ids(self, dependency_store):
+        dependency_store.add_dependency(MagicMock(dependency_id="dep1", implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"])))
+        dependency_store.add_dependency(MagicMock(dependency_id="dep2", implementation_details=MagicMock(class_constructor_dependencies_ids=["dep3"])))
+        dependency_store.add_dependency(MagicMock(dependency_id="dep3", implementation_details=MagicMock(class_constructor_dependencies_ids=[])))
+
+        assert dependency_store.sort_dependencies_ids(["dep1", "dep3"]) == ["dep3", "dep1"]
+
+        dependency_store.invalidate_sorted_dependencies_ids()
+
+        assert dependency_store.sort_dependencies_ids(["dep2", "dep1", "dep3"]) == ["dep3", "dep2", "dep1"]
+
+    def test_get_dependencies_levels_is_kept_until_graph_changes(self, dependency_store):
+        dependency_store.add_dependency(MagicMock(dependency_id="dep1", implementation_details=MagicMock(class_constructor_dependencies_ids=["dep2"])))
+        dependency_store.add_dependency(MagicMock(dependency_id="dep2", implementation_details=MagicMock(class_constructor_dependencies_ids=[])))
+
+        dependencies_levels = dependency_store.get_dependencies_levels()
+
+        assert dependencies_levels == {"dep2": 0, "dep1": 1}
+        assert dependency_store.get_dependencies_levels() is dependencies_levels
+
+        dependency_store.add_dependency(MagicMock(dependency_id="dep3", implementation_details=MagicMock(class_constructor_dependencies_ids=["dep1"])))
+
+        assert dependency_store.get_dependencies_levels() == {"dep2": 0, "dep1": 1, "dep3": 2}
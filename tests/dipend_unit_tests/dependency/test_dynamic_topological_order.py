@@ -0,0 +1,112 @@
+import pytest
+from dipend.dependency.dynamic_topological_order import DynamicTopologicalOrder
+
+
+class TestDynamicTopologicalOrder:
+    @pytest.fixture
+    def topological_order(self):
+        return DynamicTopologicalOrder()
+
+    def test_add_node(self, topological_order):
+        topological_order.add_node("node1")
+        topological_order.add_node("node2")
+        topological_order.add_node("node1")
+
+        assert topological_order.has_node("node1")
+        assert topological_order.get_sorted_nodes() == ["node1", "node2"]
+
+    def test_add_edge_keeps_order_when_already_satisfied(self, topological_order):
+        topological_order.add_node("node1")
+        topological_order.add_node("node2")
+
+        assert topological_order.add_edge("node1", "node2")
+        assert topological_order.get_sorted_nodes() == ["node1", "node2"]
+        assert topological_order.has_successors("node1")
+        assert topological_order.has_predecessors("node2")
+
+    def test_add_edge_reorders_affected_region(self, topological_order):
+        for node in ["node1", "node2", "node3", "node4"]:
+            topological_order.add_node(node)
+
+        topological_order.add_edge("node2", "node3")
+
+        assert topological_order.add_edge("node3", "node1")
+        assert topological_order.get_sorted_nodes() == ["node2", "node3", "node1", "node4"]
+
+    def test_add_edge_rejects_cycle(self, topological_order):
+        topological_order.add_edge("node1", "node2")
+        topological_order.add_edge("node2", "node3")
+
+        assert not topological_order.add_edge("node3", "node1")
+        assert not topological_order.has_successors("node3")
+        assert topological_order.get_sorted_nodes() == ["node1", "node2", "node3"]
+
+    def test_add_edge_rejects_self_edge(self, topological_order):
+        assert not topological_order.add_edge("node1", "node1")
+
+    def test_load(self, topological_order):
+        topological_order.add_node("node4")
+
+        topological_order.load(["node1", "node2", "node3"], [("node1", "node2"), ("node1", "node2"), ("node2", "node3")])
+
+        assert not topological_order.has_node("node4")
+        assert topological_order.get_sorted_nodes() == ["node1", "node2", "node3"]
+        assert not topological_order.add_edge("node3", "node1")
+
+        topological_order.remove_edge("node1", "node2")
+
+        assert topological_order.has_predecessors("node2")
+
+    def test_sort_nodes(self, topological_order):
+        topological_order.add_edge("node3", "node2")
+        topological_order.add_edge("node2", "node1")
+        topological_order.add_node("node4")
+
+        assert topological_order.sort_nodes({"node1", "node3", "node4"}) == ["node3", "node1", "node4"]
+
+    def test_add_and_remove_repeated_edge(self, topological_order):
+        topological_order.add_edge("node1", "node2")
+        topological_order.add_edge("node1", "node2")
+
+        topological_order.remove_edge("node1", "node2")
+
+        assert topological_order.has_successors("node1")
+
+        topological_order.remove_edge("node1", "node2")
+        topological_order.remove_edge("node1", "node2")
+
+        assert not topological_order.has_successors("node1")
+        assert not topological_order.has_predecessors("node2")
+
+    def test_remove_node(self, topological_order):
+        topological_order.add_edge("node1", "node2")
+        topological_order.add_edge("node2", "node3")
+
+        topological_order.remove_node("node2")
+        topological_order.remove_node("missing")
+
+        assert not topological_order.has_node("node2")
+        assert not topological_order.has_successors("node1")
+        assert not topological_order.has_predecessors("node3")
+        assert topological_order.get_sorted_nodes() == ["node1", "node3"]
+
+    def test_remove_node_compacts_positions(self, topological_order):
+        for index in range(100):
+            topological_order.add_node(index)
+
+        for index in range(90):
+            topological_order.remove_node(index)
+
+        assert len(topological_order._positions) < 100
+        assert topological_order.get_sorted_nodes() == list(range(90, 100))
+
+        assert topological_order.add_edge(99, 90)
+        assert topological_order.get_sorted_nodes()[0] == 99
+
+    def test_clear(self, topological_order):
+        topological_order.add_edge("node1", "node2")
+
+        topological_order.clear()
+
+        assert topological_order.get_sorted_nodes() == []
+        assert not topological_order.has_node("node1")
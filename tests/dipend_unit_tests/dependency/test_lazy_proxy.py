@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+import pytest
+from dipend.dependency.lazy_proxy import LazyProxy
+
+
+class Target:
+    def __init__(self):
+        self.value = 1
+        self.items = {"key": "value"}
+
+    def __call__(self, argument):
+        return argument * 2
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def __getitem__(self, key):
+        return self.items[key]
+
+    def __setitem__(self, key, value):
+        self.items[key] = value
+
+    def __delitem__(self, key):
+        del self.items[key]
+
+    def __enter__(self):
+        return "entered"
+
+    def __exit__(self, *args):
+        return False
+
+    async def __aenter__(self):
+        return "async-entered"
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __repr__(self):
+        return "Target()"
+
+
+class TestLazyProxy:
+    @pytest.fixture
+    def factory(self):
+        return MagicMock(side_effect=Target)
+
+    @pytest.fixture
+    def proxy(self, factory):
+        return LazyProxy(factory, Target)
+
+    def test_does_not_build_until_used(self, proxy, factory):
+        assert isinstance(proxy, Target)
+        assert not proxy.is_lazy_target_built()
+        factory.assert_not_called()
+
+    def test_builds_once_on_attribute_access(self, proxy, factory):
+        assert proxy.value == 1
+        assert proxy.value == 1
+
+        factory.assert_called_once()
+        assert proxy.is_lazy_target_built()
+        assert isinstance(proxy, Target)
+
+    def test_forwards_attribute_writes(self, proxy):
+        proxy.value = 2
+        assert proxy.value == 2
+
+        del proxy.value
+        assert not hasattr(proxy, "value")
+
+    def test_forwards_special_methods(self, proxy):
+        assert proxy(2) == 4
+        assert len(proxy) == 1
+        assert list(proxy) == ["key"]
+        assert "key" in proxy
+        assert proxy["key"] == "value"
+
+        proxy["other"] = "other-value"
+        assert proxy["other"] == "other-value"
+
+        del proxy["other"]
+        assert "other" not in proxy
+
+        assert repr(proxy) == "Target()"
+        assert str(proxy) == "Target()"
+        assert bool(proxy)
+        assert "value" in dir(proxy)
+
+    def test_forwards_comparison_and_hash(self):
+        proxy = LazyProxy(lambda: "target")
+
+        assert proxy == "target"
+        assert not (proxy != "target")
+        assert hash(proxy) == hash("target")
+        assert proxy.__class__ is str
+
+    def test_forwards_context_managers(self, proxy):
+        with proxy as entered:
+            assert entered == "entered"
+
+        async def enter():
+            async with proxy as entered:
+                return entered
+
+        assert asyncio.run(enter()) == "async-entered"
+
+    def test_builds_once_across_threads(self):
+        threads = 8
+        barrier = Barrier(threads)
+
+        def build():
+            sleep(0.01)
+            return Target()
+
+        factory = MagicMock(side_effect=build)
+        proxy = LazyProxy(factory)
+
+        def read():
+            barrier.wait()
+            return proxy.value
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            assert list(executor.map(lambda _: read(), range(threads))) == [1] * threads
+
+        factory.assert_called_once()
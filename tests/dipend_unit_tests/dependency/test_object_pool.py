@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import pytest
+from dipend.dependency.object_pool import ObjectPool
+
+
+class TestObjectPool:
+    def test_acquire_creates_until_max_size(self):
+        pool = ObjectPool(2)
+
+        first_instance = pool.acquire(object)
+        second_instance = pool.acquire(object)
+
+        assert first_instance is not second_instance
+        assert pool.size == 2
+
+    def test_acquire_reuses_released_instance(self):
+        pool = ObjectPool(1)
+        instance = pool.acquire(object)
+
+        pool.release(instance)
+
+        assert pool.acquire(object) is instance
+        assert pool.size == 1
+
+    def test_acquire_raises_when_timeout_expires(self):
+        pool = ObjectPool(1, timeout=0.01)
+        pool.acquire(object)
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(object)
+
+    def test_acquire_waits_for_release(self):
+        pool = ObjectPool(1, timeout=5)
+        instance = pool.acquire(object)
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(object)))
+        waiter.start()
+        pool.release(instance)
+        waiter.join()
+
+        assert acquired == [instance]
+
+    def test_acquire_frees_room_when_factory_raises(self):
+        pool = ObjectPool(1, timeout=0.01)
+
+        def factory():
+            raise KeyError("error")
+
+        with pytest.raises(KeyError):
+            pool.acquire(factory)
+
+        assert pool.size == 0
+        assert pool.acquire(object) is not None
+
+    def test_acquire_async_waits_without_blocking_event_loop(self):
+        pool = ObjectPool(1, timeout=5)
+        instance = pool.acquire(object)
+
+        async def release_later():
+            await asyncio.sleep(0.01)
+            pool.release(instance)
+
+        async def run():
+            acquired, _ = await asyncio.gather(pool.acquire_async(object), release_later())
+            return acquired
+
+        assert asyncio.run(run()) is instance
+
+    def test_acquire_async_cancelled_waiter_does_not_keep_instance(self):
+        pool = ObjectPool(1)
+        instance = pool.acquire(object)
+
+        async def run():
+            waiting_task = asyncio.create_task(pool.acquire_async(object))
+            await asyncio.sleep(0)
+
+            waiting_task.cancel()
+            pool.release(instance)
+
+            with pytest.raises(asyncio.CancelledError):
+                await waiting_task
+
+            await asyncio.sleep(0)
+
+            return await asyncio.wait_for(pool.acquire_async(object), 1)
+
+        assert asyncio.run(run()) is instance
+        assert pool.size == 1
+        assert len(pool._async_waiters) == 0
+
+    def test_acquire_async_cancelled_after_hand_over_gives_instance_back(self):
+        pool = ObjectPool(1)
+        instance = pool.acquire(object)
+
+        async def run():
+            waiting_task = asyncio.create_task(pool.acquire_async(object))
+            await asyncio.sleep(0)
+
+            pool.release(instance)
+            await asyncio.sleep(0)
+            waiting_task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await waiting_task
+
+            return await asyncio.wait_for(pool.acquire_async(object), 1)
+
+        assert asyncio.run(run()) is instance
+        assert pool.size == 1
+
+    def test_acquire_async_raises_when_timeout_expires(self):
+        pool = ObjectPool(1, timeout=0.01)
+        pool.acquire(object)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(pool.acquire_async(object))
+
+        assert len(pool._async_waiters) == 0
+
+    def test_acquire_async_gets_room_freed_by_failed_factory(self):
+        pool = ObjectPool(1)
+
+        def factory():
+            raise KeyError("error")
+
+        async def run():
+            with pytest.raises(KeyError):
+                await pool.acquire_async(factory)
+
+            return await asyncio.wait_for(pool.acquire_async(lambda: "created"), 1)
+
+        assert asyncio.run(run()) == "created"
+
+    def test_drain_returns_idle_instances(self):
+        pool = ObjectPool(2)
+        first_instance = pool.acquire(object)
+        pool.acquire(object)
+        pool.release(first_instance)
+
+        assert pool.drain() == [first_instance]
+        assert pool.size == 1
+
+    def test_max_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ObjectPool(0)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import gc
+import inspect
+from inspect import _empty
+from unittest.mock import patch
+import pytest
+from dipend.helpers.inspect_class_helper import (
+    InspectClassHelper,
+)
+
+
+class Dependency:
+    pass
+
+
+class Dependent:
+    def __init__(self, dependency: Dependency, token: "Dependency", untyped):
+        pass
+
+
+class UnresolvedDependent:
+    def __init__(self, dependency: MissingDependency):  # noqa: F821
+        pass
+
+
+class PartiallyResolvedDependent:
+    def __init__(self, dependency: Dependency, missing_dependency: MissingDependency, token: "token name"):  # noqa: F821, F722
+        pass
+
+
+settings = {"debug": True}
+
+
+class SettingsDependent:
+    def __init__(self, cfg: "settings", dependencies: "list[Dependency]"):  # noqa: F722
+        pass
+
+
+class TestInspectClassHelper:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        InspectClassHelper.clear_cache()
+        yield
+        InspectClassHelper.clear_cache()
+
+    def test_get_constructor_dependencies(self):
+        assert InspectClassHelper.get_constructor_dependencies(Dependent) == (Dependency, Dependency, _empty)
+
+    def test_get_constructor_dependencies_keeps_unresolved_forward_references(self):
+        assert InspectClassHelper.get_constructor_dependencies(UnresolvedDependent) == ("MissingDependency",)
+
+    def test_get_constructor_dependencies_resolves_forward_references_per_parameter(self):
+        assert InspectClassHelper.get_constructor_dependencies(PartiallyResolvedDependent) == (Dependency, "MissingDependency", "token name")
+
+    def test_get_constructor_dependencies_keeps_strings_not_evaluating_to_types(self):
+        assert InspectClassHelper.get_constructor_dependencies(SettingsDependent) == ("settings", list[Dependency])
+
+    def test_get_constructor_dependencies_resolves_forward_references_defined_later(self, monkeypatch):
+        class LaterDependent:
+            def __init__(self, dependency: LaterDependency):  # noqa: F821
+                pass
+
+        assert InspectClassHelper.get_constructor_dependencies(LaterDependent) == ("LaterDependency",)
+
+        monkeypatch.setitem(globals(), "LaterDependency", Dependency)
+
+        assert InspectClassHelper.get_constructor_dependencies(LaterDependent) == (Dependency,)
+
+    def test_get_constructor_dependencies_is_cached(self):
+        with patch("dipend.helpers.inspect_class_helper.inspect.signature", wraps=inspect.signature) as signature:
+            first_class_args = InspectClassHelper.get_constructor_dependencies(Dependent)
+            second_class_args = InspectClassHelper.get_constructor_dependencies(Dependent)
+
+        assert first_class_args is second_class_args
+        signature.assert_called_once_with(Dependent)
+
+    def test_get_constructor_dependencies_cache_is_weak(self):
+        class LocalDependent:
+            def __init__(self, dependency: Dependency):
+                pass
+
+        InspectClassHelper.get_constructor_dependencies(LocalDependent)
+
+        assert len(InspectClassHelper._constructor_dependencies_cache) == 1
+
+        del LocalDependent
+        gc.collect()
+
+        assert len(InspectClassHelper._constructor_dependencies_cache) == 0
@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock
+import pytest
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.dependency_store import DependencyStore
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.observers.build_profiler import BuildProfiler
+from dipend.observers.dependency_event import DependencyEvent
+
+
+def create_event(dependency_id, elapsed_ns=None, error=None):
+    return DependencyEvent(dependency_id, LifecycleEnum.SINGLETON, [dependency_id[0]], elapsed_ns, error)
+
+
+class TestBuildProfiler:
+    @pytest.fixture
+    def dependency_store(self):
+        dependency_store = DependencyStore()
+        dependency_store.add_dependency(DependencyRegistry(("a",), LifecycleEnum.SINGLETON, ImplementationDetails(MagicMock(), [], None, None)))
+        dependency_store.add_dependency(DependencyRegistry(("b",), LifecycleEnum.SINGLETON, ImplementationDetails(MagicMock(), [("a",)], None, None)))
+        dependency_store.add_dependency(DependencyRegistry(("c",), LifecycleEnum.SINGLETON, ImplementationDetails(MagicMock(), [("a",)], None, None)))
+        dependency_store.add_dependency(DependencyRegistry(("d",), LifecycleEnum.SINGLETON, ImplementationDetails(MagicMock(), [("b",), ("c",)], None, None)))
+
+        return dependency_store
+
+    def construct(self, build_profiler, dependency_id, elapsed_ns):
+        build_profiler.on_construct_start(create_event(dependency_id))
+        build_profiler.on_construct_end(create_event(dependency_id, elapsed_ns))
+
+    def test_get_profile(self, dependency_store):
+        build_profiler = BuildProfiler(dependency_store)
+
+        self.construct(build_profiler, ("a",), 10)
+        self.construct(build_profiler, ("b",), 20)
+        self.construct(build_profiler, ("c",), 5)
+        self.construct(build_profiler, ("d",), 1)
+
+        profile = build_profiler.get_profile(40)
+        timings = {timing.dependency_id: timing for timing in profile.timings}
+
+        assert [timing.dependency_id for timing in profile.timings] == [("a",), ("b",), ("c",), ("d",)]
+        assert [timing.order for timing in profile.timings] == [0, 1, 2, 3]
+        assert timings[("b",)].exclusive_ns == 20
+        assert timings[("b",)].inclusive_ns == 30
+        assert timings[("d",)].inclusive_ns == 36
+        assert [timing.dependency_id for timing in profile.critical_path] == [("a",), ("b",), ("d",)]
+        assert profile.critical_path_ns == 31
+        assert profile.total_ns == 40
+        assert [timing.dependency_id for timing in profile.get_slowest(2)] == [("b",), ("a",)]
+
+    def test_get_profile_counts_shared_dependencies_once(self):
+        dependency_store = DependencyStore()
+        dependencies = {("join", 0): []}
+
+        # Chained diamonds double the paths to the first dependency with every diamond.
+        for index in range(1, 25):
+            dependencies[("left", index)] = [("join", index - 1)]
+            dependencies[("right", index)] = [("join", index - 1)]
+            dependencies[("join", index)] = [("left", index), ("right", index)]
+
+        for dependency_id, dependencies_ids in dependencies.items():
+            dependency_store.add_dependency(DependencyRegistry(dependency_id, LifecycleEnum.SINGLETON, ImplementationDetails(MagicMock(), dependencies_ids, None, None)))
+
+        build_profiler = BuildProfiler(dependency_store)
+
+        for dependency_id in dependencies.keys():
+            self.construct(build_profiler, dependency_id, 1)
+
+        profile = build_profiler.get_profile(len(dependencies))
+        timings = {timing.dependency_id: timing for timing in profile.timings}
+
+        assert timings[("left", 1)].inclusive_ns == 2
+        assert timings[("join", 1)].inclusive_ns == 4
+        assert timings[("join", 24)].inclusive_ns == 73
+
+    def test_nested_constructions_are_excluded_from_exclusive_time(self, dependency_store):
+        build_profiler = BuildProfiler(dependency_store)
+
+        build_profiler.on_construct_start(create_event(("a",)))
+        self.construct(build_profiler, ("e",), 7)
+        build_profiler.on_construct_end(create_event(("a",), 10))
+
+        profile = build_profiler.get_profile(10)
+        timings = {timing.dependency_id: timing for timing in profile.timings}
+
+        assert timings[("a",)].exclusive_ns == 3
+        assert timings[("a",)].inclusive_ns == 10
+        assert timings[("a",)].dependencies_ids == [("e",)]
+        assert [timing.dependency_id for timing in profile.critical_path] == [("e",), ("a",)]
+
+    def test_failed_constructions_are_not_profiled(self, dependency_store):
+        build_profiler = BuildProfiler(dependency_store)
+
+        build_profiler.on_construct_start(create_event(("a",)))
+        build_profiler.on_construct_end(create_event(("a",), 10, ValueError("error")))
+
+        profile = build_profiler.get_profile(10)
+
+        assert profile.timings == []
+        assert profile.critical_path == []
+        assert profile.critical_path_ns == 0
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import MagicMock
+import pytest
+from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.dependency.dependency_registry import DependencyRegistry
+from dipend.dependency.implementation_details import ImplementationDetails
+from dipend.observers.base_dependency_observer import BaseDependencyObserver
+from dipend.observers.observer_dispatcher import ObserverDispatcher
+
+
+class TestObserverDispatcher:
+    @pytest.fixture
+    def setup_dispatcher(self):
+        get_token_names = MagicMock(return_value=["Token"])
+        observer = MagicMock(spec=BaseDependencyObserver)
+        observer_dispatcher = ObserverDispatcher(get_token_names)
+        observer_dispatcher.add_observer(observer)
+        dependency_registry = DependencyRegistry(("dep1",), LifecycleEnum.SINGLETON, ImplementationDetails(None, [], None, None))
+
+        return get_token_names, observer, observer_dispatcher, dependency_registry
+
+    def test_observe_resolve(self, setup_dispatcher):
+        get_token_names, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+
+        assert observer_dispatcher.observe_resolve(dependency_registry, lambda: "Instance") == "Instance"
+
+        start_event = observer.on_resolve_start.call_args.args[0]
+        end_event = observer.on_resolve_end.call_args.args[0]
+
+        assert start_event.dependency_id == ("dep1",)
+        assert start_event.lifecycle == LifecycleEnum.SINGLETON
+        assert start_event.token_names == ["Token"]
+        assert start_event.elapsed_ns is None
+        assert end_event.elapsed_ns >= 0
+        assert end_event.error is None
+        get_token_names.assert_called_once_with(("dep1",))
+
+    def test_observe_construct_reports_error(self, setup_dispatcher):
+        _, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+        error = KeyError("error")
+
+        def construct():
+            raise error
+
+        with pytest.raises(KeyError):
+            observer_dispatcher.observe_construct(dependency_registry, construct)
+
+        observer.on_construct_start.assert_called_once()
+        assert observer.on_construct_end.call_args.args[0].error is error
+
+    def test_report_construct(self, setup_dispatcher):
+        _, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+
+        observer_dispatcher.report_construct(dependency_registry, 42)
+
+        assert observer.on_construct_start.call_args.args[0].elapsed_ns is None
+        assert observer.on_construct_end.call_args.args[0].elapsed_ns == 42
+        assert observer.on_construct_end.call_args.args[0].error is None
+
+    def test_observe_resolve_async(self, setup_dispatcher):
+        _, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+
+        async def resolve():
+            return "Instance"
+
+        assert asyncio.run(observer_dispatcher.observe_resolve_async(dependency_registry, resolve)) == "Instance"
+        observer.on_resolve_start.assert_called_once()
+        observer.on_resolve_end.assert_called_once()
+
+    def test_observe_construct_async(self, setup_dispatcher):
+        _, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+
+        async def construct():
+            return "Instance"
+
+        assert asyncio.run(observer_dispatcher.observe_construct_async(dependency_registry, construct)) == "Instance"
+        observer.on_construct_start.assert_called_once()
+        observer.on_construct_end.assert_called_once()
+
+    def test_wrap_resolve(self, setup_dispatcher):
+        _, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+
+        factory = observer_dispatcher.wrap_resolve(dependency_registry, lambda: "Instance")
+
+        observer.on_resolve_start.assert_not_called()
+        assert factory() == "Instance"
+        observer.on_resolve_end.assert_called_once()
+
+    def test_remove_observer(self, setup_dispatcher):
+        _, observer, observer_dispatcher, dependency_registry = setup_dispatcher
+
+        assert observer_dispatcher.has_observers() is True
+
+        observer_dispatcher.remove_observer(observer)
+        observer_dispatcher.remove_observer(observer)
+
+        assert observer_dispatcher.has_observers() is False
+
+    def test_base_observer_hooks_do_nothing(self, setup_dispatcher):
+        _, _, observer_dispatcher, dependency_registry = setup_dispatcher
+        observer_dispatcher.add_observer(BaseDependencyObserver())
+
+        assert observer_dispatcher.observe_construct(dependency_registry, lambda: "Instance") == "Instance"
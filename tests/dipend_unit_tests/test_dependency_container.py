@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 from dipend.dependency_container import (
     DependencyContainer,
@@ -43,6 +44,10 @@ from dipend.commands.resolve_specific_lifecycles_command import (
     ResolveSpecificLifecyclesCommand,
 )
 from dipend.enums.lifecycle_enum import LifecycleEnum
+from dipend.context.context_store import ContextStore
+from dipend.context.scoped_context_store import ScopedContextStore
+from dipend.observers.base_dependency_observer import BaseDependencyObserver
+from dipend.exceptions.missing_dependency_exception import MissingDependencyException
 
 
 class TestDependencyContainer:
@@ -129,6 +134,7 @@ class TestDependencyContainer:
 
     def test_build_singletons(self, dependency_container):
         dependency_container._resolve_lifecycles = MagicMock()
+        dependency_container._compile = MagicMock()
 
         assert not dependency_container._is_singletons_built
 
@@ -136,7 +142,41 @@ class TestDependencyContainer:
 
         assert result == dependency_container
         assert dependency_container._is_singletons_built
-        dependency_container._resolve_lifecycles.assert_called_once_with([LifecycleEnum.SINGLETON])
+        dependency_container._resolve_lifecycles.assert_called_once_with([LifecycleEnum.SINGLETON], None, False)
+        dependency_container._compile.assert_called_once()
+
+    def test_compile_factories(self, dependency_container):
+        dependency_container._dependency_resolver.compile.return_value = {
+            "dep1": "Factory1",
+            "dep2": "Factory2",
+        }
+        dependency_container._token_store.get_tokens.side_effect = lambda dependency_id: {
+            "dep1": ["token1"],
+            "dep2": ["token2", "qualifier-token"],
+        }.get(dependency_id)
+
+        result = dependency_container._compile_factories()
+
+        assert result == {("token1",): "Factory1", ("token2", "qualifier-token"): "Factory2"}
+
+    def test_compile(self, dependency_container):
+        dependency_container._exception_handler_wrapper = MagicMock(wraps=dependency_container._exception_handler_wrapper)
+        dependency_container._compile_factories = MagicMock(return_value={("token",): "Factory"})
+
+        result = dependency_container.compile()
+
+        assert result == dependency_container
+        assert dependency_container._compiled_factories == {("token",): "Factory"}
+        dependency_container._exception_handler_wrapper.assert_called_once_with(dependency_container._compile_factories)
+
+    def test_compile_raise_when_build_singletons_is_required_and_container_is_not_built(self, dependency_container):
+        dependency_container._compile = MagicMock()
+        dependency_container._is_build_singletons_required = True
+
+        with pytest.raises(ValueError, match="Dependency container singletons not initialized\\."):
+            dependency_container.compile()
+
+        dependency_container._compile.assert_not_called()
 
     def test_build_context(self, dependency_container):
         dependency_container._resolve_lifecycles = MagicMock()
@@ -146,6 +186,428 @@ class TestDependencyContainer:
         assert result == dependency_container
         dependency_container._resolve_lifecycles.assert_called_once_with([LifecycleEnum.CONTEXT])
 
+    def test_build_context_when_lazy_context(self, dependency_container):
+        dependency_container._resolve_lifecycles = MagicMock()
+        dependency_container._is_lazy_context = True
+
+        result = dependency_container.build_context()
+
+        assert result == dependency_container
+        dependency_container._resolve_lifecycles.assert_not_called()
+
+    def test_build_context_with_roots(self, dependency_container):
+        dependency_container._resolve_lifecycles = MagicMock()
+        dependency_container.get_required_dependency = MagicMock()
+
+        result = dependency_container.build_context(roots=["dep1", "dep2"])
+
+        assert result == dependency_container
+        dependency_container._resolve_lifecycles.assert_not_called()
+        assert [call.args for call in dependency_container.get_required_dependency.call_args_list] == [("dep1",), ("dep2",)]
+
+    def test_lazy_context_constructs_only_retrieved_dependencies(self):
+        constructed = []
+
+        class FirstContextDependency:
+            def __init__(self):
+                constructed.append(FirstContextDependency)
+
+        class SecondContextDependency:
+            def __init__(self):
+                constructed.append(SecondContextDependency)
+
+        dependency_container = DependencyContainer(DependencyContainerConfig(lazy_context=True))
+        dependency_container.add_per_context(FirstContextDependency)
+        dependency_container.add_per_context(SecondContextDependency)
+        dependency_container.build_singletons()
+
+        with dependency_container.context():
+            dependency_container.build_context()
+
+            assert constructed == []
+
+            instance = dependency_container.get_dependency(FirstContextDependency)
+
+            assert dependency_container.get_dependency(FirstContextDependency) is instance
+
+        with dependency_container.context():
+            dependency_container.build_context(roots=[SecondContextDependency])
+
+        assert constructed == [FirstContextDependency, SecondContextDependency]
+
+    def test_build_singletons_async(self, dependency_container):
+        dependency_container._compile = MagicMock()
+
+        async def handle_async(command):
+            assert command == ResolveSpecificLifecyclesCommand([LifecycleEnum.SINGLETON])
+
+        dependency_container._resolve_specific_lifecycles_command_handler = MagicMock()
+        dependency_container._resolve_specific_lifecycles_command_handler.handle_async.side_effect = handle_async
+
+        result = asyncio.run(dependency_container.build_singletons_async())
+
+        assert result == dependency_container
+        assert dependency_container._is_singletons_built
+        dependency_container._resolve_specific_lifecycles_command_handler.handle_async.assert_called_once()
+        dependency_container._compile.assert_called_once()
+
+    def test_build_singletons_async_with_async_transient_dependency(self):
+        class Connection:
+            pass
+
+        class Repository:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+        async def build_connection():
+            return Connection()
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_async_transient_builder(Connection, build_connection)
+        dependency_container.add_singleton(Repository)
+
+        asyncio.run(dependency_container.build_singletons_async())
+
+        assert isinstance(dependency_container.get_dependency(Repository).connection, Connection)
+
+    def test_aget_dependency_builds_async_singleton_once_for_concurrent_calls(self):
+        class Connection:
+            pass
+
+        builds = []
+
+        async def build_connection():
+            builds.append(Connection())
+            await asyncio.sleep(0.01)
+            return builds[-1]
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_async_singleton_builder(Connection, build_connection)
+
+        async def get_concurrently():
+            return await asyncio.gather(*[dependency_container.aget_dependency(Connection) for _ in range(10)])
+
+        instances = asyncio.run(get_concurrently())
+
+        assert len(builds) == 1
+        assert all(instance is builds[0] for instance in instances)
+
+    def test_build_context_async(self, dependency_container):
+        async def handle_async(command):
+            assert command == ResolveSpecificLifecyclesCommand([LifecycleEnum.CONTEXT])
+
+        dependency_container._resolve_specific_lifecycles_command_handler = MagicMock()
+        dependency_container._resolve_specific_lifecycles_command_handler.handle_async.side_effect = handle_async
+
+        result = asyncio.run(dependency_container.build_context_async())
+
+        assert result == dependency_container
+        dependency_container._resolve_specific_lifecycles_command_handler.handle_async.assert_called_once()
+
+    def test_build_context_async_with_roots(self, dependency_container):
+        dependency_container._retrieve_dependency_async = AsyncMock()
+        dependency_container._resolve_specific_lifecycles_command_handler = MagicMock()
+
+        result = asyncio.run(dependency_container.build_context_async(roots=["dep1"]))
+
+        assert result == dependency_container
+        dependency_container._retrieve_dependency_async.assert_awaited_once_with(_RetrieveDependencyInput(dependency_token="dep1", required=True))
+        dependency_container._resolve_specific_lifecycles_command_handler.handle_async.assert_not_called()
+
+    def test_build_context_async_when_lazy_context(self, dependency_container):
+        dependency_container._is_lazy_context = True
+        dependency_container._resolve_specific_lifecycles_command_handler = MagicMock()
+
+        result = asyncio.run(dependency_container.build_context_async())
+
+        assert result == dependency_container
+        dependency_container._resolve_specific_lifecycles_command_handler.handle_async.assert_not_called()
+
+    def test_async_exception_handler_wrapper_handles_exceptions(self, dependency_container):
+        exception = MissingDependencyException(["dep1"])
+        dependency_container._exception_handler = MagicMock()
+        dependency_container._exception_handler.handle.return_value = "Handled"
+
+        async def callback():
+            raise exception
+
+        result = asyncio.run(dependency_container._async_exception_handler_wrapper(callback))
+
+        dependency_container._exception_handler.handle.assert_called_once_with(exception)
+        assert result == "Handled"
+
+    def test_aget_dependency(self, dependency_container):
+        dependency_container._retrieve_dependency_async = AsyncMock(return_value="Instance")
+
+        result = asyncio.run(dependency_container.aget_dependency("token"))
+
+        dependency_container._retrieve_dependency_async.assert_awaited_once_with(_RetrieveDependencyInput(dependency_token="token"))
+        assert result == "Instance"
+
+    def test_aget_mapped_dependency(self, dependency_container):
+        dependency_container._retrieve_dependency_async = AsyncMock(return_value="Instance")
+
+        result = asyncio.run(dependency_container.aget_mapped_dependency("token", "qualifier"))
+
+        dependency_container._retrieve_dependency_async.assert_awaited_once_with(
+            _RetrieveDependencyInput(dependency_token="token", check_qualifier=True, qualifier_tokens=["qualifier"])
+        )
+        assert result == "Instance"
+
+    def test_retrieve_dependency_async(self, dependency_container):
+        dependency_container._resolve_dependency_command_handler = MagicMock()
+        dependency_container._resolve_dependency_command_handler.handle_async = AsyncMock(return_value="Instance")
+
+        result = asyncio.run(dependency_container._retrieve_dependency_async(_RetrieveDependencyInput(dependency_token="token")))
+
+        dependency_container._resolve_dependency_command_handler.handle_async.assert_awaited_once_with(ResolveDependencyCommand(tokens=["token"], required=False))
+        assert result == "Instance"
+
+    def test_retrieve_dependency_async_raise_with_missing_token(self, dependency_container):
+        with pytest.raises(ValueError, match="Missing dependency token."):
+            asyncio.run(dependency_container._retrieve_dependency_async(_RetrieveDependencyInput()))
+
+    def test_context_releases_per_context_instances(self, dependency_container):
+        dependency_container._context_store.set("dep1", "ContextInstance")
+
+        with dependency_container.context() as scoped_container:
+            assert scoped_container is dependency_container
+
+            dependency_container._context_store.set("dep1", "ScopedInstance")
+
+        assert dependency_container._context_store.get("dep1") == "ContextInstance"
+
+    def test_acontext_releases_per_context_instances(self, dependency_container):
+        async def use_scope():
+            async with dependency_container.acontext() as scoped_container:
+                dependency_container._context_store.set("dep1", "ScopedInstance")
+
+                return scoped_container
+
+        assert asyncio.run(use_scope()) is dependency_container
+        assert dependency_container._context_store.get("dep1") is None
+
+    def test_acontext_releases_instances_set_after_a_child_task(self):
+        class ContextDependency:
+            def __init__(self):
+                self.closed = False
+
+            def close(self):
+                self.closed = True
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_per_context(ContextDependency)
+        dependency_container.build_singletons()
+
+        async def use_scope():
+            async with dependency_container.acontext():
+                task_instance = await asyncio.create_task(dependency_container.aget_dependency(ContextDependency))
+                instance = await dependency_container.aget_dependency(ContextDependency)
+
+            return task_instance, instance, dependency_container.get_dependency(ContextDependency)
+
+        task_instance, instance, instance_after_scope = asyncio.run(use_scope())
+
+        assert task_instance is not instance
+        assert instance.closed is True
+        assert instance_after_scope is not instance
+
+    @pytest.mark.parametrize(
+        "add_root",
+        [
+            lambda dependency_container, root: dependency_container.add_cached(root, ttl=60),
+            lambda dependency_container, root: dependency_container.add_per_thread(root),
+            lambda dependency_container, root: dependency_container.add_pooled(root),
+            lambda dependency_container, root: dependency_container.add_per_context(root),
+        ],
+        ids=["cached", "thread", "pooled", "context"],
+    )
+    def test_get_dependency_reuses_kept_root_without_building_its_dependencies(self, add_root):
+        constructions = []
+
+        class Child:
+            def __init__(self):
+                constructions.append(self)
+
+        class Root:
+            def __init__(self, child: Child):
+                self.child = child
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_transient(Child)
+        add_root(dependency_container, Root)
+
+        with dependency_container.context():
+            instances = [dependency_container.get_dependency(Root) for _ in range(5)]
+
+        assert len(constructions) == 1
+        assert all(instance is instances[0] for instance in instances)
+
+    def test_custom_context_store(self):
+        class ContextDependency:
+            pass
+
+        context_store = ScopedContextStore()
+        dependency_container = DependencyContainer(DependencyContainerConfig(custom_context_store=context_store))
+        dependency_container.add_per_context(ContextDependency)
+        dependency_container.build_singletons()
+
+        with dependency_container.context():
+            dependency_container.build_context()
+            instance = dependency_container.get_dependency(ContextDependency)
+
+            assert isinstance(instance, ContextDependency)
+            assert context_store._scope.get().values
+
+        assert dependency_container._context_store is context_store
+        assert context_store._scope.get() is None
+
+    @pytest.mark.parametrize("context_store_class", [ContextStore, ScopedContextStore])
+    def test_pooled_checkouts_belong_to_the_scope_and_task_taking_them(self, context_store_class):
+        class Connection:
+            pass
+
+        dependency_container = DependencyContainer(DependencyContainerConfig(custom_context_store=context_store_class()))
+        dependency_container.add_pooled(Connection, max_size=3, timeout=1)
+        dependency_container.build_singletons()
+        dependency_id = dependency_container._token_store.retrieve_or_create_dependency_id_by_tokens([Connection])
+        pool = dependency_container._dependency_store.get_dependency(dependency_id).implementation_details.pool
+
+        async def get_connection():
+            return dependency_container.get_dependency(Connection)
+
+        async def run():
+            async with dependency_container.context():
+                outer_connection = dependency_container.get_dependency(Connection)
+                task_connection = await asyncio.create_task(get_connection())
+
+                with dependency_container.context():
+                    nested_connection = dependency_container.get_dependency(Connection)
+
+                assert dependency_container.get_dependency(Connection) is outer_connection
+
+            return outer_connection, task_connection, nested_connection
+
+        connections = asyncio.run(run())
+
+        assert len({id(connection) for connection in connections}) == 3
+        assert pool.size == 3
+        assert len(pool._idle_instances) == 3
+
+    def test_add_and_remove_observer(self, dependency_container):
+        observer = BaseDependencyObserver()
+        dependency_container._compile = MagicMock()
+        dependency_container._compiled_factories = {("token",): lambda: "instance"}
+
+        assert dependency_container.add_observer(observer) == dependency_container
+
+        dependency_container._dependency_resolver.set_observer_dispatcher.assert_called_once_with(dependency_container._observer_dispatcher)
+        dependency_container._compile.assert_called_once()
+
+        assert dependency_container.remove_observer(observer) == dependency_container
+
+        dependency_container._dependency_resolver.set_observer_dispatcher.assert_called_with(None)
+
+    def test_observer_receives_token_names(self):
+        class MyClass:
+            pass
+
+        events = []
+
+        class Observer(BaseDependencyObserver):
+            def on_construct_end(self, event):
+                events.append(event)
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_transient(MyClass)
+        dependency_container.add_observer(Observer())
+
+        dependency_container.get_dependency(MyClass)
+
+        assert events[0].token_names == ["MyClass"]
+        assert events[0].lifecycle == LifecycleEnum.TRANSIENT
+        assert events[0].elapsed_ns >= 0
+
+    def test_profile_build(self):
+        class Dependency:
+            pass
+
+        class Dependent:
+            def __init__(self, dependency: Dependency):
+                self.dependency = dependency
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_singleton(Dependent)
+        dependency_container.add_singleton(Dependency)
+
+        profile = dependency_container.profile_build()
+
+        assert [timing.token_names for timing in profile.timings] == [["Dependency"], ["Dependent"]]
+        assert [timing.token_names for timing in profile.critical_path] == [["Dependency"], ["Dependent"]]
+        assert profile.timings[1].inclusive_ns >= profile.timings[0].inclusive_ns
+        assert profile.total_ns >= profile.critical_path_ns
+        assert dependency_container._observer_dispatcher.has_observers() is False
+        assert isinstance(dependency_container.get_dependency(Dependent).dependency, Dependency)
+
+    def test_dispose(self, dependency_container):
+        dependency_container._dependency_disposer = MagicMock()
+        dependency_container._compiled_factories = {("token",): lambda: "instance"}
+        dependency_container._is_singletons_built = True
+
+        result = dependency_container.dispose()
+
+        assert result == dependency_container
+        assert dependency_container._compiled_factories == {}
+        assert dependency_container._is_singletons_built is False
+        dependency_container._dependency_disposer.dispose_singletons.assert_called_once()
+
+    def test_adispose(self, dependency_container):
+        dependency_container._dependency_disposer = MagicMock()
+        dependency_container._dependency_disposer.adispose_singletons = AsyncMock()
+        dependency_container._is_singletons_built = True
+
+        result = asyncio.run(dependency_container.adispose())
+
+        assert result == dependency_container
+        assert dependency_container._is_singletons_built is False
+        dependency_container._dependency_disposer.adispose_singletons.assert_awaited_once()
+
+    def test_dispose_built_singletons_and_context_instances(self):
+        disposed = []
+
+        class Connection:
+            def close(self):
+                disposed.append("connection")
+
+        class Request:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+            async def aclose(self):
+                disposed.append("request")
+
+        class GivenInstance:
+            def close(self):
+                disposed.append("given")
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_singleton(Connection)
+        dependency_container.add_per_context(Request)
+        dependency_container.add_singleton_instance(GivenInstance, GivenInstance())
+        dependency_container.build_singletons()
+
+        async def use_scope():
+            async with dependency_container.acontext():
+                await dependency_container.build_context_async()
+
+        asyncio.run(use_scope())
+
+        assert disposed == ["request"]
+
+        dependency_container.dispose()
+
+        assert disposed == ["request", "connection"]
+
     def test_build_context_when_container_is_built(self, dependency_container):
         dependency_container._resolve_lifecycles = MagicMock()
 
@@ -368,6 +830,113 @@ class TestDependencyContainer:
         dependency_container._exception_handler_wrapper.assert_not_called()
         dependency_container._resolve_dependency_command_handler.handle.assert_not_called()
 
+    def test_batch(self):
+        class Dependency:
+            pass
+
+        class Dependent:
+            def __init__(self, dependency: Dependency):
+                self.dependency = dependency
+
+        dependency_container = DependencyContainer()
+
+        with dependency_container.batch() as batch_container:
+            dependency_container.add_singleton(Dependent)
+            dependency_container.add_singleton(Dependency)
+
+            assert dependency_container._dependency_store._sorted_dependencies_ids_cache_invalidated is True
+
+        assert batch_container is dependency_container
+        assert dependency_container._dependency_store._sorted_dependencies_ids_cache_invalidated is False
+        assert isinstance(dependency_container.build_singletons().get_dependency(Dependent).dependency, Dependency)
+
+    def test_batch_raises_every_registration_error(self):
+        class Dependency:
+            def __init__(self, dependent):
+                pass
+
+        class Dependent:
+            def __init__(self, dependency: Dependency):
+                pass
+
+        Dependency.__init__.__annotations__["dependent"] = Dependent
+
+        class Untyped:
+            def __init__(self, untyped):
+                pass
+
+        dependency_container = DependencyContainer()
+
+        with pytest.raises(ExceptionGroup) as exception_info:
+            with dependency_container.batch():
+                dependency_container.add_singleton(Untyped)
+                dependency_container.add_singleton_instance(None, "instance")
+                dependency_container.add_singleton(Dependent)
+                dependency_container.add_singleton(Dependency, Dependency)
+
+        errors = exception_info.value.exceptions
+
+        assert len(errors) == 3
+        assert "Untyped" in str(errors[0])
+        assert str(errors[1]) == "Missing dependency token."
+        assert "Cyclic dependencies error" in str(errors[2])
+        assert dependency_container._registration_errors is None
+
+    def test_batch_collects_missing_arguments(self):
+        class Untyped:
+            def __init__(self, untyped):
+                pass
+
+        dependency_container = DependencyContainer()
+
+        with pytest.raises(ExceptionGroup) as exception_info:
+            with dependency_container.batch():
+                dependency_container.add_singleton(Untyped)
+                dependency_container.add_singleton_instance("cfg", None)
+                dependency_container.add_transient_builder("builder", None)
+
+        errors = exception_info.value.exceptions
+
+        assert len(errors) == 3
+        assert "Untyped" in str(errors[0])
+        assert str(errors[1]) == "Missing instance."
+        assert str(errors[2]) == "Missing builder function."
+
+    def test_batch_nested(self):
+        dependency_container = DependencyContainer()
+
+        with pytest.raises(ExceptionGroup) as exception_info:
+            with dependency_container.batch():
+                with dependency_container.batch():
+                    dependency_container.add_singleton_instance(None, "instance")
+
+                dependency_container.add_singleton_instance(None, "instance")
+
+        assert len(exception_info.value.exceptions) == 2
+
+    def test_batch_propagates_block_exception(self):
+        dependency_container = DependencyContainer()
+
+        with pytest.raises(KeyError):
+            with dependency_container.batch():
+                raise KeyError("error")
+
+        assert dependency_container._registration_errors is None
+
+    def test_batch_raises_block_exception_with_registration_errors(self):
+        dependency_container = DependencyContainer()
+
+        with pytest.raises(ExceptionGroup) as exception_info:
+            with dependency_container.batch():
+                dependency_container.add_singleton_instance(None, "instance")
+                raise KeyError("error")
+
+        errors = exception_info.value.exceptions
+
+        assert str(errors[0]) == "Missing dependency token."
+        assert isinstance(errors[1], KeyError)
+        assert dependency_container._registration_errors is None
+
     def test_delete_dependency(self, dependency_container):
         dependency_token = "token"
         dependency_id = "dependency_id"
@@ -384,34 +953,193 @@ class TestDependencyContainer:
         dependency_id = "dependency_id"
         dependency_container._token_store.retrieve_or_create_dependency_id_by_tokens.return_value = dependency_id
 
-        dependency_container.delete_dependency(dependency_token, qualifier_token)
+        dependency_container.delete_dependency(dependency_token, qualifier_token)
+
+        dependency_container._token_store.retrieve_or_create_dependency_id_by_tokens.assert_called_once_with([dependency_token, qualifier_token])
+        dependency_container._dependency_store.delete_dependency.assert_called_once_with(dependency_id)
+
+    def test_add_dependency_discards_compiled_factories(self, dependency_container):
+        dependency_container._compiled_factories = {("token",): "Factory"}
+
+        dependency_container._add_dependency(_AddDependencyInput(lifecycle=LifecycleEnum.SINGLETON, dependency_token="token", builder=lambda: "instance"))
+
+        assert dependency_container._compiled_factories == {}
+
+    def test_delete_dependency_discards_compiled_factories(self, dependency_container):
+        dependency_container._compiled_factories = {("token",): "Factory"}
+
+        dependency_container.delete_dependency("token")
+
+        assert dependency_container._compiled_factories == {}
+
+    def test_reset(self, dependency_container):
+        dependency_container._compiled_factories = {("token",): "Factory"}
+
+        dependency_container.reset()
+
+        assert dependency_container._compiled_factories == {}
+        dependency_container._token_store.reset.assert_called_once()
+        dependency_container._dependency_store.reset.assert_called_once()
+
+    def test_add_singleton_builder(self, dependency_container):
+        dependency_token = "token"
+
+        dependency_container._add_dependency = MagicMock()
+
+        def builder():
+            return "dependency-instance"
+
+        dependency_container.add_singleton_builder(dependency_token=dependency_token, builder=builder)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.SINGLETON,
+            dependency_token=dependency_token,
+            builder=builder,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_async_singleton_builder(self, dependency_container):
+        dependency_token = "token"
+
+        dependency_container._add_dependency = MagicMock()
+
+        async def builder():
+            return "dependency-instance"
+
+        dependency_container.add_async_singleton_builder(dependency_token=dependency_token, builder=builder, timeout=5)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.SINGLETON,
+            dependency_token=dependency_token,
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=5,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_async_singleton_builder(self, dependency_container):
+        dependency_token = "token"
+        qualifier_token = "qualifier"
+
+        dependency_container._add_dependency = MagicMock()
+
+        async def builder():
+            return "dependency-instance"
+
+        dependency_container.add_mapped_async_singleton_builder(dependency_token, qualifier_token, builder)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.SINGLETON,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+            is_async_builder=True,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_async_per_context_builder(self, dependency_container):
+        dependency_token = "token"
+
+        dependency_container._add_dependency = MagicMock()
+
+        async def builder():
+            return "dependency-instance"
+
+        dependency_container.add_async_per_context_builder(dependency_token, builder)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CONTEXT,
+            dependency_token=dependency_token,
+            builder=builder,
+            is_async_builder=True,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_async_per_context_builder(self, dependency_container):
+        dependency_token = "token"
+        qualifier_token = "qualifier"
+
+        dependency_container._add_dependency = MagicMock()
+
+        async def builder():
+            return "dependency-instance"
+
+        dependency_container.add_mapped_async_per_context_builder(dependency_token, qualifier_token, builder, timeout=1)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CONTEXT,
+            dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=1,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_async_transient_builder(self, dependency_container):
+        dependency_token = "token"
+
+        dependency_container._add_dependency = MagicMock()
+
+        async def builder():
+            return "dependency-instance"
 
-        dependency_container._token_store.retrieve_or_create_dependency_id_by_tokens.assert_called_once_with([dependency_token, qualifier_token])
-        dependency_container._dependency_store.delete_dependency.assert_called_once_with(dependency_id)
+        dependency_container.add_async_transient_builder(dependency_token, builder, timeout=2)
 
-    def test_reset(self, dependency_container):
-        dependency_container.reset()
-        dependency_container._token_store.reset.assert_called_once()
-        dependency_container._dependency_store.reset.assert_called_once()
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.TRANSIENT,
+            dependency_token=dependency_token,
+            builder=builder,
+            is_async_builder=True,
+            builder_timeout=2,
+        )
 
-    def test_add_singleton_builder(self, dependency_container):
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_async_transient_builder(self, dependency_container):
         dependency_token = "token"
+        qualifier_token = "qualifier"
 
         dependency_container._add_dependency = MagicMock()
 
-        def builder():
+        async def builder():
             return "dependency-instance"
 
-        dependency_container.add_singleton_builder(dependency_token=dependency_token, builder=builder)
+        dependency_container.add_mapped_async_transient_builder(dependency_token, qualifier_token, builder)
 
         add_dependency_input = _AddDependencyInput(
-            lifecycle=LifecycleEnum.SINGLETON,
+            lifecycle=LifecycleEnum.TRANSIENT,
             dependency_token=dependency_token,
+            check_qualifier=True,
+            qualifier_tokens=[qualifier_token],
             builder=builder,
+            is_async_builder=True,
         )
 
         dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
 
+    @pytest.mark.parametrize(
+        "method_name, args",
+        [
+            ("add_async_singleton_builder", ["token"]),
+            ("add_mapped_async_singleton_builder", ["token", "qualifier"]),
+            ("add_async_per_context_builder", ["token"]),
+            ("add_mapped_async_per_context_builder", ["token", "qualifier"]),
+            ("add_async_transient_builder", ["token"]),
+            ("add_mapped_async_transient_builder", ["token", "qualifier"]),
+        ],
+    )
+    def test_add_async_builder_raise_with_missing_builder(self, dependency_container, method_name, args):
+        with pytest.raises(ValueError, match="Missing builder function."):
+            getattr(dependency_container, method_name)(*args, None)
+
     def test_add_singleton_builder_raise_with_missing_builder(self, dependency_container):
         dependency_token = "token"
 
@@ -574,6 +1302,332 @@ class TestDependencyContainer:
 
         dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
 
+    def test_load_configs_with_cache_max_entries(self, dependency_container):
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container._load_configs(DependencyContainerConfig(cache_max_entries=5))
+
+        lifecycle, strategy = dependency_container._dependency_resolver.add_resolve_lifecycle_strategy.call_args.args
+
+        assert lifecycle == LifecycleEnum.CACHED
+        assert strategy._max_entries == 5
+
+    def test_add_cached(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_cached(MyClass, ttl=30.0)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token=MyClass,
+            class_constructor=MyClass,
+            cache_ttl=30.0,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_cached(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_cached(MyClass, "qualifier")
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token=MyClass,
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            class_constructor=MyClass,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_cached_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_cached_builder("token", builder, ttl=5.0)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token="token",
+            builder=builder,
+            cache_ttl=5.0,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_cached_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_cached_builder("token", "qualifier", builder)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.CACHED,
+            dependency_token="token",
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            builder=builder,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_cached_builder_raise_without_builder(self, dependency_container):
+        with pytest.raises(ValueError, match="Missing builder function."):
+            dependency_container.add_cached_builder("token", None)
+
+    def test_invalidate_cached(self, dependency_container):
+        dependency_container._token_store.retrieve_or_create_dependency_id_by_tokens.return_value = ("dep1",)
+
+        dependency_container.invalidate_cached("token", "qualifier")
+        dependency_container.invalidate_cached()
+
+        dependency_container._token_store.retrieve_or_create_dependency_id_by_tokens.assert_called_once_with(["token", "qualifier"])
+        assert [call.args for call in dependency_container._dependency_resolver.invalidate_cached.call_args_list] == [(("dep1",),), ()]
+
+    def test_cached_dependency_is_rebuilt_after_invalidation(self):
+        class TokenSigner:
+            pass
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_cached(TokenSigner)
+        dependency_container.build_singletons()
+
+        instance = dependency_container.get_dependency(TokenSigner)
+
+        assert dependency_container.get_dependency(TokenSigner) is instance
+
+        dependency_container.invalidate_cached(TokenSigner)
+
+        assert dependency_container.get_dependency(TokenSigner) is not instance
+
+    def test_add_per_thread(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_per_thread(MyClass)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token=MyClass,
+            class_constructor=MyClass,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_per_thread(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_per_thread(MyClass, "qualifier")
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token=MyClass,
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            class_constructor=MyClass,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_per_thread_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_per_thread_builder("token", builder)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token="token",
+            builder=builder,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_per_thread_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_per_thread_builder("token", "qualifier", builder)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.THREAD,
+            dependency_token="token",
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            builder=builder,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_per_thread_builder_raise_without_builder(self, dependency_container):
+        with pytest.raises(ValueError, match="Missing builder function."):
+            dependency_container.add_per_thread_builder("token", None)
+
+    def test_add_pooled(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_pooled(MyClass, max_size=4, timeout=1.0)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token=MyClass,
+            class_constructor=MyClass,
+            pool_max_size=4,
+            pool_timeout=1.0,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_pooled(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_pooled(MyClass, "qualifier")
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token=MyClass,
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            class_constructor=MyClass,
+            pool_max_size=10,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_pooled_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_pooled_builder("token", builder, max_size=2)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token="token",
+            builder=builder,
+            pool_max_size=2,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_mapped_pooled_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_pooled_builder("token", "qualifier", builder, timeout=2.0)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.POOLED,
+            dependency_token="token",
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            builder=builder,
+            pool_max_size=10,
+            pool_timeout=2.0,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_pooled_builder_raise_without_builder(self, dependency_container):
+        with pytest.raises(ValueError, match="Missing builder function."):
+            dependency_container.add_pooled_builder("token", None)
+
+    def test_pooled_instances_return_to_pool_when_scope_exits(self):
+        class Parser:
+            pass
+
+        dependency_container = DependencyContainer()
+        dependency_container.add_pooled(Parser, max_size=1, timeout=0.01)
+        dependency_container.build_singletons()
+
+        with dependency_container.context():
+            instance = dependency_container.get_dependency(Parser)
+
+            assert dependency_container.get_dependency(Parser) is instance
+
+        async def use_scope():
+            async with dependency_container.acontext():
+                return await dependency_container.aget_dependency(Parser)
+
+        assert asyncio.run(use_scope()) is instance
+
+    def test_add_lazy_singleton(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_singleton(MyClass, lazy=True)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.LAZY_SINGLETON,
+            dependency_token=MyClass,
+            class_constructor=MyClass,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_lazy_mapped_singleton(self, dependency_container):
+        class MyClass:
+            pass
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_mapped_singleton(MyClass, "qualifier", lazy=True)
+
+        add_dependency_input = _AddDependencyInput(
+            lifecycle=LifecycleEnum.LAZY_SINGLETON,
+            dependency_token=MyClass,
+            check_qualifier=True,
+            qualifier_tokens=["qualifier"],
+            class_constructor=MyClass,
+        )
+
+        dependency_container._add_dependency.assert_called_once_with(add_dependency_input)
+
+    def test_add_lazy_singleton_builder(self, dependency_container):
+        def builder():
+            return "dependency-instance"
+
+        dependency_container._add_dependency = MagicMock()
+
+        dependency_container.add_singleton_builder("token", builder, lazy=True)
+        dependency_container.add_mapped_singleton_builder("token", "qualifier", builder, lazy=True)
+
+        assert [call.args[0].lifecycle for call in dependency_container._add_dependency.call_args_list] == [
+            LifecycleEnum.LAZY_SINGLETON,
+            LifecycleEnum.LAZY_SINGLETON,
+        ]
+
     def test_add_mapped_singleton_with_dependency_token_as_constructor(self, dependency_container):
         class MyClass:
             pass
@@ -996,3 +2050,62 @@ class TestDependencyContainer:
         )
 
         dependency_container._retrieve_dependency.assert_called_once_with(retrieve_dependency_input)
+
+    def test_get_dependency_uses_compiled_factory(self, dependency_container: DependencyContainer):
+        dependency_token = "token"
+
+        dependency_container._retrieve_dependency = MagicMock()
+        dependency_container._compiled_factories = {(dependency_token,): lambda: "dependency-instance"}
+
+        result = dependency_container.get_dependency(dependency_token)
+
+        assert result == "dependency-instance"
+        dependency_container._retrieve_dependency.assert_not_called()
+
+    def test_get_required_dependency_uses_compiled_factory(self, dependency_container: DependencyContainer):
+        dependency_token = "token"
+
+        dependency_container._retrieve_dependency = MagicMock()
+        dependency_container._compiled_factories = {(dependency_token,): lambda: "dependency-instance"}
+
+        result = dependency_container.get_required_dependency(dependency_token)
+
+        assert result == "dependency-instance"
+        dependency_container._retrieve_dependency.assert_not_called()
+
+    def test_get_mapped_dependency_uses_compiled_factory(self, dependency_container: DependencyContainer):
+        dependency_token = "token"
+        qualifier_token = "qualifier-token"
+
+        dependency_container._retrieve_dependency = MagicMock()
+        dependency_container._compiled_factories = {(dependency_token, qualifier_token): lambda: "dependency-instance"}
+
+        result = dependency_container.get_mapped_dependency(dependency_token, qualifier_token)
+
+        assert result == "dependency-instance"
+        dependency_container._retrieve_dependency.assert_not_called()
+
+    def test_get_required_mapped_dependency_uses_compiled_factory(self, dependency_container: DependencyContainer):
+        dependency_token = "token"
+        qualifier_token = "qualifier-token"
+
+        dependency_container._retrieve_dependency = MagicMock()
+        dependency_container._compiled_factories = {(dependency_token, qualifier_token): lambda: "dependency-instance"}
+
+        result = dependency_container.get_required_mapped_dependency(dependency_token, qualifier_token)
+
+        assert result == "dependency-instance"
+        dependency_container._retrieve_dependency.assert_not_called()
+
+    def test_get_dependency_handles_compiled_factory_exceptions(self, dependency_container: DependencyContainer):
+        dependency_token = "token"
+        test_exception = BaseDependencyContainerException(["dependency_id"], "test")
+
+        def compiled_factory():
+            raise test_exception
+
+        dependency_container._compiled_factories = {(dependency_token,): compiled_factory}
+
+        dependency_container.get_dependency(dependency_token)
+
+        dependency_container._exception_handler.handle.assert_called_once_with(test_exception)
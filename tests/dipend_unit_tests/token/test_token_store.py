@@ -1,3 +1,4 @@
+from unittest.mock import MagicMock
 import pytest
 from dipend.exceptions.missing_dependency_token_exception import (
     MissingDependencyTokenException,
@@ -21,7 +22,8 @@ class TestTokenStore:
         result = store.retrieve_or_create_dependency_id_by_tokens([token1, token2])
 
         assert result is not None
-        assert len(result.split("_")) == 2
+        assert len(result) == 2
+        assert all(isinstance(token_id, int) for token_id in result)
 
     def test_retrieve_or_create_dependency_id_by_tokens_reuses_existing_registry(
         self, store
@@ -39,7 +41,27 @@ class TestTokenStore:
         result = store.retrieve_or_create_dependency_id_by_tokens([token, None])
 
         assert result is not None
-        assert len(result.split("_")) == 1
+        assert len(result) == 1
+
+    def test_retrieve_or_create_dependency_id_by_tokens_uses_increasing_token_ids(
+        self, store
+    ):
+        id1 = store.retrieve_or_create_dependency_id_by_tokens(["token1"])
+        id2 = store.retrieve_or_create_dependency_id_by_tokens(["token2", "token1"])
+
+        assert id2 == (id1[0] + 1, id1[0])
+
+    def test_retrieve_or_create_dependency_id_by_tokens_reuses_cached_dependency_id(
+        self, store
+    ):
+        id1 = store.retrieve_or_create_dependency_id_by_tokens(["token1", "token2"])
+
+        store._create_dependency_id = MagicMock()
+
+        id2 = store.retrieve_or_create_dependency_id_by_tokens(["token1", "token2"])
+
+        assert id1 == id2
+        store._create_dependency_id.assert_not_called()
 
     def test_get_tokens_returns_tokens_for_valid_dependency_id(self, store):
         token = "test_token"
@@ -49,6 +71,16 @@ class TestTokenStore:
 
         assert tokens == [token]
 
+    def test_get_tokens_uses_token_id_index(self, store):
+        dependency_id = store.retrieve_or_create_dependency_id_by_tokens(["token1", "token2"])
+
+        store._tokens = MagicMock()
+
+        tokens = store.get_tokens(dependency_id)
+
+        assert tokens == ["token1", "token2"]
+        store._tokens.values.assert_not_called()
+
     def test_get_tokens_raises_exception_for_invalid_dependency_id(self, store):
         with pytest.raises(MissingDependencyTokenException):
             store.get_tokens("invalid_id")
@@ -62,6 +94,34 @@ class TestTokenStore:
         with pytest.raises(MissingDependencyTokenException):
             store.get_tokens(dependency_id)
 
+    def test_delete_token_keeps_remaining_tokens_indexed(self, store):
+        dependency_id = store.retrieve_or_create_dependency_id_by_tokens(["token1", "token2"])
+
+        store.delete_token("token1")
+
+        assert store.get_tokens(dependency_id) == ["token2"]
+        assert store._tokens_by_id.len() == 1
+
+    def test_delete_token_discards_cached_dependency_ids(self, store):
+        token = "token_to_delete"
+        dependency_id = store.retrieve_or_create_dependency_id_by_tokens([token, "qualifier"])
+
+        store.delete_token(token)
+
+        assert store.retrieve_or_create_dependency_id_by_tokens([token, "qualifier"]) != dependency_id
+
+    def test_delete_token_only_discards_dependency_ids_holding_it(self, store):
+        deleted_dependency_id = store.retrieve_or_create_dependency_id_by_tokens(["token", "qualifier"])
+        kept_dependency_id = store.retrieve_or_create_dependency_id_by_tokens(["other_token", "qualifier"])
+
+        store.delete_token("token")
+
+        assert store._dependency_ids.get(("token", "qualifier")) is None
+        assert store.retrieve_or_create_dependency_id_by_tokens(["other_token", "qualifier"]) == kept_dependency_id
+        assert store._tokens_keys_by_token.get("token") is None
+        assert store._tokens_keys_by_token.get("qualifier") == {("other_token", "qualifier")}
+        assert deleted_dependency_id != kept_dependency_id
+
     def test_delete_token_with_non_existent_token(self, store):
         token = "non_existent_token"
 
@@ -84,3 +144,17 @@ class TestTokenStore:
 
         with pytest.raises(MissingDependencyTokenException):
             store.get_tokens(dependency_id)
+
+    def test_reset_clears_token_id_index(self, store):
+        store.retrieve_or_create_dependency_id_by_tokens(["token1", "token2"])
+
+        store.reset()
+
+        assert store._tokens_by_id.len() == 0
+
+    def test_reset_discards_cached_dependency_ids(self, store):
+        dependency_id = store.retrieve_or_create_dependency_id_by_tokens(["token1"])
+
+        store.reset()
+
+        assert store.retrieve_or_create_dependency_id_by_tokens(["token1"]) != dependency_id